@@ -3,14 +3,19 @@ FastAPI endpoint for Transcription-Summarization Pipeline.
 Provides REST API for frontend integration.
 """
 import os
+import json
+import asyncio
 import tempfile
 import shutil
 import uuid
+import threading
+from contextlib import asynccontextmanager
 from typing import Optional
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, File, UploadFile, Form, Header, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from starlette.background import BackgroundTask
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 from typing import List, Dict
 from dotenv import load_dotenv
@@ -19,21 +24,138 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Import pipeline components
-from app.services.pipeline import TranscribeSummaryPipeline
+from app.core.config import PROCESSING_TIERS
+from app.services.pipeline import TranscribeSummaryPipeline, load_ml_stack
+from app.services.model_pool import ModelPool
+from app.services.scheduler import Job, JobCancelled, JobScheduler, PRIORITY_CLASSES
+from app.services.jobs import FINAL_STATUSES, JobStore, new_job_id, valid_job_id
+from app.services.media import (
+    IMMUTABLE_CACHE_CONTROL, MAX_SLICE_SECONDS, PLAYBACK_FILES, MediaStore, content_etag, etag_matches
+)
+from app.services.store import MeetingStore, transcript_from_segments
+from app.services.search import SORT_ORDERS as SEARCH_SORT_ORDERS
 from app.models.meeting import MEETING_TYPES, get_meeting_types_menu
-from app.utils.export import export_transcript_to_docx, export_summary_to_docx
+from app.utils.export import (
+    export_transcript_to_docx, export_summary_to_docx, TEXT_EXPORT_FORMATS,
+    iter_srt, iter_vtt, iter_jsonl, iter_markdown_summary
+)
+from app.utils.speaker_mapping import (
+    build_speaker_pattern, remap_speaker_text, remap_segments, remap_speaker_summary
+)
+from app.services.summarizer import summarize_meeting
+from app.services.summary_cache import get_summary_cache
+from app.services.streaming import StreamingTranscriber, pcm16_to_float32, write_wav
+from app.utils.compact import compact_segments, encode_payload, payload_etag, segment_page
+from starlette.concurrency import run_in_threadpool
+
+# Brotli response compression (optional: pip install brotli-asgi; gzip otherwise)
+try:
+    from brotli_asgi import BrotliMiddleware
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+def _background_ml_import():
+    """Import torch/whisperx off the request path so the first job doesn't pay for it"""
+    try:
+        load_ml_stack()
+        print("✅ ML stack imported")
+    except Exception as e:
+        print(f"⚠️ Background ML import failed (will retry on first job): {e}")
+
+
+# Shared preloaded models (None when PRELOAD_MODELS=0: each job loads its own)
+model_pool: Optional[ModelPool] = None
+
+# GPU admission: priority classes + SJF / weighted fair queuing per API key
+scheduler = JobScheduler(
+    slots=int(os.environ.get("GPU_SLOTS", "2")),
+    policy=os.environ.get("SCHEDULER_POLICY", "wfq"),
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Server lifecycle: start background warmup, serve immediately"""
+    global model_pool
+    interrupted = get_job_store().fail_interrupted()
+    if interrupted:
+        print(f"⚠️ Marked {interrupted} job(s) interrupted by the last shutdown as failed")
+    expired = get_summary_cache().prune()
+    if expired:
+        print(f"🧹 Removed {expired} expired cached summaries")
+    if os.environ.get("PRELOAD_MODELS", "1") == "1":
+        model_pool = ModelPool()
+        threading.Thread(target=model_pool.warmup, name="model-warmup", daemon=True).start()
+    elif os.environ.get("ML_WARMUP", "1") == "1":
+        threading.Thread(target=_background_ml_import, name="ml-warmup", daemon=True).start()
+    yield
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Transcribe-Summary API",
     description="API for transcribing audio files and generating AI summaries",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # Session storage for speaker clips (maps session_id -> clip_dir path)
 # In production, use Redis or a proper session store
 clip_sessions: Dict[str, str] = {}
 
+# Session storage for processed results (maps session_id -> cached transcript/summary)
+# Used to rename speakers and re-export without touching audio or models
+result_sessions: Dict[str, dict] = {}
+
+# Persistent store of processed meetings (SQLite, MEETING_DB; created on first use)
+_meeting_store: Optional[MeetingStore] = None
+_meeting_store_lock = threading.Lock()
+
+
+def get_meeting_store() -> MeetingStore:
+    global _meeting_store
+    with _meeting_store_lock:
+        if _meeting_store is None:
+            _meeting_store = MeetingStore()
+        return _meeting_store
+
+
+# Durable job records for POST /api/jobs and disconnected synchronous requests
+_job_store: Optional[JobStore] = None
+
+# Live scheduler handles of unfinished jobs (job_id -> Job), for cancellation
+active_jobs: Dict[str, Job] = {}
+
+# What to do with a synchronous request's job when its client disconnects:
+# "keep" = finish and store the result (poll /api/jobs/{X-Job-Id}), "cancel" = stop it
+ORPHAN_POLICIES = ("keep", "cancel")
+ORPHAN_POLICY = os.environ.get("ORPHAN_POLICY", "keep")
+if ORPHAN_POLICY not in ORPHAN_POLICIES:
+    raise ValueError(f"Unknown ORPHAN_POLICY '{ORPHAN_POLICY}'. Available: {', '.join(ORPHAN_POLICIES)}")
+DISCONNECT_POLL_SECONDS = 2.0
+
+
+# Original recordings kept for playback (MEDIA_DIR; STORE_MEETING_AUDIO=0 disables)
+STORE_MEETING_AUDIO = os.environ.get("STORE_MEETING_AUDIO", "1") == "1"
+_media_store: Optional[MediaStore] = None
+
+
+def get_media_store() -> MediaStore:
+    global _media_store
+    with _meeting_store_lock:
+        if _media_store is None:
+            _media_store = MediaStore()
+        return _media_store
+
+
+def get_job_store() -> JobStore:
+    global _job_store
+    with _meeting_store_lock:
+        if _job_store is None:
+            _job_store = JobStore()
+        return _job_store
+
 # Enable CORS for frontend
 app.add_middleware(
     CORSMiddleware,
@@ -41,14 +163,27 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
+# Compress JSON / text responses (transcripts compress ~10x)
+if BROTLI_AVAILABLE:
+    app.add_middleware(BrotliMiddleware, minimum_size=1000, gzip_fallback=True)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+# Compact responses inline this many segments; the rest is paged via /api/session/{id}/segments
+COMPACT_INLINE_SEGMENTS = int(os.environ.get("COMPACT_INLINE_SEGMENTS", "200"))
+RESPONSE_FORMATS = ("full", "compact")
+
 
 # ===================== RESPONSE MODELS =====================
 
 class HealthResponse(BaseModel):
     status: str
     message: str
+    ready: bool = True
+    models: Optional[dict] = None
 
 class MeetingTypeInfo(BaseModel):
     id: int
@@ -64,11 +199,21 @@ class MeetingTypesResponse(BaseModel):
 class SpeakerSummary(BaseModel):
     speaking_time: dict
     word_count: dict
+    overlap_time: Optional[dict] = None
+    turns: Optional[dict] = None
+    interruptions: Optional[dict] = None
+    interrupted: Optional[dict] = None
+    total_overlap: Optional[float] = None
 
 class TranscriptResponse(BaseModel):
-    segments: list
-    combined_text: str
+    segments: Optional[list] = None  # Full format: raw segments (with word timings)
+    combined_text: Optional[str] = None  # Full format only (compact: join segment_columns.text)
     speaker_summary: SpeakerSummary
+    # Compact format: first page of segments as columns + where to fetch the rest
+    segment_columns: Optional[dict] = None
+    segment_count: Optional[int] = None
+    next_offset: Optional[int] = None
+    segments_url: Optional[str] = None
 
 class ProcessingTime(BaseModel):
     model_load: float
@@ -78,6 +223,8 @@ class ProcessingTime(BaseModel):
     diarization: float
     summarization: float
     total: float
+    classification: float = 0  # Meeting-type classification call (auto-detect only)
+    summary_cache_hit: bool = False  # Summary served from the summary cache (no gateway call)
 
 class SpeakerClipInfo(BaseModel):
     clip_filename: str
@@ -94,6 +241,13 @@ class TranscribeSummarizeResponse(BaseModel):
     summary: str
     speaker_clips: dict  # { "คนพูด 1": { clip_filename, start, end, duration } }
     session_id: str  # For fetching audio clips
+    alignment: Optional[dict] = None  # Align policy, decision and time saved
+    audio_url: Optional[str] = None  # Original recording (Range requests, ?start=&end= slices)
+    playback: Optional[dict] = None  # Low-bitrate proxy / seek index / waveform peaks URLs
+    scheduling: Optional[dict] = None  # Priority, estimated cost, queue wait, preemptions
+    tier: Optional[str] = None  # Processing tier the job ran with (draft / standard / accurate)
+    hallucination: Optional[dict] = None  # Flagged / re-decoded / dropped segments, seconds re-decoded
+    meeting_type_id: Optional[int] = None  # Type the summary follows (classified when 0 was requested)
 
 
 # Request models for export
@@ -113,18 +267,72 @@ class ExportSummaryRequest(BaseModel):
     speaker_summary: dict = None  # Optional: speaking_time and word_count per speaker
     meeting_type_id: int = 0  # Meeting type for position formatting
 
+class RenameSpeakersRequest(BaseModel):
+    speaker_mapping: Dict[str, str]  # { "คนพูด 1": "สมชาย (ประธาน)" }
+    resummarize: bool = False  # Re-run the summary once with real names instead of a text remap
+    force_refresh: bool = False  # With resummarize: bypass the summary cache
+
+class RenameSpeakersResponse(BaseModel):
+    success: bool
+    session_id: str
+    segments: list
+    speaker_summary: dict
+    summary: str
+    resummarized: bool
+    summary_cache_hit: bool = False
+
 
 # ===================== ENDPOINTS =====================
 
 @app.get("/api/health", response_model=HealthResponse)
-async def health_check():
-    """Health check endpoint"""
+async def health_check(response: Response):
+    """
+    Readiness check: 503 until preloaded models are warmed up
+    (always healthy when PRELOAD_MODELS=0)
+    """
+    if model_pool is None:
+        return HealthResponse(
+            status="healthy",
+            message="Transcribe-Summary API is running"
+        )
+    
+    models = model_pool.describe()
+    if not model_pool.is_ready:
+        response.status_code = 503
+        message = (f"Model warmup failed: {model_pool.error}" if model_pool.status == "failed"
+                   else "Models are loading")
+        return HealthResponse(status=model_pool.status, message=message, ready=False, models=models)
+    
+    if model_pool.status == "degraded":
+        return HealthResponse(
+            status="degraded",
+            message=f"Running without: {', '.join(model_pool.warnings)}",
+            models=models
+        )
+    
     return HealthResponse(
         status="healthy",
-        message="Transcribe-Summary API is running"
+        message="Transcribe-Summary API is running",
+        models=models
+    )
+
+
+@app.get("/api/health/live", response_model=HealthResponse)
+async def liveness_check():
+    """Liveness check: the process is up (models may still be loading)"""
+    return HealthResponse(
+        status="alive",
+        message="Transcribe-Summary API is running",
+        ready=model_pool is None or model_pool.is_ready
     )
 
 
+@app.get("/api/queue")
+async def queue_status():
+    """GPU scheduler state (policy, slots, running and waiting jobs)"""
+    return scheduler.stats()
+
+
 @app.get("/api/meeting-types", response_model=MeetingTypesResponse)
 async def get_meeting_types():
     """Get list of available meeting types"""
@@ -144,104 +352,492 @@ async def get_meeting_types():
     )
 
 
+def _transcript_response(result: dict, session_id: str, response_format: str) -> TranscriptResponse:
+    """Full transcript (raw segments + combined text) or compact first page"""
+    full = result['full_transcript']
+    speaker_summary = SpeakerSummary(**full['speaker_summary'])
+    if response_format == "full":
+        return TranscriptResponse(
+            segments=full['segments'],
+            combined_text=full['combined_text'],
+            speaker_summary=speaker_summary,
+        )
+    
+    page = segment_page(full['segments'], limit=COMPACT_INLINE_SEGMENTS)
+    return TranscriptResponse(
+        speaker_summary=speaker_summary,
+        segment_columns=compact_segments(page['segments']),
+        segment_count=page['total'],
+        next_offset=page['next_offset'],
+        segments_url=f"/api/session/{session_id}/segments",
+    )
+
+
+def _build_transcribe_response(
+    result: dict, audio_filename: str, meeting_type_id: int, response_format: str = "full",
+    audio_path: Optional[str] = None,
+) -> TranscribeSummarizeResponse:
+    """Register session caches for a pipeline result and build the API response"""
+    # Generate session ID for clip access
+    session_id = str(uuid.uuid4())
+    
+    # Keep the recording for playback (moved out of the temp dir, no copy);
+    # for video uploads that is the demuxed audio-only file
+    ingest = result.get('ingest') or {}
+    if ingest.get('demuxed'):
+        audio_path = ingest['audio_file']
+    audio_url = None
+    if audio_path and STORE_MEETING_AUDIO:
+        try:
+            get_media_store().store_original(session_id, audio_path)
+            audio_url = f"/api/meetings/{session_id}/audio"
+        except Exception as e:
+            print(f"⚠️ Failed to store meeting audio {session_id}: {e}")
+    if ingest.get('dir'):
+        shutil.rmtree(ingest['dir'], ignore_errors=True)
+    
+    playback_urls = None
+    playback = result.get('playback') or {}
+    if playback and STORE_MEETING_AUDIO:
+        try:
+            stored = get_media_store().store_playback(session_id, playback)
+            playback_urls = {
+                f"{name}_url": f"/api/meetings/{session_id}/playback/{name}" for name in stored
+            } or None
+        except Exception as e:
+            print(f"⚠️ Failed to store playback proxy {session_id}: {e}")
+    elif playback.get('dir'):
+        shutil.rmtree(playback['dir'], ignore_errors=True)  # STORE_MEETING_AUDIO=0: discard
+    clip_dir = result.get('clip_dir', '')
+    if clip_dir and os.path.exists(clip_dir):
+        clip_sessions[session_id] = clip_dir
+    
+    # Cache transcript + summary so speakers can be renamed and re-exported later
+    result_sessions[session_id] = {
+        'audio_file': audio_filename,
+        'audio_length_seconds': result['audio_length_seconds'],
+        # Auto-detect (0) stores the classified type, so filters / resummarize use it
+        'meeting_type_id': result.get('meeting_type_id') or meeting_type_id,
+        'segments': result['full_transcript']['segments'],
+        'transcript_with_speakers': result['full_transcript']['transcript_with_speakers'],
+        'speaker_summary': result['full_transcript']['speaker_summary'],
+        'summary': result['summary'],
+        'summary_model': result.get('summary_model'),  # Resummarize with the tier's model
+    }
+    
+    # Persist the meeting (session_id doubles as meeting id)
+    try:
+        get_meeting_store().save(session_id, {
+            **result_sessions[session_id],
+            'processing_time': result['processing_time'],
+        })
+    except Exception as e:
+        print(f"⚠️ Failed to store meeting {session_id}: {e}")
+    
+    # Build speaker clips response (without file paths, just filenames)
+    speaker_clips_response = {}
+    for speaker, clip_info in result.get('speaker_clips', {}).items():
+        speaker_clips_response[speaker] = {
+            "clip_filename": clip_info['clip_filename'],
+            "start": clip_info['start'],
+            "end": clip_info['end'],
+            "duration": clip_info['duration'],
+        }
+    
+    # Build response
+    return TranscribeSummarizeResponse(
+        success=True,
+        audio_file=audio_filename,
+        audio_length_seconds=result['audio_length_seconds'],
+        processing_time=ProcessingTime(
+            model_load=result['processing_time']['model_load'],
+            audio_load=result['processing_time']['audio_load'],
+            transcription=result['processing_time']['transcription'],
+            alignment=result['processing_time'].get('alignment', 0),
+            diarization=result['processing_time']['diarization'],
+            summarization=result['processing_time']['summarization'],
+            total=result['processing_time']['total'],
+            classification=result['processing_time'].get('classification', 0),
+            summary_cache_hit=result['processing_time'].get('summary_cache_hit', False),
+        ),
+        transcript=_transcript_response(result, session_id, response_format),
+        summary=result['summary'],
+        speaker_clips=speaker_clips_response,
+        session_id=session_id,
+        alignment=result.get('alignment'),
+        audio_url=audio_url,
+        playback=playback_urls,
+        scheduling=result.get('scheduling'),
+        tier=result.get('tier'),
+        hallucination=result.get('hallucination'),
+        meeting_type_id=result_sessions[session_id]['meeting_type_id'],
+    )
+
+
+ALLOWED_AUDIO_EXTENSIONS = ['.mp3', '.wav', '.m4a', '.flac', '.ogg', '.webm', '.mp4']
+
+
+def _validate_upload(audio: UploadFile, meeting_type_id: int, priority: str, response_format: str,
+                     tier: Optional[str] = None):
+    """Shared form validation for synchronous and asynchronous uploads"""
+    if meeting_type_id < 0 or meeting_type_id > 11:
+        raise HTTPException(status_code=400, detail="meeting_type_id must be between 0 and 11")
+    
+    if tier is not None and tier not in PROCESSING_TIERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"tier must be one of: {', '.join(PROCESSING_TIERS)}"
+        )
+    
+    if response_format not in RESPONSE_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"response_format must be one of: {', '.join(RESPONSE_FORMATS)}"
+        )
+    
+    if priority not in PRIORITY_CLASSES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"priority must be one of: {', '.join(PRIORITY_CLASSES)}"
+        )
+    
+    file_ext = os.path.splitext(audio.filename)[1].lower()
+    if file_ext not in ALLOWED_AUDIO_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file type. Allowed: {', '.join(ALLOWED_AUDIO_EXTENSIONS)}"
+        )
+
+
+def _start_job(audio: UploadFile, job_id: Optional[str], meeting_type_id: int, priority: str,
+               x_api_key: Optional[str]) -> tuple:
+    """Save the upload, register a durable job record and a scheduler handle"""
+    if job_id is None:
+        job_id = new_job_id()
+    elif not valid_job_id(job_id):
+        raise HTTPException(status_code=400, detail="X-Job-Id must be 16-64 URL-safe characters")
+    if not get_job_store().create(job_id, audio.filename, meeting_type_id, priority):
+        raise HTTPException(status_code=409, detail="Job id already in use")
+    
+    temp_dir = tempfile.mkdtemp()
+    temp_file = os.path.join(temp_dir, os.path.basename(audio.filename))
+    with open(temp_file, "wb") as buffer:
+        shutil.copyfileobj(audio.file, buffer)
+    
+    job = scheduler.submit(api_key=x_api_key, priority=priority)
+    active_jobs[job_id] = job
+    return job_id, job, temp_dir, temp_file
+
+
+def _run_job(job_id: str, job: Job, temp_dir: str, temp_file: str, audio_filename: str,
+             meeting_type_id: int, response_format: str, tier: Optional[str] = None,
+             force_refresh: bool = False) -> TranscribeSummarizeResponse:
+    """
+    Run the pipeline for a registered job (worker thread) and store the outcome.
+    Returns the response; re-raises failures for synchronous callers.
+    """
+    store = get_job_store()
+    store.set_status(job_id, "running")
+    try:
+        pipeline = TranscribeSummaryPipeline(model_pool=model_pool, tier=tier)
+        result = pipeline.process(temp_file, meeting_type_id=meeting_type_id, job=job, force_refresh=force_refresh)
+        response = _build_transcribe_response(
+            result, audio_filename, meeting_type_id, response_format, audio_path=temp_file
+        )
+        # Stored results are always compact: polling re-sends them every few seconds
+        stored = response
+        if response_format != "compact":
+            stored = response.model_copy(update={
+                "transcript": _transcript_response(result, response.session_id, "compact"),
+            })
+        store.set_status(job_id, "done", result=stored.model_dump())
+        return response
+    except JobCancelled:
+        print(f"🛑 Job {job_id} cancelled")
+        store.set_status(job_id, "cancelled", error="Cancelled")
+        raise
+    except Exception as e:
+        store.set_status(job_id, "failed", error=f"Processing error: {str(e)}")
+        raise
+    finally:
+        active_jobs.pop(job_id, None)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _run_job_in_background(*args):
+    try:
+        _run_job(*args)
+    except Exception:
+        pass  # Outcome is recorded in the job store
+
+
 @app.post("/api/transcribe-summarize", response_model=TranscribeSummarizeResponse)
 async def transcribe_summarize(
+    request: Request,
     audio: UploadFile = File(..., description="Audio file to transcribe"),
     meeting_type_id: int = Form(0, description="Meeting type ID (0=auto-detect, 1-11=specific type)"),
+    priority: str = Form("normal", description="Scheduling class: interactive, normal or batch"),
+    response_format: str = Form("full", description="full (raw segments) or compact (columnar, paged)"),
+    tier: Optional[str] = Form(None, description="Processing tier: draft, standard or accurate (default: server's PIPELINE_TIER)"),
+    force_refresh: bool = Form(False, description="Regenerate the summary even if an identical one is cached"),
+    x_api_key: Optional[str] = Header(None),
+    x_job_id: Optional[str] = Header(None),
 ):
     """
     Transcribe audio file and generate AI summary.
     
     - **audio**: Audio file (mp3, wav, m4a, etc.)
     - **meeting_type_id**: Meeting type for summary structure (0 = auto-detect)
+    - **priority**: Scheduling class (interactive > normal > batch)
+    - **response_format**: `full` (raw WhisperX segments) or `compact` (first page of
+      segments as columns, no word data or duplicated text; page the rest via segments_url)
+    - **tier**: `draft` (fast, no speakers), `standard` or `accurate` (model size, beam
+      search, alignment/diarization and summary model)
+    - **force_refresh**: Bypass the summary cache (identical transcripts reuse the summary)
+    - **X-API-Key** header: Fair-share key (jobs are queued fairly between keys)
+    - **X-Job-Id** header: Optional client-chosen job id (16-64 URL-safe chars). If the
+      connection drops (e.g. proxy timeout), the result can be fetched from /api/jobs/{id}
+      (ORPHAN_POLICY=keep) — prefer POST /api/jobs for long recordings
     
     Returns transcript with speaker diarization, AI-generated summary, and speaker audio clips.
     """
-    # Validate meeting type
-    if meeting_type_id < 0 or meeting_type_id > 11:
-        raise HTTPException(status_code=400, detail="meeting_type_id must be between 0 and 11")
+    _validate_upload(audio, meeting_type_id, priority, response_format, tier)
+    job_id, job, temp_dir, temp_file = await run_in_threadpool(
+        _start_job, audio, x_job_id, meeting_type_id, priority, x_api_key
+    )
     
-    # Validate file type
-    allowed_extensions = ['.mp3', '.wav', '.m4a', '.flac', '.ogg', '.webm', '.mp4']
-    file_ext = os.path.splitext(audio.filename)[1].lower()
-    if file_ext not in allowed_extensions:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported file type. Allowed: {', '.join(allowed_extensions)}"
-        )
+    # Off the event loop, so concurrent uploads can share ASR micro-batches
+    task = asyncio.ensure_future(run_in_threadpool(
+        _run_job, job_id, job, temp_dir, temp_file, audio.filename, meeting_type_id, response_format, tier,
+        force_refresh,
+    ))
     
-    # Save uploaded file to temp location
-    temp_dir = tempfile.mkdtemp()
-    temp_file = os.path.join(temp_dir, audio.filename)
+    # Watch for the client going away while the pipeline runs
+    disconnected = False
+    while not task.done():
+        await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+        if not disconnected and not task.done() and await request.is_disconnected():
+            disconnected = True
+            if ORPHAN_POLICY == "cancel":
+                print(f"🔌 Client disconnected, cancelling job {job_id}")
+                job.cancel()
+            else:
+                print(f"🔌 Client disconnected, job {job_id} keeps running (result kept for /api/jobs)")
     
     try:
-        # Write uploaded file
-        with open(temp_file, "wb") as buffer:
-            shutil.copyfileobj(audio.file, buffer)
-        
-        # Run pipeline (no speaker names — user will fill in after)
-        pipeline = TranscribeSummaryPipeline()
-        result = pipeline.process(temp_file, meeting_type_id=meeting_type_id)
-        
-        # Generate session ID for clip access
-        session_id = str(uuid.uuid4())
-        clip_dir = result.get('clip_dir', '')
-        if clip_dir and os.path.exists(clip_dir):
-            clip_sessions[session_id] = clip_dir
+        return task.result()
+    except JobCancelled:
+        raise HTTPException(status_code=409, detail="Job cancelled")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
+
+
+# ===================== JOB ENDPOINTS =====================
+
+@app.post("/api/jobs", status_code=202)
+async def submit_job(
+    audio: UploadFile = File(..., description="Audio file to transcribe"),
+    meeting_type_id: int = Form(0, description="Meeting type ID (0=auto-detect, 1-11=specific type)"),
+    priority: str = Form("normal", description="Scheduling class: interactive, normal or batch"),
+    response_format: str = Form("compact", description="Job results are stored compact (columnar, paged)"),
+    tier: Optional[str] = Form(None, description="Processing tier: draft, standard or accurate (default: server's PIPELINE_TIER)"),
+    force_refresh: bool = Form(False, description="Regenerate the summary even if an identical one is cached"),
+    x_api_key: Optional[str] = Header(None),
+    x_job_id: Optional[str] = Header(None),
+):
+    """
+    Queue a transcription job and return immediately (202).
+    
+    Same form fields as /api/transcribe-summarize. Poll `status_url` until `status` is
+    done / failed / cancelled; the job id is also the resume token, so a client can
+    keep it (e.g. localStorage) and pick the result up after a reload. The stored
+    result always carries the compact transcript; page segments via `segments_url`.
+    """
+    _validate_upload(audio, meeting_type_id, priority, response_format, tier)
+    job_id, job, temp_dir, temp_file = await run_in_threadpool(
+        _start_job, audio, x_job_id, meeting_type_id, priority, x_api_key
+    )
+    threading.Thread(
+        target=_run_job_in_background,
+        args=(job_id, job, temp_dir, temp_file, audio.filename, meeting_type_id, response_format, tier,
+              force_refresh),
+        name=f"job-{job_id[:8]}",
+        daemon=True,
+    ).start()
+    return {"job_id": job_id, "status": "queued", "status_url": f"/api/jobs/{job_id}"}
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Job status; includes the transcribe-summarize response (compact transcript) once done.
+    Unfinished jobs also report their scheduler state (queue wait, preemptions).
+    """
+    record = await run_in_threadpool(get_job_store().get, job_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    job = active_jobs.get(job_id)
+    if job is not None and record['status'] not in FINAL_STATUSES:
+        record['scheduling'] = {**job.describe(), 'gpu': 'running' if job.running else 'waiting'}
+    return record
+
+
+@app.delete("/api/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """Cancel a queued or running job (stops at the next stage boundary)"""
+    job = active_jobs.get(job_id)
+    if job is None:
+        if get_job_store().get(job_id, include_result=False) is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return {"success": False, "message": "Job already finished"}
+    job.cancel()
+    return {"success": True, "message": "Cancellation requested"}
+
+
+# ===================== STREAMING ENDPOINTS =====================
+
+@app.websocket("/api/transcribe-stream")
+async def transcribe_stream(websocket: WebSocket, meeting_type_id: int = 0, sample_rate: int = 16000):
+    """
+    Live transcription over WebSocket.
+    
+    Protocol:
+    - Client sends binary frames of 16-bit little-endian mono PCM at `sample_rate`
+    - Server sends `{"type": "partial"|"final", "start", "end", "text"}` while audio arrives
+    - Client sends `{"type": "stop"}` (or closes) to finish; the full pipeline
+      (alignment, diarization, summary) then runs on the recording and the server
+      sends `{"type": "result", "result": <TranscribeSummarizeResponse>}`
+    """
+    if sample_rate <= 0:
+        await websocket.close(code=1008, reason="sample_rate must be positive")
+        return
+    await websocket.accept()
+    if meeting_type_id < 0 or meeting_type_id > 11:
+        await websocket.send_json({"type": "error", "detail": "meeting_type_id must be between 0 and 11"})
+        await websocket.close(code=1008)
+        return
+    
+    pipeline = TranscribeSummaryPipeline(model_pool=model_pool)
+    streamer = StreamingTranscriber(transcribe_fn=pipeline.transcribe_window)
+    client_connected = True
+    pending = b""  # Odd trailing byte of a frame (a sample split across frames)
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                client_connected = False
+                break
+            if message.get("bytes"):
+                data = pending + message["bytes"]
+                whole = len(data) - len(data) % 2
+                pending = data[whole:]
+                samples = pcm16_to_float32(data[:whole], sample_rate)
+                events = await run_in_threadpool(streamer.feed, samples)
+            elif message.get("text") and json.loads(message["text"]).get("type") == "stop":
+                break
+            else:
+                continue
+            for event in events:
+                await websocket.send_json(event)
         
-        # Build speaker clips response (without file paths, just filenames)
-        speaker_clips_response = {}
-        for speaker, clip_info in result.get('speaker_clips', {}).items():
-            speaker_clips_response[speaker] = {
-                "clip_filename": clip_info['clip_filename'],
-                "start": clip_info['start'],
-                "end": clip_info['end'],
-                "duration": clip_info['duration'],
-            }
+        for event in await run_in_threadpool(streamer.flush):
+            if client_connected:
+                await websocket.send_json(event)
         
-        # Build response
-        return TranscribeSummarizeResponse(
-            success=True,
-            audio_file=audio.filename,
-            audio_length_seconds=result['audio_length_seconds'],
-            processing_time=ProcessingTime(
-                model_load=result['processing_time']['model_load'],
-                audio_load=result['processing_time']['audio_load'],
-                transcription=result['processing_time']['transcription'],
-                alignment=result['processing_time'].get('alignment', 0),
-                diarization=result['processing_time']['diarization'],
-                summarization=result['processing_time']['summarization'],
-                total=result['processing_time']['total']
-            ),
-            transcript=TranscriptResponse(
-                segments=result['full_transcript']['segments'],
-                combined_text=result['full_transcript']['combined_text'],
-                speaker_summary=SpeakerSummary(
-                    speaking_time=result['full_transcript']['speaker_summary']['speaking_time'],
-                    word_count=result['full_transcript']['speaker_summary']['word_count']
-                )
-            ),
-            summary=result['summary'],
-            speaker_clips=speaker_clips_response,
-            session_id=session_id,
-        )
+        if not client_connected or streamer.total_samples == 0:
+            return
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
+        # Finalize: run the full pipeline on the recorded stream
+        await websocket.send_json({"type": "processing"})
+        temp_dir = tempfile.mkdtemp()
+        try:
+            # File writes, media move/hash and the SQLite save stay off the event loop
+            wav_path = await run_in_threadpool(
+                write_wav, os.path.join(temp_dir, "live_recording.wav"), streamer.audio
+            )
+            job = scheduler.submit(api_key=websocket.headers.get("x-api-key"), priority="interactive")
+            result = await run_in_threadpool(pipeline.process, wav_path, meeting_type_id=meeting_type_id, job=job)
+            response = await run_in_threadpool(
+                _build_transcribe_response, result, "live_recording.wav", meeting_type_id, audio_path=wav_path
+            )
+            await websocket.send_json({"type": "result", "result": response.model_dump()})
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        await websocket.close()
     
-    finally:
-        # Cleanup temp files
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        await websocket.send_json({"type": "error", "detail": f"Processing error: {str(e)}"})
+        await websocket.close(code=1011)
 
 
 # ===================== EXPORT ENDPOINTS =====================
 
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Extra Accept header spellings seen in the wild for the text export formats
+EXPORT_MEDIA_ALIASES = {
+    "text/srt": "srt",
+    "application/srt": "srt",
+    "application/jsonl": "jsonl",
+    "application/json-lines": "jsonl",
+    "text/x-markdown": "markdown",
+}
+
+
+def _negotiate_export_format(accept: Optional[str], allowed: List[str]) -> str:
+    """Pick the export format with the highest q-value in the Accept header ('docx' if none match)"""
+    media_to_format = {DOCX_MEDIA_TYPE: "docx"}
+    media_to_format.update({TEXT_EXPORT_FORMATS[fmt]['media_type']: fmt for fmt in allowed if fmt != "docx"})
+    media_to_format.update({media: fmt for media, fmt in EXPORT_MEDIA_ALIASES.items() if fmt in allowed})
+    
+    best_format, best_q = "docx", 0.0
+    for part in (accept or "").split(","):
+        media, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        fmt = media_to_format.get(media.strip().lower())
+        if fmt and q > best_q:
+            best_format, best_q = fmt, q
+    return best_format
+
+
+def _text_export_response(chunks, fmt: str, basename: str) -> StreamingResponse:
+    """Stream a text export as a file download"""
+    info = TEXT_EXPORT_FORMATS[fmt]
+    return StreamingResponse(
+        (chunk.encode("utf-8") for chunk in chunks),
+        media_type=f"{info['media_type']}; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{basename}.{info["extension"]}"'},
+    )
+
+
+def _transcript_segments(request: ExportTranscriptRequest):
+    """Lazily convert request segments to dicts for the streaming exporters"""
+    return (seg.model_dump() for seg in request.segments)
+
+
 @app.post("/api/export/transcript")
-async def export_transcript(request: ExportTranscriptRequest):
+async def export_transcript(request: ExportTranscriptRequest, accept: Optional[str] = Header(None)):
     """
     Export transcript segments to DOCX file.
+    
+    Content negotiation via the Accept header:
+    `text/vtt`, `application/x-subrip` or `application/x-ndjson` return WebVTT, SRT or JSON Lines.
     """
+    fmt = _negotiate_export_format(accept, ["docx", "srt", "vtt", "jsonl"])
+    if fmt != "docx":
+        exporter = {"srt": iter_srt, "vtt": iter_vtt, "jsonl": iter_jsonl}[fmt]
+        return _text_export_response(exporter(_transcript_segments(request)), fmt, "transcript")
+    
     temp_dir = tempfile.mkdtemp()
     output_path = os.path.join(temp_dir, "transcript.docx")
     
@@ -260,7 +856,7 @@ async def export_transcript(request: ExportTranscriptRequest):
         return FileResponse(
             path=output_path,
             filename="transcript.docx",
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            media_type=DOCX_MEDIA_TYPE,
             background=BackgroundTask(shutil.rmtree, temp_dir, ignore_errors=True)
         )
     except Exception as e:
@@ -270,10 +866,15 @@ async def export_transcript(request: ExportTranscriptRequest):
 
 
 @app.post("/api/export/summary")
-async def export_summary(request: ExportSummaryRequest):
+async def export_summary(request: ExportSummaryRequest, accept: Optional[str] = Header(None)):
     """
-    Export summary text to DOCX file.0
+    Export summary text to DOCX file.
+    
+    Send `Accept: text/markdown` to get a Markdown document instead.
     """
+    if _negotiate_export_format(accept, ["docx", "markdown"]) == "markdown":
+        return await export_markdown(request)
+    
     temp_dir = tempfile.mkdtemp()
     output_path = os.path.join(temp_dir, "summary.docx")
     
@@ -289,7 +890,7 @@ async def export_summary(request: ExportSummaryRequest):
         return FileResponse(
             path=output_path,
             filename="summary.docx",
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            media_type=DOCX_MEDIA_TYPE,
             background=BackgroundTask(shutil.rmtree, temp_dir, ignore_errors=True)
         )
     except Exception as e:
@@ -298,10 +899,308 @@ async def export_summary(request: ExportSummaryRequest):
         raise HTTPException(status_code=500, detail=f"Export error: {str(e)}")
 
 
+@app.post("/api/export/srt")
+async def export_srt(request: ExportTranscriptRequest):
+    """Export transcript segments as SRT subtitles."""
+    return _text_export_response(iter_srt(_transcript_segments(request)), "srt", "transcript")
+
+
+@app.post("/api/export/vtt")
+async def export_vtt(request: ExportTranscriptRequest):
+    """Export transcript segments as WebVTT subtitles (speakers as voice tags)."""
+    return _text_export_response(iter_vtt(_transcript_segments(request)), "vtt", "transcript")
+
+
+@app.post("/api/export/jsonl")
+async def export_jsonl(request: ExportTranscriptRequest):
+    """Export transcript segments as JSON Lines (one segment per line)."""
+    return _text_export_response(iter_jsonl(_transcript_segments(request)), "jsonl", "transcript")
+
+
+@app.post("/api/export/markdown")
+async def export_markdown(request: ExportSummaryRequest):
+    """Export summary text (with participant table) as Markdown."""
+    chunks = iter_markdown_summary(request.summary, request.speaker_summary, request.meeting_type_id)
+    return _text_export_response(chunks, "markdown", "summary")
+
+
+# ===================== SESSION ENDPOINTS =====================
+
+def _get_result_session(session_id: str) -> dict:
+    """Look up a cached result (falling back to the meeting store) or raise 404"""
+    cached = result_sessions.get(session_id)
+    if cached:
+        return cached
+    
+    stored = get_meeting_store().get(session_id)
+    if not stored:
+        raise HTTPException(status_code=404, detail="Session not found or expired")
+    cached = {
+        'audio_file': stored['audio_file'],
+        'audio_length_seconds': stored['audio_length_seconds'],
+        'meeting_type_id': stored['meeting_type_id'],
+        'segments': stored['segments'],
+        'transcript_with_speakers': transcript_from_segments(stored['segments']),
+        'speaker_summary': stored['speaker_summary'],
+        'summary': stored['summary'],
+    }
+    result_sessions[session_id] = cached
+    return cached
+
+
+@app.get("/api/session/{session_id}/segments")
+async def get_session_segments(
+    session_id: str,
+    offset: int = 0,
+    limit: int = 500,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    words: bool = False,
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Page through a session's (possibly renamed) segments in compact columnar form.
+    
+    - **offset** / **limit**: Pagination (limit ≤ 2000); follow `next_offset` until null
+    - **start** / **end**: Only segments overlapping this time range (seconds)
+    - **words**: Include word-level timings (only while the session is cached in memory)
+    
+    Responses carry an ETag; send it back as If-None-Match to get 304 Not Modified.
+    """
+    if limit < 1 or limit > 2000 or offset < 0:
+        raise HTTPException(status_code=400, detail="limit must be 1-2000 and offset ≥ 0")
+    cached = await run_in_threadpool(_get_result_session, session_id)
+    page = segment_page(cached['segments'], offset, limit, start, end)
+    body = encode_payload({
+        "session_id": session_id,
+        "total": page['total'],
+        "offset": page['offset'],
+        "limit": page['limit'],
+        "next_offset": page['next_offset'],
+        "segments": compact_segments(page['segments'], include_words=words),
+    })
+    
+    etag = payload_etag(body)
+    # Renames change the content (and so the ETag): clients must revalidate
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@app.post("/api/session/{session_id}/speakers", response_model=RenameSpeakersResponse)
+async def rename_speakers(session_id: str, request: RenameSpeakersRequest):
+    """
+    Rename speakers in a cached session result.
+    
+    - **speaker_mapping**: Current label -> real name (e.g. "คนพูด 1" -> "สมชาย")
+    - **resummarize**: Re-run the summary once with real names (default: cheap text remap)
+    - **force_refresh**: With resummarize, ignore a cached summary for the same input
+    
+    The cached transcript and summary are updated, so later exports use the new names.
+    """
+    cached = await run_in_threadpool(_get_result_session, session_id)
+    mapping = {label: name.strip() for label, name in request.speaker_mapping.items() if name and name.strip()}
+    pattern = build_speaker_pattern(mapping)
+    
+    segments = remap_segments(cached['segments'], mapping)
+    speaker_summary = remap_speaker_summary(cached['speaker_summary'], mapping)
+    transcript_with_speakers = remap_speaker_text(cached['transcript_with_speakers'], mapping, pattern)
+    
+    summary_cache_hit = False
+    if request.resummarize:
+        # Same summary model as the original run (stored meetings: summarizer default)
+        model_option = {'model': cached['summary_model']} if cached.get('summary_model') else {}
+        summary, summary_info = await run_in_threadpool(
+            summarize_meeting,
+            transcript_with_speakers,
+            speaker_summary,
+            meeting_type_id=cached['meeting_type_id'],
+            force_refresh=request.force_refresh,
+            **model_option,
+        )
+        summary_cache_hit = summary_info['cache_hit']
+        if summary.startswith("Error"):
+            raise HTTPException(status_code=502, detail=summary)
+    else:
+        summary = remap_speaker_text(cached['summary'], mapping, pattern)
+    
+    cached.update({
+        'segments': segments,
+        'speaker_summary': speaker_summary,
+        'transcript_with_speakers': transcript_with_speakers,
+        'summary': summary,
+    })
+    await run_in_threadpool(
+        get_meeting_store().update,
+        session_id, segments=segments, speaker_summary=speaker_summary, summary=summary,
+    )
+    
+    return RenameSpeakersResponse(
+        success=True,
+        session_id=session_id,
+        segments=segments,
+        speaker_summary=speaker_summary,
+        summary=summary,
+        resummarized=request.resummarize,
+        summary_cache_hit=summary_cache_hit,
+    )
+
+
+@app.get("/api/session/{session_id}/export/transcript")
+async def export_session_transcript(session_id: str, accept: Optional[str] = Header(None)):
+    """
+    Export the cached (possibly renamed) transcript of a session.
+    DOCX by default; same Accept negotiation as /api/export/transcript.
+    """
+    cached = await run_in_threadpool(_get_result_session, session_id)
+    return await export_transcript(ExportTranscriptRequest(
+        segments=cached['segments'],
+        audio_file=cached['audio_file'],
+        audio_length_seconds=cached['audio_length_seconds'],
+    ), accept=accept)
+
+
+@app.get("/api/session/{session_id}/export/summary")
+async def export_session_summary(session_id: str, accept: Optional[str] = Header(None)):
+    """
+    Export the cached (possibly renamed) summary of a session.
+    DOCX by default; `Accept: text/markdown` for Markdown.
+    """
+    cached = await run_in_threadpool(_get_result_session, session_id)
+    return await export_summary(ExportSummaryRequest(
+        summary=cached['summary'],
+        speaker_summary=cached['speaker_summary'],
+        meeting_type_id=cached['meeting_type_id'],
+    ), accept=accept)
+
+
+# ===================== MEETING HISTORY ENDPOINTS =====================
+
+@app.get("/api/meetings")
+async def list_meetings(limit: int = 50, offset: int = 0, meeting_type_id: Optional[int] = None):
+    """
+    List stored meetings, newest first (without transcripts).
+    
+    - **limit** / **offset**: Pagination (limit ≤ 200)
+    - **meeting_type_id**: Only meetings of this type
+    """
+    if limit < 1 or limit > 200 or offset < 0:
+        raise HTTPException(status_code=400, detail="limit must be 1-200 and offset ≥ 0")
+    return await run_in_threadpool(get_meeting_store().list, limit, offset, meeting_type_id)
+
+
+@app.get("/api/meetings/{meeting_id}")
+async def get_meeting(meeting_id: str, include_segments: bool = True):
+    """
+    Get a stored meeting: summary, speaker summary, timings and (optionally) segments.
+    The meeting id is also a session id: rename/export endpoints work on past meetings.
+    """
+    meeting = await run_in_threadpool(get_meeting_store().get, meeting_id, include_segments)
+    if meeting is None:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    return meeting
+
+
+@app.get("/api/search")
+async def search_transcripts(
+    q: str,
+    limit: int = 20,
+    offset: int = 0,
+    speaker: Optional[str] = None,
+    meeting_type_id: Optional[int] = None,
+    sort: str = "recent",
+):
+    """
+    Full-text search over all stored transcripts (Thai-aware).
+    
+    - **q**: Words or phrase (Thai matched as a contiguous substring)
+    - **speaker** / **meeting_type_id**: Optional filters
+    - **sort**: `recent` (newest first, default) or `relevance` (BM25)
+    
+    Returns matching segments with meeting id, speaker and timestamps, best first.
+    """
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="q must not be empty")
+    if limit < 1 or limit > 200 or offset < 0:
+        raise HTTPException(status_code=400, detail="limit must be 1-200 and offset ≥ 0")
+    if sort not in SEARCH_SORT_ORDERS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(SEARCH_SORT_ORDERS)}")
+    hits = await run_in_threadpool(get_meeting_store().search, q, limit, offset, speaker, meeting_type_id, sort)
+    return {"query": q, "hits": hits}
+
+
+@app.delete("/api/meetings/{meeting_id}")
+async def delete_meeting(meeting_id: str):
+    """Delete a stored meeting permanently"""
+    if not await run_in_threadpool(get_meeting_store().delete, meeting_id):
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    result_sessions.pop(meeting_id, None)
+    await run_in_threadpool(get_media_store().delete, meeting_id)
+    return {"success": True, "message": "Meeting deleted"}
+
+
+@app.get("/api/meetings/{meeting_id}/audio")
+async def get_meeting_audio(
+    meeting_id: str,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Play back a meeting's original recording.
+    
+    - Without parameters: the whole file, with HTTP Range support for seeking
+    - **start** / **end**: Only this time range (seconds, ≤ 10 min) as MP3; only the
+      requested span is decoded, and slices are cached
+    
+    Stored media never changes: responses carry a content-hash ETag and an immutable
+    Cache-Control, and If-None-Match revalidation returns 304.
+    """
+    media = get_media_store()
+    try:
+        if start is None and end is None:
+            path = media.original_path(meeting_id)
+        else:
+            start = start or 0.0
+            if start < 0 or end is None or end <= start or end - start > MAX_SLICE_SECONDS:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Need 0 ≤ start < end with end - start ≤ {MAX_SLICE_SECONDS:.0f}s"
+                )
+            path = await run_in_threadpool(media.slice, meeting_id, start, end)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid meeting id")
+    if path is None:
+        raise HTTPException(status_code=404, detail="Meeting audio not found")
+    return await run_in_threadpool(_media_file_response, path, if_none_match)
+
+
+@app.get("/api/meetings/{meeting_id}/playback/{name}")
+async def get_meeting_playback(meeting_id: str, name: str, if_none_match: Optional[str] = Header(None)):
+    """
+    Playback artifacts made during processing (immutable, content-hash ETag):
+    
+    - **proxy**: Low-bitrate mono Opus (Ogg) of the whole meeting, HTTP Range seekable
+    - **seek_index**: `{"interval", "entries": [[seconds, byte_offset], ...]}` into the proxy
+    - **peaks**: Waveform min/max peaks (audiowaveform JSON, 8-bit)
+    """
+    if name not in PLAYBACK_FILES:
+        raise HTTPException(status_code=404, detail=f"Unknown playback file. Available: {', '.join(PLAYBACK_FILES)}")
+    try:
+        path = get_media_store().playback_path(meeting_id, name)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid meeting id")
+    if path is None:
+        raise HTTPException(status_code=404, detail="Playback file not found")
+    media_type = "application/json" if path.endswith(".json") else None
+    return await run_in_threadpool(_media_file_response, path, if_none_match, media_type)
+
+
 # ===================== SPEAKER CLIP ENDPOINTS =====================
 
 @app.get("/api/speaker-clip/{session_id}/{filename}")
-async def get_speaker_clip(session_id: str, filename: str):
+async def get_speaker_clip(session_id: str, filename: str, if_none_match: Optional[str] = Header(None)):
     """
     Serve a speaker audio clip file.
     
@@ -321,10 +1220,26 @@ async def get_speaker_clip(session_id: str, filename: str):
     if not os.path.exists(clip_path):
         raise HTTPException(status_code=404, detail="Clip not found")
     
+    return await run_in_threadpool(_media_file_response, clip_path, if_none_match, "audio/mpeg", filename)
+
+
+def _media_file_response(path: str, if_none_match: Optional[str], media_type: str = None,
+                         filename: str = None) -> Response:
+    """
+    Immutable media file: content-hash ETag (also used by If-Range), long-lived cache,
+    304 on revalidation. FileResponse handles Range requests and sends the file with
+    the server's pathsend extension where available.
+    """
+    etag = content_etag(path)
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
     return FileResponse(
-        path=clip_path,
-        media_type="audio/mpeg",
-        filename=filename
+        path=path,
+        media_type=media_type,
+        filename=filename,
+        headers=headers,
+        content_disposition_type="inline",
     )
 
 
@@ -334,6 +1249,7 @@ async def cleanup_session(session_id: str):
     Cleanup speaker clips for a session.
     Call this when the user is done with the results.
     """
+    result_sessions.pop(session_id, None)
     clip_dir = clip_sessions.pop(session_id, None)
     if clip_dir and os.path.exists(clip_dir):
         shutil.rmtree(clip_dir, ignore_errors=True)
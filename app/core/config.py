@@ -1,31 +1,240 @@
+import copy
 import os
+import json
+
+from .hardware import probe_hardware, select_profile
+
+# Hardware profiles (select with PIPELINE_PROFILE, default "auto" = probe at startup)
+PIPELINE_PROFILES = {
+    "cpu-int8": {           # CPU-only nodes
+        "DEVICE": "cpu",
+        "COMPUTE_TYPE": "int8",
+        "BATCH_SIZE": 4,
+    },
+    "cuda-int8": {          # Small GPUs (< 12 GB)
+        "DEVICE": "cuda",
+        "COMPUTE_TYPE": "int8_float16",
+        "BATCH_SIZE": 8,
+    },
+    "cuda-fp16": {          # A100 40GB / RTX 3090 class
+        "DEVICE": "cuda",
+        "COMPUTE_TYPE": "float16",
+        "BATCH_SIZE": 24,
+    },
+    "cuda-large": {         # 80 GB accelerators
+        "DEVICE": "cuda",
+        "COMPUTE_TYPE": "float16",
+        "BATCH_SIZE": 48,
+    },
+}
+
+# Quality/speed tiers (select per request, default PIPELINE_TIER or "accurate").
+# Applied on top of the hardware profile; explicit settings (file, env, overrides) win.
+PROCESSING_TIERS = {
+    "draft": {              # Quick look: small model, greedy decoding, no speakers
+        "MODEL_NAME": "medium",
+        "BEAM_SIZE": 1,
+        "BEST_OF": 1,
+        "PATIENCE": 1.0,
+        "MAX_TEMPERATURE": 0.0,
+        "ALIGN_POLICY": "never",
+        "DIARIZE": False,
+        "SUMMARY_MODEL": "gpt-4.1-mini",
+    },
+    "standard": {           # Distilled large decoder, short beam, speakers
+        "MODEL_NAME": "large-v3-turbo",
+        "BEAM_SIZE": 2,
+        "BEST_OF": 2,
+        "PATIENCE": 1.0,
+        "MAX_TEMPERATURE": 0.4,
+        "ALIGN_POLICY": "multi-speaker",
+        "DIARIZE": True,
+        "SUMMARY_MODEL": "gpt-4.1",
+    },
+    "accurate": {           # Maximum accuracy (previous fixed behaviour)
+        "MODEL_NAME": "large-v3",
+        "BEAM_SIZE": 5,
+        "BEST_OF": 5,
+        "PATIENCE": 1.5,
+        "MAX_TEMPERATURE": 1.0,
+        "ALIGN_POLICY": "multi-speaker",
+        "DIARIZE": True,
+        "SUMMARY_MODEL": "gpt-4.1",
+    },
+}
+DEFAULT_TIER = "accurate"
+
+
+def _check_tier(tier: str):
+    if tier not in PROCESSING_TIERS:
+        raise ValueError(f"Unknown processing tier '{tier}'. Available: {', '.join(PROCESSING_TIERS)}")
+
+
+_TRUE_VALUES = ("1", "true", "yes", "on")
+_FALSE_VALUES = ("0", "false", "no", "off")
+
+
+def _coerce(name: str, value: str, default):
+    """Convert an environment/file string to the type of the default value"""
+    text = str(value).strip().lower()
+    if default is None and text in ("", "none", "null"):  # Only optional settings can be unset
+        return None
+    if isinstance(default, bool):
+        if text in _TRUE_VALUES or text in _FALSE_VALUES:
+            return text in _TRUE_VALUES
+        raise ValueError(f"Invalid bool for {name}: {value!r}")
+    if isinstance(default, int) or default is None:  # None defaults are optional ints (MIN_SPEAKERS)
+        convert = int
+    elif isinstance(default, float):
+        convert = float
+    else:
+        return value
+    try:
+        return convert(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {convert.__name__} for {name}: {value!r}") from None
+
 
 class PipelineConfig:
-    """Configuration for the transcription-summary pipeline"""
-    
+    """
+    Configuration for the transcription-summary pipeline
+
+    Values are resolved in order (later wins):
+    class defaults → profile (PIPELINE_PROFILE, "auto" probes the hardware)
+    → tier (PIPELINE_TIER) → JSON file (PIPELINE_CONFIG_FILE) → PIPELINE_<SETTING>
+    env vars → keyword overrides.
+    """
+
     # Device settings
     DEVICE = "cuda"
     COMPUTE_TYPE = "float16"
-    
-    # WhisperX settings
+    CPU_THREADS = 4
+
+    # ASR settings
+    ASR_BACKEND = "whisperx"    # "whisperx" | "faster-whisper" (CPU int8) | "fake" (tests)
     MODEL_NAME = "large-v3"
     BATCH_SIZE = 24
     LANGUAGE = "th"
+    INITIAL_PROMPT = "สวัสดีครับ นี่คือการถอดเสียงภาษาไทย"  # Decoder priming text ("" = none)
+
+    # Cross-request micro-batching (shared model only): recordings up to
+    # MICROBATCH_MAX_AUDIO seconds have their chunks decoded together with other jobs'
+    MICROBATCH_MAX_AUDIO = 120.0    # 0 = disabled
+    MICROBATCH_WAIT = 0.05          # Max seconds to wait for a batch to fill
     
     # Beam search settings
     BEAM_SIZE = 5
     BEST_OF = 5
     PATIENCE = 1.5
-    
+    MAX_TEMPERATURE = 1.0   # Temperature fallback ceiling for hard segments (0 = no fallback)
+
+    # Post-ASR hallucination filter: segments over a threshold are re-decoded once with
+    # loop-breaking options, and dropped if still flagged
+    HALLUCINATION_FILTER = True
+    HALLUCINATION_REPETITION = 0.5      # Share of repeated word 3-grams
+    HALLUCINATION_COMPRESSION = 2.4     # Text compression ratio
+    HALLUCINATION_LOGPROB = -1.0        # avg_logprob floor (backends that report it)
+
     # VAD options (tuned for meeting audio with multiple speakers)
     VAD_ONSET = 0.500       # Speech start threshold (higher = less false positives)
     VAD_OFFSET = 0.363      # Speech end threshold
     MIN_DURATION_ON = 0.10  # Min speech duration (filter out clicks/noise)
     MIN_DURATION_OFF = 0.10 # Min silence to split segments (avoid over-splitting)
+
+    # Word-level alignment: "always" | "never" | "multi-speaker" (skip for single-speaker audio)
+    ALIGN_POLICY = "multi-speaker"
+    
+    # Playback proxy encoded from the decoded waveform (mono Opus, seek index, waveform peaks)
+    PLAYBACK_PROXY = True
+    PLAYBACK_BITRATE = "24k"
+    PEAKS_PER_SECOND = 20
     
     # Speaker diarization settings
+    DIARIZE = True          # False = single unlabeled speaker, no pyannote pass
     MIN_SPEAKERS = None     # None = auto-detect (let pyannote decide)
     MAX_SPEAKERS = None     # None = auto-detect
-    
+
+    # Summary LLM (NTC AI Gateway model name)
+    SUMMARY_MODEL = "gpt-4.1"
+
     # HuggingFace token for diarization
     HF_TOKEN = os.environ.get("HF_TOKEN", "")
+
+    def __init__(self, profile: str = None, tier: str = None, **overrides):
+        self.PROFILE = profile or os.environ.get("PIPELINE_PROFILE", "auto")
+        self.TIER = tier or os.environ.get("PIPELINE_TIER", DEFAULT_TIER)
+
+        settings = {}
+        config_file = os.environ.get("PIPELINE_CONFIG_FILE")
+        file_settings = {}
+        if config_file:
+            with open(config_file, encoding="utf-8") as f:
+                file_settings = {key.upper(): value for key, value in json.load(f).items()}
+            file_profile = file_settings.pop("PROFILE", None)
+            if file_profile and not profile:
+                self.PROFILE = file_profile
+            file_tier = file_settings.pop("TIER", None)
+            if file_tier and not tier:
+                self.TIER = file_tier
+
+        if self.PROFILE == "auto":
+            detected = select_profile(probe_hardware())
+            self.PROFILE = detected.pop("profile")
+            settings.update(PIPELINE_PROFILES[self.PROFILE])
+            settings.update(detected)
+        elif self.PROFILE in PIPELINE_PROFILES:
+            settings.update(PIPELINE_PROFILES[self.PROFILE])
+        else:
+            raise ValueError(
+                f"Unknown pipeline profile '{self.PROFILE}'. "
+                f"Available: auto, {', '.join(PIPELINE_PROFILES)}"
+            )
+
+        _check_tier(self.TIER)
+        settings.update(PROCESSING_TIERS[self.TIER])
+
+        explicit = dict(file_settings)
+
+        for name in self.setting_names():
+            env_value = os.environ.get(f"PIPELINE_{name}")
+            if env_value is not None:
+                explicit[name] = _coerce(f"PIPELINE_{name}", env_value, getattr(type(self), name))
+
+        explicit.update({key.upper(): value for key, value in overrides.items()})
+        settings.update(explicit)
+        self._explicit = set(explicit)
+
+        for name, value in settings.items():
+            if name not in self.setting_names():
+                raise ValueError(f"Unknown pipeline setting '{name}'")
+            setattr(self, name, value)
+
+    def for_tier(self, tier: str) -> "PipelineConfig":
+        """
+        Copy with another processing tier (no hardware re-probe); settings given
+        explicitly (file, env, overrides) keep their values.
+        """
+        _check_tier(tier)
+        config = copy.copy(self)
+        config.TIER = tier
+        for name, value in PROCESSING_TIERS[tier].items():
+            if name not in self._explicit:
+                setattr(config, name, value)
+        return config
+
+    @classmethod
+    def setting_names(cls) -> list:
+        """All configurable (upper-case) settings"""
+        return [name for name in vars(cls) if name.isupper()]
+
+    def describe(self) -> dict:
+        """Resolved hardware-related settings (for logs and API output)"""
+        return {
+            'profile': self.PROFILE,
+            'tier': self.TIER,
+            'asr_backend': self.ASR_BACKEND,
+            'device': self.DEVICE,
+            'compute_type': self.COMPUTE_TYPE,
+            'batch_size': self.BATCH_SIZE,
+            'model': self.MODEL_NAME,
+        }
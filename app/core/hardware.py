@@ -0,0 +1,107 @@
+"""
+Hardware probe for picking a pipeline profile at startup.
+Detects accelerators, CPU cores and memory without requiring torch to be installed.
+"""
+import os
+from functools import lru_cache
+from typing import Any, Dict
+
+# Rough VRAM budget for large-v3 batched inference (weights + per-item activations)
+# (a 40 GB A100 reports ~39.6 GiB → float16, batch 24)
+MODEL_VRAM_GB = {"float16": 5.5, "int8_float16": 4.0, "int8": 3.0}
+VRAM_PER_BATCH_ITEM_GB = 1.4
+MAX_BATCH_SIZE = 48
+
+
+@lru_cache(maxsize=1)
+def probe_hardware() -> Dict[str, Any]:
+    """
+    Detect available compute once per process.
+
+    Returns:
+        {
+            "cuda_available": bool,
+            "gpu_name": str | None,
+            "gpu_memory_gb": float,   # Total memory of device 0
+            "gpu_count": int,
+            "cpu_cores": int,         # Cores usable by this process (cgroup/affinity aware)
+            "memory_gb": float,       # Physical RAM
+        }
+    """
+    info = {
+        "cuda_available": False,
+        "gpu_name": None,
+        "gpu_memory_gb": 0.0,
+        "gpu_count": 0,
+        "cpu_cores": _cpu_cores(),
+        "memory_gb": _memory_gb(),
+    }
+
+    try:
+        import torch
+        if torch.cuda.is_available():
+            props = torch.cuda.get_device_properties(0)
+            info.update({
+                "cuda_available": True,
+                "gpu_name": props.name,
+                "gpu_memory_gb": props.total_memory / 1024 ** 3,
+                "gpu_count": torch.cuda.device_count(),
+            })
+    except Exception:
+        # No torch / broken driver: fall back to CPU
+        pass
+
+    return info
+
+
+def _cpu_cores() -> int:
+    """Cores this process may run on"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+
+def _memory_gb() -> float:
+    """Total physical memory in GB (0 if unknown)"""
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 1024 ** 3
+    except (AttributeError, ValueError, OSError):
+        return 0.0
+
+
+def select_profile(info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Choose profile name, compute type and batch size for the probed hardware.
+
+    Returns {"profile": str, "COMPUTE_TYPE": str, "BATCH_SIZE": int, "CPU_THREADS": int}
+    """
+    cores = info["cpu_cores"]
+
+    if not info["cuda_available"]:
+        # CTranslate2 int8 on CPU: batching helps little beyond a few items per 4 cores
+        return {
+            "profile": "cpu-int8",
+            "COMPUTE_TYPE": "int8",
+            "BATCH_SIZE": max(1, min(8, cores // 4)),
+            "CPU_THREADS": cores,
+        }
+
+    memory = info["gpu_memory_gb"]
+    compute_type = "float16" if memory >= 12 else "int8_float16"
+    batch_size = int((memory - MODEL_VRAM_GB[compute_type]) / VRAM_PER_BATCH_ITEM_GB)
+    batch_size = max(1, min(MAX_BATCH_SIZE, batch_size))
+
+    if memory >= 60:
+        profile = "cuda-large"
+    elif compute_type == "float16":
+        profile = "cuda-fp16"
+    else:
+        profile = "cuda-int8"
+
+    return {
+        "profile": profile,
+        "COMPUTE_TYPE": compute_type,
+        "BATCH_SIZE": batch_size,
+        "CPU_THREADS": min(cores, 8),
+    }
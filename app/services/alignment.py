@@ -0,0 +1,146 @@
+"""
+Word-level alignment (wav2vec2) with a per-language model cache and a skip policy.
+
+Policies (PipelineConfig.ALIGN_POLICY):
+- "always":        align every recording
+- "never":         keep segment-level timestamps
+- "multi-speaker": align only when diarization finds more than one speaker;
+                   word timestamps only matter for splitting speakers inside segments
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+ALIGN_POLICIES = ("always", "never", "multi-speaker")
+
+
+def count_speakers(diarize_segments) -> int:
+    """Distinct speakers in diarization output (pyannote DataFrame or list of dicts)"""
+    if diarize_segments is None:
+        return 0
+    if hasattr(diarize_segments, "columns"):
+        return int(diarize_segments["speaker"].nunique()) if len(diarize_segments) else 0
+    return len({seg["speaker"] for seg in diarize_segments})
+
+
+def should_align(policy: str, num_speakers: Optional[int]) -> Tuple[bool, str]:
+    """Decide whether to align; returns (align, reason)"""
+    if policy not in ALIGN_POLICIES:
+        raise ValueError(f"Unknown align policy '{policy}'. Available: {', '.join(ALIGN_POLICIES)}")
+    if policy == "always":
+        return True, "policy=always"
+    if policy == "never":
+        return False, "policy=never"
+    if num_speakers is not None and num_speakers <= 1:
+        return False, f"{num_speakers} speaker(s) detected"
+    return True, f"{num_speakers} speakers detected"
+
+
+class AlignmentCache:
+    """
+    Align models keyed by language code, loaded once and kept resident.
+    Also tracks alignment throughput, used to estimate the time saved by skips.
+    """
+
+    def __init__(self, device: str):
+        self.device = device
+        self._models: Dict[str, Tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+        self.load_times: Dict[str, float] = {}
+        self._aligned_audio = 0.0
+        self._align_seconds = 0.0
+
+    def languages(self) -> List[str]:
+        return sorted(self._models)
+
+    def get(self, language: str) -> Tuple[Tuple[Any, Any], bool]:
+        """Returns ((align_model, metadata), cache_hit)"""
+        from .pipeline import load_ml_stack
+
+        with self._lock:
+            if language in self._models:
+                return self._models[language], True
+            _, whisperx = load_ml_stack()
+            start = time.time()
+            self._models[language] = whisperx.load_align_model(language_code=language, device=self.device)
+            self.load_times[language] = time.time() - start
+            return self._models[language], False
+
+    def record(self, audio_seconds: float, align_seconds: float):
+        self._aligned_audio += audio_seconds
+        self._align_seconds += align_seconds
+
+    def estimate(self, audio_seconds: float) -> Optional[float]:
+        """Expected alignment time for this much audio (None before any measurement)"""
+        if self._aligned_audio <= 0:
+            return None
+        return audio_seconds * self._align_seconds / self._aligned_audio
+
+
+def align_transcript(
+    result: Dict[str, Any],
+    audio,
+    language: str,
+    device: str,
+    policy: str = "always",
+    num_speakers: Optional[int] = None,
+    cache: Optional[AlignmentCache] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Apply the align policy to a WhisperX transcription result.
+
+    Without a cache the align model is loaded for this call only and freed afterwards.
+    Returns (result, info) where info reports the policy, decision and timings:
+        {"policy", "applied", "reason", "speakers", "time", "model_cached",
+         "load_time_saved", "estimated_time_saved", "error"}
+    """
+    from .pipeline import clear_gpu_memory, load_ml_stack
+
+    audio_seconds = len(audio) / 16000
+    apply, reason = should_align(policy, num_speakers)
+    info = {
+        "policy": policy,
+        "applied": False,
+        "reason": reason,
+        "speakers": num_speakers,
+        "time": 0.0,
+        "model_cached": None,
+        "load_time_saved": None,
+        "estimated_time_saved": None,
+        "error": None,
+    }
+
+    if not apply:
+        if cache is not None:
+            info["estimated_time_saved"] = cache.estimate(audio_seconds)
+        return result, info
+
+    _, whisperx = load_ml_stack()
+    start = time.time()
+    try:
+        if cache is not None:
+            (align_model, align_metadata), info["model_cached"] = cache.get(language)
+            if info["model_cached"]:
+                info["load_time_saved"] = cache.load_times.get(language)
+        else:
+            align_model, align_metadata = whisperx.load_align_model(language_code=language, device=device)
+        align_start = time.time()
+        result = whisperx.align(
+            result["segments"],
+            align_model,
+            align_metadata,
+            audio,
+            device,
+            return_char_alignments=False,
+        )
+        if cache is not None:
+            cache.record(audio_seconds, time.time() - align_start)
+        else:
+            del align_model
+            clear_gpu_memory()
+        info["applied"] = True
+    except Exception as e:
+        info["error"] = str(e)
+        info["reason"] = "alignment failed, using segment-level timestamps"
+    info["time"] = time.time() - start
+    return result, info
@@ -0,0 +1,281 @@
+"""
+Pluggable ASR backends.
+
+Every backend implements the same small protocol, so the pipeline, the model pool and
+the micro-batcher don't care which engine is behind it:
+
+    load()                                      load weights (idempotent)
+    transcribe(audio, batch_size, language)     whole recording → {"segments": [...], "language"}
+    chunk(audio)                                speech chunks [(start, end)] for micro-batching
+    transcribe_chunks(chunks, batch_size[, options])
+                                                batch of ≤30 s waveforms → [text, ...];
+                                                options = decoding overrides for this call
+    unload()                                    drop weights and free (V)RAM
+
+Backends (select with PIPELINE_ASR_BACKEND):
+- "whisperx": batched faster-whisper + VAD on GPU (default, most accurate)
+- "faster-whisper": plain faster-whisper, int8 on CPU (no GPU needed; pair with a
+  smaller MODEL_NAME)
+- "fake": deterministic text per window, no model (tests, CI, load testing)
+
+ASRBackend is an abstract base class, so a backend missing part of the protocol fails
+when it is created rather than halfway through a job.
+"""
+import dataclasses
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..core.config import PipelineConfig
+from .batching import SAMPLE_RATE, Chunk, fixed_chunks, vad_chunks
+
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+# Temperature fallback schedule for hard segments (first = greedy / beam search)
+TEMPERATURES = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
+
+
+def temperatures(config: PipelineConfig) -> List[float]:
+    """Fallback schedule capped at config.MAX_TEMPERATURE"""
+    return [t for t in TEMPERATURES if t <= config.MAX_TEMPERATURE] or [0.0]
+
+
+class ASRBackend(ABC):
+    """The backend protocol (chunk() and unload() have defaults)"""
+
+    name = "base"
+
+    def __init__(self, config: PipelineConfig):
+        self.config = config
+
+    @property
+    @abstractmethod
+    def loaded(self) -> bool:
+        ...
+
+    @abstractmethod
+    def load(self):
+        ...
+
+    @abstractmethod
+    def transcribe(self, audio: np.ndarray, batch_size: int, language: Optional[str] = None) -> Dict[str, Any]:
+        ...
+
+    def chunk(self, audio: np.ndarray) -> List[Chunk]:
+        return fixed_chunks(audio)
+
+    @abstractmethod
+    def transcribe_chunks(self, chunks: List[np.ndarray], batch_size: int,
+                          options: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Decode each chunk as one window. `options` overrides decoding settings for this
+        call only (faster-whisper TranscriptionOptions names; unsupported ones are ignored).
+        """
+
+    def unload(self):
+        pass
+
+
+class WhisperXBackend(ASRBackend):
+    """WhisperX batched inference (VAD-cut chunks decoded in GPU batches)"""
+
+    name = "whisperx"
+
+    def __init__(self, config: PipelineConfig):
+        super().__init__(config)
+        self.model = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.model is not None
+
+    def load(self):
+        if self.model is not None:
+            return
+        from . import pipeline as pipeline_module
+
+        _, whisperx = pipeline_module.load_ml_stack()
+        config = self.config
+        self.model = whisperx.load_model(
+            config.MODEL_NAME,
+            config.DEVICE,
+            compute_type=config.COMPUTE_TYPE,
+            language=config.LANGUAGE,
+            threads=config.CPU_THREADS,
+            asr_options={
+                "beam_size": config.BEAM_SIZE,
+                "best_of": config.BEST_OF,
+                "patience": config.PATIENCE,
+                "condition_on_previous_text": True,
+                "temperatures": temperatures(config),
+                "compression_ratio_threshold": 2.2,
+                "log_prob_threshold": -0.8,
+                "no_speech_threshold": 0.5,
+                "initial_prompt": config.INITIAL_PROMPT or None,
+                "repetition_penalty": 1.1,
+                "length_penalty": 1.0,
+            },
+            vad_options={
+                "vad_onset": config.VAD_ONSET,
+                "vad_offset": config.VAD_OFFSET,
+                "min_duration_on": config.MIN_DURATION_ON,
+                "min_duration_off": config.MIN_DURATION_OFF,
+            },
+        )
+
+    def transcribe(self, audio, batch_size, language=None):
+        return self.model.transcribe(audio, batch_size=batch_size, language=language, task="transcribe")
+
+    def chunk(self, audio):
+        return vad_chunks(self.model, audio)
+
+    def transcribe_chunks(self, chunks, batch_size, options=None):
+        original = self.model.options
+        if options:
+            # Callers hold the model's inference lock, so swapping options is safe
+            self.model.options = _replace_options(original, options)
+        try:
+            # Call the underlying HF pipeline directly: one batched decode, no VAD
+            outputs = self.model(({"inputs": chunk} for chunk in chunks), batch_size=batch_size, num_workers=0)
+            texts = []
+            for output in outputs:
+                text = output["text"]
+                if isinstance(text, list):  # Unbatched (batch_size=1) outputs come back as a list
+                    text = text[0]
+                texts.append(text)
+            return texts
+        finally:
+            self.model.options = original
+
+    def unload(self):
+        from .pipeline import clear_gpu_memory
+
+        self.model = None
+        clear_gpu_memory()
+
+
+class FasterWhisperBackend(ASRBackend):
+    """
+    Plain faster-whisper (CTranslate2), int8 on CPU with its built-in Silero VAD.
+    Runs on nodes without a GPU; use a smaller MODEL_NAME ("small", "medium") for speed.
+    """
+
+    name = "faster-whisper"
+
+    def __init__(self, config: PipelineConfig):
+        super().__init__(config)
+        self.model = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.model is not None
+
+    def load(self):
+        if self.model is not None:
+            return
+        if not FASTER_WHISPER_AVAILABLE:
+            raise RuntimeError("faster-whisper not installed. Run: pip install faster-whisper")
+        self.model = WhisperModel(
+            self.config.MODEL_NAME,
+            device="cpu",
+            compute_type="int8",
+            cpu_threads=self.config.CPU_THREADS,
+        )
+
+    def _decode(self, audio: np.ndarray, language: Optional[str], vad: bool,
+                options: Optional[Dict[str, Any]] = None):
+        kwargs = {
+            "language": language or self.config.LANGUAGE,
+            "beam_size": self.config.BEAM_SIZE,
+            "best_of": self.config.BEST_OF,
+            "patience": self.config.PATIENCE,
+            "temperature": temperatures(self.config),
+            "initial_prompt": self.config.INITIAL_PROMPT or None,
+            "vad_filter": vad,
+        }
+        for name, value in (options or {}).items():
+            kwargs["temperature" if name == "temperatures" else name] = value
+        segments, _ = self.model.transcribe(audio, **kwargs)
+        return list(segments)  # Segments are generated lazily while decoding
+
+    def transcribe(self, audio, batch_size, language=None):
+        segments = self._decode(audio, language, vad=True)
+        return {
+            "segments": [
+                {"text": seg.text, "start": round(seg.start, 3), "end": round(seg.end, 3),
+                 "avg_logprob": seg.avg_logprob}
+                for seg in segments
+            ],
+            "language": language or self.config.LANGUAGE,
+        }
+
+    def transcribe_chunks(self, chunks, batch_size, options=None):
+        # CTranslate2 on CPU gains little from batching: decode chunks one by one
+        return ["".join(seg.text for seg in self._decode(chunk, None, vad=False, options=options))
+                for chunk in chunks]
+
+    def unload(self):
+        self.model = None
+
+
+class FakeBackend(ASRBackend):
+    """Deterministic stand-in: one segment per 30 s window, text derived from the window"""
+
+    name = "fake"
+
+    def __init__(self, config: PipelineConfig):
+        super().__init__(config)
+        self._loaded = False
+        self.calls = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self):
+        self._loaded = True
+
+    @staticmethod
+    def _text(chunk: np.ndarray) -> str:
+        return f"ทดสอบ {len(chunk) / SAMPLE_RATE:.1f} วินาที"
+
+    def transcribe(self, audio, batch_size, language=None):
+        self.calls += 1
+        segments = []
+        for start, end in self.chunk(audio):
+            window = audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]
+            segments.append({"text": self._text(window), "start": round(start, 3), "end": round(end, 3)})
+        return {"segments": segments, "language": language or self.config.LANGUAGE}
+
+    def transcribe_chunks(self, chunks, batch_size, options=None):
+        self.calls += 1
+        return [self._text(chunk) for chunk in chunks]
+
+    def unload(self):
+        self._loaded = False
+
+
+def _replace_options(options, overrides: Dict[str, Any]):
+    """Copy of a TranscriptionOptions (dataclass or NamedTuple) with known fields replaced"""
+    if dataclasses.is_dataclass(options):
+        names = {field.name for field in dataclasses.fields(options)}
+        return dataclasses.replace(options, **{k: v for k, v in overrides.items() if k in names})
+    return options._replace(**{k: v for k, v in overrides.items() if k in options._fields})
+
+
+ASR_BACKENDS = {
+    backend.name: backend for backend in (WhisperXBackend, FasterWhisperBackend, FakeBackend)
+}
+
+
+def create_backend(config: PipelineConfig, name: Optional[str] = None) -> ASRBackend:
+    """Backend instance (not loaded yet) for `name` or config.ASR_BACKEND"""
+    name = name or config.ASR_BACKEND
+    if name not in ASR_BACKENDS:
+        raise ValueError(f"Unknown ASR backend '{name}'. Available: {', '.join(ASR_BACKENDS)}")
+    return ASR_BACKENDS[name](config)
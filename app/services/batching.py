@@ -0,0 +1,215 @@
+"""
+Cross-request micro-batching for the shared ASR model.
+Short recordings only produce a few VAD chunks each, so their own `transcribe` calls
+never fill a batch. The batcher queues chunks from concurrent jobs and decodes them
+together in one batched call, up to a small latency deadline, then hands each job
+back its own segments.
+"""
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+CHUNK_SECONDS = 30.0  # Whisper's input window
+
+Chunk = Tuple[float, float]
+
+
+def fixed_chunks(audio: np.ndarray, chunk_seconds: float = CHUNK_SECONDS) -> List[Chunk]:
+    """Split audio into consecutive fixed-length windows (fallback when VAD is unavailable)"""
+    duration = len(audio) / SAMPLE_RATE
+    chunks = []
+    start = 0.0
+    while start < duration:
+        chunks.append((start, min(duration, start + chunk_seconds)))
+        start += chunk_seconds
+    return chunks
+
+
+def vad_chunks(model, audio: np.ndarray, chunk_seconds: float = CHUNK_SECONDS) -> List[Chunk]:
+    """
+    Speech chunks (≤ chunk_seconds) from the WhisperX pipeline's own VAD model,
+    merged exactly as `model.transcribe` would. Falls back to fixed windows if the
+    installed WhisperX exposes a different VAD interface.
+    """
+    try:
+        vad_model = model.vad_model
+        onset = model._vad_params["vad_onset"]
+        offset = model._vad_params["vad_offset"]
+        if hasattr(vad_model, "preprocess_audio") and hasattr(vad_model, "merge_chunks"):
+            # whisperx >= 3.4 (Vad base class)
+            segments = vad_model({"waveform": vad_model.preprocess_audio(audio), "sample_rate": SAMPLE_RATE})
+            merged = vad_model.merge_chunks(segments, chunk_seconds, onset=onset, offset=offset)
+        else:
+            import torch
+            from whisperx.vad import merge_chunks
+            segments = vad_model({"waveform": torch.from_numpy(audio).unsqueeze(0), "sample_rate": SAMPLE_RATE})
+            merged = merge_chunks(segments, chunk_seconds, onset=onset, offset=offset)
+        return [(seg["start"], seg["end"]) for seg in merged]
+    except Exception as e:
+        print(f"   ⚠️ VAD chunking unavailable, using fixed windows: {e}")
+        return fixed_chunks(audio, chunk_seconds)
+
+
+@dataclass
+class _Job:
+    """One submitted recording: its chunks and the per-chunk texts as they come back"""
+    chunks: List[Chunk]
+    texts: List[Optional[str]]
+    remaining: int
+    done: threading.Event = field(default_factory=threading.Event)
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class _Item:
+    job: _Job
+    index: int
+    audio: np.ndarray
+    decoded: bool = False
+
+
+class MicroBatcher:
+    """
+    Gathers ASR chunks from concurrent jobs into shared batched calls.
+
+    The worker thread takes the first queued chunk, then keeps collecting until the
+    batch holds `batch_size` chunks or `max_wait` seconds have passed, and runs one
+    `backend.transcribe_chunks(chunks, batch_size)` call. Out-of-memory batches are
+    split in half and retried; after any other error the batch's chunks are retried
+    one at a time, so only the jobs whose chunks fail again get the error.
+
+    Args:
+        backend: Loaded ASR backend (see app/services/asr_backends.py)
+        batch_size: Max chunks per inference call
+        max_wait: Latency deadline for filling a batch (seconds)
+        lock: Lock shared with other users of the model (serializes GPU access)
+        chunker: audio → [(start, end)] in seconds; defaults to `backend.chunk`
+    """
+
+    def __init__(
+        self,
+        backend,
+        batch_size: int,
+        max_wait: float = 0.05,
+        lock: Optional[threading.Lock] = None,
+        chunker: Optional[Callable[[np.ndarray], List[Chunk]]] = None,
+    ):
+        self.backend = backend
+        self.batch_size = max(1, batch_size)
+        self.max_wait = max_wait
+        self.lock = lock or threading.Lock()
+        self.chunker = chunker or backend.chunk
+        self.stats = {"calls": 0, "chunks": 0, "jobs": 0}
+        self._stats_lock = threading.Lock()  # Updated by caller threads and the worker
+        self._queue: "queue.Queue[_Item]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="asr-microbatch", daemon=True)
+        self._worker.start()
+
+    def transcribe(self, audio: np.ndarray, language: str = None) -> Dict[str, Any]:
+        """
+        Transcribe one recording through the shared batches (blocks until done).
+        Returns the same shape as `backend.transcribe`: {"segments": [...], "language": ...}
+        """
+        chunks = self.chunker(audio)
+        job = _Job(chunks=chunks, texts=[None] * len(chunks), remaining=len(chunks))
+        self._count(jobs=1)
+        if not chunks:
+            return {"segments": [], "language": language}
+
+        for index, (start, end) in enumerate(chunks):
+            segment_audio = audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]
+            self._queue.put(_Item(job=job, index=index, audio=segment_audio))
+
+        job.done.wait()
+        if job.error is not None:
+            raise job.error
+
+        segments = [
+            {"text": text, "start": round(start, 3), "end": round(end, 3)}
+            for (start, end), text in zip(job.chunks, job.texts)
+        ]
+        return {"segments": segments, "language": language}
+
+    def _collect(self) -> List[_Item]:
+        """Block for the first chunk, then fill the batch until full or the deadline"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _count(self, **increments: int):
+        with self._stats_lock:
+            for name, value in increments.items():
+                self.stats[name] += value
+
+    def snapshot(self) -> Dict[str, int]:
+        """Consistent copy of the counters"""
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            try:
+                self._infer(batch)
+            except BaseException as e:
+                if len(batch) == 1:
+                    self._fail(batch[0].job, e)
+                else:
+                    self._infer_one_by_one(batch)
+
+    def _infer_one_by_one(self, batch: List[_Item]):
+        """Retry a failed batch chunk by chunk; a chunk that fails again fails only its job"""
+        for item in batch:
+            if item.decoded or item.job.error is not None:
+                continue
+            try:
+                self._infer([item])
+            except BaseException as e:
+                self._fail(item.job, e)
+
+    def _infer(self, batch: List[_Item]):
+        """One batched decode; splits the batch on out-of-memory"""
+        from .pipeline import clear_gpu_memory, is_out_of_memory
+
+        try:
+            with self.lock:
+                texts = self.backend.transcribe_chunks([item.audio for item in batch], batch_size=len(batch))
+        except (RuntimeError, MemoryError) as e:
+            if not is_out_of_memory(e) or len(batch) == 1:
+                raise
+            clear_gpu_memory()
+            self.batch_size = max(1, len(batch) // 2)
+            print(f"   ⚠️ Out of memory, micro-batch size reduced to {self.batch_size}")
+            self._infer(batch[:self.batch_size])
+            self._infer(batch[self.batch_size:])
+            return
+
+        self._count(calls=1, chunks=len(batch))
+        for item, text in zip(batch, texts):
+            item.decoded = True
+            job = item.job
+            if job.error is not None:
+                continue
+            job.texts[item.index] = text
+            job.remaining -= 1
+            if job.remaining == 0:
+                job.done.set()
+
+    @staticmethod
+    def _fail(job: _Job, error: BaseException):
+        if job.error is None:
+            job.error = error
+            job.done.set()
@@ -0,0 +1,144 @@
+"""
+Post-ASR hallucination filter.
+
+Music, silence and noise make Whisper loop ("ขอบคุณครับ ขอบคุณครับ ...") or invent
+low-confidence text. Each transcribed segment is checked for:
+- repetition: share of repeated word n-grams (Thai-aware word segmentation)
+- compression: zlib compression ratio of the text (Whisper's own loop signal), one
+  byte per character so Thai's shared UTF-8 lead bytes don't inflate it
+- low confidence: avg_logprob, when the backend reports it
+
+Only the flagged windows are decoded again, with options that break loops (no prompt,
+no conditioning on previous text, a single temperature, repetition penalties) instead of
+paying the full temperature fallback chain everywhere. A segment whose second decode is
+still flagged (or empty) is dropped, so loops never reach the summary prompt.
+"""
+import time
+import zlib
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..utils.thai_words import segment as segment_words
+
+SAMPLE_RATE = 16000
+
+# Decoding options for the second pass (TranscriptionOptions names; backends ignore
+# the ones they don't support)
+REDECODE_OPTIONS = {
+    "initial_prompt": None,
+    "condition_on_previous_text": False,
+    "temperatures": [0.0],
+    "repetition_penalty": 1.3,
+    "no_repeat_ngram_size": 3,
+}
+
+NGRAM_SIZE = 3
+MIN_NGRAMS = 6  # Shorter texts are too short to judge repetition
+
+
+def _char_bytes(text: str) -> bytes:
+    """One byte per character (Thai block → 0x80-0xFF, other non-ASCII → '?')"""
+    return bytes(
+        code - 0x0E00 + 0x80 if 0x0E00 <= code <= 0x0E7F else (code if code < 0x80 else 0x3F)
+        for code in map(ord, text)
+    )
+
+
+def compression_ratio(text: str) -> float:
+    """Characters per zlib-compressed byte; loops compress very well (normal speech ≈ 1.3)"""
+    data = _char_bytes(text)
+    if not data:
+        return 0.0
+    return len(data) / len(zlib.compress(data))
+
+
+def repetition_ratio(text: str, n: int = NGRAM_SIZE) -> float:
+    """Share of word n-grams that repeat an earlier one (0 = none, →1 = a loop)"""
+    words = segment_words(text)
+    ngrams = [tuple(words[i:i + n]) for i in range(len(words) - n + 1)]
+    if len(ngrams) < MIN_NGRAMS:
+        return 0.0
+    return 1.0 - len(set(ngrams)) / len(ngrams)
+
+
+def check_segment(segment: Dict[str, Any], repetition_threshold: float,
+                  compression_threshold: float, logprob_threshold: float) -> List[str]:
+    """Reasons a segment looks hallucinated ([] = keep as is)"""
+    text = (segment.get("text") or "").strip()
+    if not text:
+        return []
+    reasons = []
+    if repetition_ratio(text) > repetition_threshold:
+        reasons.append("repetition")
+    if compression_ratio(text) > compression_threshold:
+        reasons.append("compression")
+    avg_logprob = segment.get("avg_logprob")
+    if avg_logprob is not None and avg_logprob < logprob_threshold:
+        reasons.append("low_logprob")
+    return reasons
+
+
+def filter_hallucinations(
+    segments: List[Dict[str, Any]],
+    audio: np.ndarray,
+    backend,
+    repetition_threshold: float = 0.5,
+    compression_threshold: float = 2.4,
+    logprob_threshold: float = -1.0,
+    batch_size: int = 8,
+    lock=None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Re-decode flagged segments with REDECODE_OPTIONS; drop those still flagged.
+
+    Args:
+        segments: ASR segments ({"text", "start", "end"[, "avg_logprob"]})
+        audio: 16 kHz waveform the segments came from
+        backend: Loaded ASR backend (None = drop flagged segments without re-decoding)
+        lock: Held around the re-decode (the shared model's inference lock)
+
+    Returns (segments, report) with report = {'flagged', 'redecoded', 'dropped',
+    'redecoded_seconds', 'reasons', 'time'}.
+    """
+    start_time = time.time()
+    thresholds = (repetition_threshold, compression_threshold, logprob_threshold)
+    flagged = []
+    reasons: Dict[str, int] = {}
+    for index, segment in enumerate(segments):
+        found = check_segment(segment, *thresholds)
+        if found:
+            flagged.append(index)
+            for reason in found:
+                reasons[reason] = reasons.get(reason, 0) + 1
+
+    texts: List[Optional[str]] = [None] * len(flagged)
+    redecoded_seconds = 0.0
+    if flagged and backend is not None:
+        windows = []
+        for index in flagged:
+            segment = segments[index]
+            windows.append(audio[int(segment["start"] * SAMPLE_RATE):int(segment["end"] * SAMPLE_RATE)])
+            redecoded_seconds += segment["end"] - segment["start"]
+        with lock or nullcontext():
+            texts = backend.transcribe_chunks(windows, batch_size=min(batch_size, len(windows)),
+                                              options=REDECODE_OPTIONS)
+
+    replaced = {}
+    for index, text in zip(flagged, texts):
+        candidate = {"text": text or "", "start": segments[index]["start"], "end": segments[index]["end"]}
+        if (text or "").strip() and not check_segment(candidate, *thresholds):
+            replaced[index] = candidate
+    dropped = set(flagged) - set(replaced)
+    kept = [replaced.get(index, segment) for index, segment in enumerate(segments) if index not in dropped]
+
+    report = {
+        'flagged': len(flagged),
+        'redecoded': len(replaced),
+        'dropped': len(dropped),
+        'redecoded_seconds': round(redecoded_seconds, 3),
+        'reasons': reasons,
+        'time': time.time() - start_time,
+    }
+    return kept, report
@@ -0,0 +1,122 @@
+"""
+Durable job records for asynchronous processing.
+
+A long meeting can take longer than the reverse proxy's read timeout, so uploads can
+be decoupled from results: the job row is written when the upload is accepted, its
+status is updated as the pipeline runs, and the final API response is stored
+(zlib-compressed JSON) when it finishes. Clients poll by job id, which doubles as the
+resume token (unguessable, safe to keep in localStorage across reloads).
+
+Rows live in the meeting database (MEETING_DB). Jobs that were queued or running when
+the server stopped are marked failed on the next start.
+"""
+import json
+import os
+import re
+import secrets
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from .store import DEFAULT_DB_PATH
+
+JOB_STATUSES = ("queued", "running", "done", "failed", "cancelled")
+FINAL_STATUSES = ("done", "failed", "cancelled")
+
+# Client-chosen ids (X-Job-Id) must look like generated ones: URL-safe, hard to guess
+_JOB_ID = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    audio_file TEXT NOT NULL,
+    meeting_type_id INTEGER NOT NULL,
+    priority TEXT NOT NULL,
+    error TEXT,
+    result BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status);
+"""
+
+
+def new_job_id() -> str:
+    return secrets.token_urlsafe(18)
+
+
+def valid_job_id(job_id: str) -> bool:
+    return bool(job_id and _JOB_ID.match(job_id))
+
+
+class JobStore:
+    """SQLite-backed job table (one connection per operation, WAL mode)"""
+
+    def __init__(self, path: str = None):
+        self.path = path or os.environ.get("MEETING_DB", DEFAULT_DB_PATH)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._write_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def create(self, job_id: str, audio_file: str, meeting_type_id: int, priority: str) -> bool:
+        """Register a queued job; False if the id is already taken"""
+        now = time.time()
+        with self._write_lock, self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO jobs (id, status, created_at, updated_at, audio_file, meeting_type_id, priority) "
+                "VALUES (?, 'queued', ?, ?, ?, ?, ?)",
+                (job_id, now, now, audio_file, meeting_type_id, priority),
+            )
+            return cursor.rowcount > 0
+
+    def set_status(self, job_id: str, status: str, error: Optional[str] = None,
+                   result: Optional[Dict[str, Any]] = None):
+        if status not in JOB_STATUSES:
+            raise ValueError(f"Unknown job status '{status}'. Available: {', '.join(JOB_STATUSES)}")
+        blob = None
+        if result is not None:
+            blob = zlib.compress(json.dumps(result, ensure_ascii=False).encode("utf-8"), 6)
+        with self._write_lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ?, error = ?, result = COALESCE(?, result) WHERE id = ?",
+                (status, time.time(), error, blob, job_id),
+            )
+
+    def get(self, job_id: str, include_result: bool = True) -> Optional[Dict[str, Any]]:
+        """Job record (result decoded when finished), or None"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        record = dict(row)
+        blob = record.pop('result')
+        record['result'] = json.loads(zlib.decompress(blob).decode("utf-8")) if blob and include_result else None
+        return record
+
+    def fail_interrupted(self) -> int:
+        """Mark jobs left queued/running by a previous server process as failed"""
+        with self._write_lock, self._connect() as conn:
+            return conn.execute(
+                "UPDATE jobs SET status = 'failed', error = 'Interrupted by server restart', updated_at = ? "
+                "WHERE status IN ('queued', 'running')",
+                (time.time(),),
+            ).rowcount
@@ -0,0 +1,177 @@
+"""
+Meeting media storage for playback.
+
+The uploaded recording is moved (not copied) into MEDIA_DIR/<meeting_id>/ after
+processing, so the UI can play it back at any transcript timestamp. Stored files never
+change, so they are served with a content-hash ETag and an immutable Cache-Control;
+the hash is computed once and kept in a `.sha256` sidecar file.
+
+Time-range requests (`?start=&end=`) are cut with ffmpeg input seeking: the demuxer
+jumps to `start` and only the requested span is decoded and encoded to MP3. Slice
+bounds are snapped to a 0.1 s grid and cached, so repeated seeks reuse the same file.
+
+The low-bitrate playback proxy, its seek index and waveform peaks (see
+app/utils/playback.py) are stored next to the original.
+"""
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+from typing import Optional
+
+DEFAULT_MEDIA_DIR = os.path.join("data", "media")
+
+# Longest time slice served in one request (seconds)
+MAX_SLICE_SECONDS = 600.0
+SLICE_GRID = 0.1
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Playback artifacts: name in the API → candidate file names in the meeting dir
+PLAYBACK_FILES = {
+    "proxy": ("proxy.ogg", "proxy.m4a"),
+    "seek_index": ("seek_index.json",),
+    "peaks": ("peaks.json",),
+}
+
+_MEETING_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+HASH_READ_SIZE = 1024 * 1024
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a stored (immutable) file, cached in a sidecar next to it"""
+    sidecar = path + ".sha256"
+    try:
+        with open(sidecar) as f:
+            return f.read().strip()
+    except OSError:
+        pass
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        # Read in blocks (hashlib.file_digest is 3.11+, the Docker image runs 3.10)
+        for block in iter(lambda: f.read(HASH_READ_SIZE), b""):
+            sha256.update(block)
+    digest = sha256.hexdigest()
+    try:
+        with open(sidecar, "w") as f:
+            f.write(digest)
+    except OSError:
+        pass  # Read-only media dir: recompute next time
+    return digest
+
+
+def content_etag(path: str) -> str:
+    return '"' + file_digest(path)[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (handles lists, weak tags and *)"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+def slice_audio_ffmpeg(source: str, start: float, end: float, output_path: str) -> bool:
+    """Cut [start, end) seconds to mono MP3; only that span is decoded"""
+    tmp_path = output_path + ".part"
+    cmd = [
+        'ffmpeg', '-y', '-v', 'error',
+        '-ss', f"{start:.3f}",        # Input seeking: jump before decoding
+        '-i', source,
+        '-t', f"{end - start:.3f}",
+        '-vn',                        # Ignore video streams
+        '-ac', '1',
+        '-b:a', '64k',
+        '-f', 'mp3',
+        tmp_path,
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        if result.returncode != 0 or not os.path.exists(tmp_path):
+            print(f"   ⚠️ ffmpeg slice error: {result.stderr.strip()[:200]}")
+            return False
+        os.replace(tmp_path, output_path)  # Atomic: concurrent requests never see partial slices
+        return True
+    except (subprocess.TimeoutExpired, OSError) as e:
+        print(f"   ⚠️ ffmpeg error: {e}")
+        return False
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class MediaStore:
+    """Per-meeting media directory: original recording, cached time slices, playback proxy"""
+
+    def __init__(self, root: str = None):
+        self.root = root or os.environ.get("MEDIA_DIR", DEFAULT_MEDIA_DIR)
+        os.makedirs(self.root, exist_ok=True)
+
+    def meeting_dir(self, meeting_id: str) -> str:
+        if not _MEETING_ID.match(meeting_id or ""):
+            raise ValueError(f"Invalid meeting id '{meeting_id}'")
+        return os.path.join(self.root, meeting_id)
+
+    def store_original(self, meeting_id: str, source_path: str) -> str:
+        """Move the processed recording into the meeting's media dir"""
+        directory = self.meeting_dir(meeting_id)
+        os.makedirs(directory, exist_ok=True)
+        ext = os.path.splitext(source_path)[1].lower() or ".bin"
+        path = os.path.join(directory, "original" + ext)
+        shutil.move(source_path, path)
+        file_digest(path)
+        return path
+
+    def store_playback(self, meeting_id: str, playback: dict) -> dict:
+        """Move the pipeline's playback artifacts in; returns which ones are available"""
+        directory = self.meeting_dir(meeting_id)
+        os.makedirs(directory, exist_ok=True)
+        stored = {}
+        try:
+            for name in PLAYBACK_FILES:
+                source = playback.get(name)
+                if source and os.path.exists(source):
+                    path = os.path.join(directory, os.path.basename(source))
+                    shutil.move(source, path)
+                    file_digest(path)
+                    stored[name] = path
+        finally:
+            if playback.get('dir'):
+                shutil.rmtree(playback['dir'], ignore_errors=True)
+        return stored
+
+    def playback_path(self, meeting_id: str, name: str) -> Optional[str]:
+        for filename in PLAYBACK_FILES[name]:
+            path = os.path.join(self.meeting_dir(meeting_id), filename)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def original_path(self, meeting_id: str) -> Optional[str]:
+        directory = self.meeting_dir(meeting_id)
+        if not os.path.isdir(directory):
+            return None
+        for name in os.listdir(directory):
+            if name.startswith("original.") and not name.endswith(".sha256"):
+                return os.path.join(directory, name)
+        return None
+
+    def slice(self, meeting_id: str, start: float, end: float) -> Optional[str]:
+        """Cached MP3 of [start, end) seconds of the original, or None"""
+        source = self.original_path(meeting_id)
+        if source is None:
+            return None
+        start = round(start / SLICE_GRID) * SLICE_GRID
+        end = max(start + SLICE_GRID, round(end / SLICE_GRID) * SLICE_GRID)
+        slice_dir = os.path.join(self.meeting_dir(meeting_id), "slices")
+        os.makedirs(slice_dir, exist_ok=True)
+        path = os.path.join(slice_dir, f"{int(round(start * 1000))}-{int(round(end * 1000))}.mp3")
+        if os.path.exists(path) or slice_audio_ffmpeg(source, start, end, path):
+            return path
+        return None
+
+    def delete(self, meeting_id: str):
+        shutil.rmtree(self.meeting_dir(meeting_id), ignore_errors=True)
@@ -0,0 +1,182 @@
+"""
+Process-wide model pool.
+Preloads the ASR, alignment and diarization models once, warms them up with a
+synthetic clip, and shares them across pipeline runs so no request pays for cold loads.
+ASR models are kept per processing tier. Only the pool's own tier is warmed by default
+(PRELOAD_TIERS adds more): BATCH_SIZE is sized for one resident ASR model, so every
+extra tier costs VRAM the batch budget does not account for.
+"""
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..core.config import PipelineConfig
+from . import pipeline as pipeline_module
+from .alignment import AlignmentCache
+from .batching import MicroBatcher
+
+SAMPLE_RATE = 16000
+WARMUP_SECONDS = 8.0
+
+
+def synthetic_speech_clip(seconds: float = WARMUP_SECONDS) -> np.ndarray:
+    """
+    Speech-like test signal: a harmonic voice-band tone with syllable-rate (4 Hz)
+    amplitude modulation, loud enough for the VAD to pass it to every model.
+    """
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    pitch = 140 + 30 * np.sin(2 * np.pi * 0.5 * t)  # Gently varying pitch contour
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voice = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 4 * t))
+    return (0.2 * voice * envelope).astype(np.float32)
+
+
+class ModelPool:
+    """
+    Shared, lazily-loaded models for the pipeline.
+
+    Status goes cold → warming → ready (or failed, or degraded when an optional
+    alignment / diarization warmup failed). `warmup()` is meant to run in a
+    background thread at server start; getters load on demand if warmup was skipped.
+    """
+
+    def __init__(self, config: PipelineConfig = None, tiers: List[str] = None):
+        self.config = config or PipelineConfig()
+        if tiers is None:
+            tiers = os.environ.get("PRELOAD_TIERS", self.config.TIER).split(",")
+        self.tiers = [tier.strip() for tier in tiers if tier.strip()]
+        self._tier_configs = {tier: self.config.for_tier(tier) for tier in self.tiers}
+        self.status = "cold"
+        self.error: Optional[str] = None
+        self.warnings: Dict[str, str] = {}  # Optional model → warmup error (status "degraded")
+        self.timings: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        # Serializes GPU use of the shared ASR model (batched and whole-file calls)
+        self.inference_lock = threading.Lock()
+        self._asr: Dict[str, Any] = {}
+        self._batchers: Dict[str, MicroBatcher] = {}
+        self.align_cache = AlignmentCache(self.config.DEVICE)
+        self._diarize = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.status in ("ready", "degraded")
+
+    def config_for(self, tier: str = None) -> PipelineConfig:
+        """Pool settings for a processing tier (default: the pool's own tier)"""
+        tier = tier or self.config.TIER
+        with self._lock:
+            if tier not in self._tier_configs:
+                self._tier_configs[tier] = self.config.for_tier(tier)
+            return self._tier_configs[tier]
+
+    def get_asr(self, tier: str = None):
+        """Shared, loaded ASR backend for a processing tier"""
+        config = self.config_for(tier)
+        with self._lock:
+            if config.TIER not in self._asr:
+                start = time.time()
+                self._asr[config.TIER] = pipeline_module.load_asr_model(config)
+                self.timings[f'asr_load_{config.TIER}'] = time.time() - start
+            return self._asr[config.TIER]
+
+    def get_batcher(self, tier: str = None) -> MicroBatcher:
+        """Cross-request micro-batcher in front of a tier's shared ASR model"""
+        config = self.config_for(tier)
+        with self._lock:
+            if config.TIER not in self._batchers:
+                self._batchers[config.TIER] = MicroBatcher(
+                    self.get_asr(config.TIER),
+                    batch_size=config.BATCH_SIZE,
+                    max_wait=config.MICROBATCH_WAIT,
+                    lock=self.inference_lock,
+                )
+            return self._batchers[config.TIER]
+
+    def get_align(self, language: str):
+        """Shared (align_model, metadata) for a language"""
+        (align_model, align_metadata), cached = self.align_cache.get(language)
+        if not cached:
+            self.timings[f'align_load_{language}'] = self.align_cache.load_times[language]
+        return align_model, align_metadata
+
+    def get_diarize(self):
+        """Shared pyannote diarization pipeline"""
+        with self._lock:
+            if self._diarize is None:
+                start = time.time()
+                self._diarize = pipeline_module.load_diarize_model(self.config)
+                self.timings['diarize_load'] = time.time() - start
+            return self._diarize
+
+    def warmup(self):
+        """
+        Load every configured model and run the synthetic clip through each one,
+        so CUDA kernels / graphs are initialized before the first real request.
+        """
+        self.status = "warming"
+        total_start = time.time()
+        clip = synthetic_speech_clip()
+        try:
+            print("🔥 Warming up models...")
+
+            for tier in self.tiers:
+                start = time.time()
+                self.get_asr(tier).transcribe(clip, batch_size=1, language=self.config.LANGUAGE)
+                self.timings[f'asr_warmup_{tier}'] = time.time() - start
+
+            # Alignment and diarization only when a preloaded tier uses them. Both are
+            # optional in the pipeline too (segment timestamps / one unlabeled speaker),
+            # so a failure leaves the pool degraded rather than failed
+            configs = [self.config_for(tier) for tier in self.tiers]
+            if any(config.ALIGN_POLICY != "never" for config in configs):
+                try:
+                    start = time.time()
+                    align_model, align_metadata = self.get_align(self.config.LANGUAGE)
+                    pipeline_module.whisperx.align(
+                        [{"start": 0.0, "end": WARMUP_SECONDS, "text": "สวัสดีครับ ทดสอบระบบ"}],
+                        align_model, align_metadata, clip, self.config.DEVICE,
+                        return_char_alignments=False,
+                    )
+                    self.timings['align_warmup'] = time.time() - start
+                except Exception as e:
+                    self.warnings['alignment'] = str(e)
+                    print(f"   ⚠️ Alignment warmup skipped: {e}")
+
+            if any(config.DIARIZE for config in configs):
+                try:
+                    start = time.time()
+                    self.get_diarize()(clip)
+                    self.timings['diarize_warmup'] = time.time() - start
+                except Exception as e:
+                    self.warnings['diarization'] = str(e)
+                    print(f"   ⚠️ Diarization warmup skipped: {e}")
+
+            self.timings['total'] = time.time() - total_start
+            self.status = "degraded" if self.warnings else "ready"
+            print(f"✅ Models ready ({self.timings['total']:.1f}s)"
+                  + (f", degraded: {', '.join(self.warnings)}" if self.warnings else ""))
+        except Exception as e:
+            self.status = "failed"
+            self.error = str(e)
+            print(f"❌ Model warmup failed: {e}")
+
+    def describe(self) -> Dict[str, Any]:
+        """Readiness details for the health endpoint"""
+        return {
+            "status": self.status,
+            "error": self.error,
+            "warnings": self.warnings or None,
+            "asr_loaded": bool(self._asr),
+            "asr_tiers": sorted(self._asr),
+            "asr_backend": self.config.ASR_BACKEND,
+            "align_languages": self.align_cache.languages(),
+            "diarize_loaded": self._diarize is not None,
+            "microbatch": {tier: batcher.snapshot() for tier, batcher in self._batchers.items()} or None,
+            "timings": {name: round(value, 2) for name, value in self.timings.items()},
+            "hardware": self.config.describe(),
+        }
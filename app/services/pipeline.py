@@ -1,82 +1,293 @@
-import torch
 import gc
 import os
+import shutil
 import time
 import tempfile
+import threading
+from contextlib import nullcontext
 from typing import Dict, Any, Optional
-import whisperx
 
 from ..core.config import PipelineConfig
 from ..models.meeting import MEETING_TYPES
-from ..services.summarizer import summarize_with_diarization
+from ..services.summarizer import summarize_meeting
+from .alignment import ALIGN_POLICIES, align_transcript, count_speakers
+from .asr_backends import ASR_BACKENDS, ASRBackend, create_backend
+from .hallucination import filter_hallucinations
+from .scheduler import Job, estimate_cost
 from ..utils.formatting import format_speaker, format_time
 from ..utils.audio_clip import extract_speaker_clips
+from ..utils.ingest import prepare_audio
+from ..utils.playback import build_playback
+from ..utils.speaker_timeline import SpeakerTimeline, intervals_from_diarization, merge_speaking_time
+from ..utils.thai_words import count_words
 
-# Fix for PyTorch 2.6+ compatibility with pyannote
-_original_torch_load = torch.load
-def _patched_torch_load(*args, **kwargs):
-    kwargs['weights_only'] = False
-    return _original_torch_load(*args, **kwargs)
-torch.load = _patched_torch_load
+# Heavy ML stack (torch, whisperx -> pyannote, transformers, ...) is imported on first
+# pipeline use or by the server's background warmup, so importing this module is cheap
+torch = None
+whisperx = None
+_ml_stack_lock = threading.Lock()
+
+SAMPLE_RATE = 16000  # whisperx.load_audio output rate
+
+def _patch_torch_load(torch_module):
+    """Fix for PyTorch 2.6+ compatibility with pyannote (must run before importing whisperx)"""
+    original_torch_load = torch_module.load
+    def _patched_torch_load(*args, **kwargs):
+        kwargs['weights_only'] = False
+        return original_torch_load(*args, **kwargs)
+    torch_module.load = _patched_torch_load
+
+def load_ml_stack():
+    """Import torch + whisperx once per process (thread-safe) and return them"""
+    global torch, whisperx
+    with _ml_stack_lock:
+        if whisperx is None:
+            import torch as torch_module
+            _patch_torch_load(torch_module)
+            import whisperx as whisperx_module
+            from whisperx import diarize as _diarize  # noqa: F401 (registers whisperx.diarize)
+            torch, whisperx = torch_module, whisperx_module
+    return torch, whisperx
+
+def is_ml_stack_loaded() -> bool:
+    """True once torch + whisperx have been imported"""
+    return whisperx is not None
 
 def clear_gpu_memory():
     """Clear GPU memory"""
     gc.collect()
-    if torch.cuda.is_available():
+    if torch is not None and torch.cuda.is_available():
         torch.cuda.empty_cache()
 
+def is_out_of_memory(error: Exception) -> bool:
+    """True for CUDA OOM errors from torch or CTranslate2"""
+    return isinstance(error, (RuntimeError, MemoryError)) and 'out of memory' in str(error).lower()
+
+def load_asr_model(config: PipelineConfig) -> ASRBackend:
+    """Create and load the configured ASR backend (see app/services/asr_backends.py)"""
+    backend = create_backend(config)
+    backend.load()
+    return backend
+
+def load_diarize_model(config: PipelineConfig):
+    """Load the pyannote diarization pipeline"""
+    load_ml_stack()
+    try:
+        return whisperx.diarize.DiarizationPipeline(
+            use_auth_token=config.HF_TOKEN,
+            device=config.DEVICE
+        )
+    except TypeError:
+        # Newer pyannote versions use 'token' instead of 'use_auth_token'
+        return whisperx.diarize.DiarizationPipeline(
+            token=config.HF_TOKEN,
+            device=config.DEVICE
+        )
+
 class TranscribeSummaryPipeline:
     """
     Combined pipeline that runs WhisperX transcription and GPT-4.1 summarization.
     Handles model loading, transcription, speaker diarization, and AI summary.
+    
+    With a ModelPool, models are taken from the shared (preloaded, warmed-up) pool
+    and kept resident; without one, each model is loaded per job and freed after use.
+    `tier` selects a processing tier (draft / standard / accurate, see PROCESSING_TIERS).
     """
     
-    def __init__(self, config: PipelineConfig = None):
-        self.config = config or PipelineConfig()
+    def __init__(self, config: PipelineConfig = None, model_pool=None, tier: str = None):
+        if config is None and model_pool is not None:
+            config = model_pool.config.for_tier(tier or model_pool.config.TIER)
+        self.config = config or PipelineConfig(tier=tier)
+        if tier is not None and tier != self.config.TIER:
+            self.config = self.config.for_tier(tier)
+        self.model_pool = model_pool
+        if self.config.ALIGN_POLICY not in ALIGN_POLICIES:
+            raise ValueError(
+                f"Unknown align policy '{self.config.ALIGN_POLICY}'. Available: {', '.join(ALIGN_POLICIES)}"
+            )
+        if self.config.ASR_BACKEND not in ASR_BACKENDS:
+            raise ValueError(
+                f"Unknown ASR backend '{self.config.ASR_BACKEND}'. Available: {', '.join(ASR_BACKENDS)}"
+            )
         self.model = None
         self.timing = {}
     
     def _load_model(self):
-        """Load WhisperX model with optimized settings"""
-        print("🔄 Loading WhisperX model...")
-        start = time.time()
+        """Load the ASR backend (no-op if already loaded)"""
+        if self.model is not None:
+            return
         
-        self.model = whisperx.load_model(
-            self.config.MODEL_NAME,
-            self.config.DEVICE,
-            compute_type=self.config.COMPUTE_TYPE,
-            language=self.config.LANGUAGE,
-            asr_options={
-                "beam_size": self.config.BEAM_SIZE,
-                "best_of": self.config.BEST_OF,
-                "patience": self.config.PATIENCE,
-                "condition_on_previous_text": True,
-                "temperatures": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
-                "compression_ratio_threshold": 2.2,
-                "log_prob_threshold": -0.8,
-                "no_speech_threshold": 0.5,
-                "initial_prompt": "สวัสดีครับ นี่คือการถอดเสียงภาษาไทย",
-                "repetition_penalty": 1.1,
-                "length_penalty": 1.0,
-            },
-            vad_options={
-                "vad_onset": self.config.VAD_ONSET,
-                "vad_offset": self.config.VAD_OFFSET,
-                "min_duration_on": self.config.MIN_DURATION_ON,
-                "min_duration_off": self.config.MIN_DURATION_OFF,
-            },
-        )
+        start = time.time()
+        if self.model_pool is not None:
+            self.model = self.model_pool.get_asr(self.config.TIER)
+        else:
+            print(f"🔄 Loading ASR model ({self.config.ASR_BACKEND})...")
+            print(f"   ⚙️ Profile: {self.config.PROFILE} ({self.config.DEVICE}, {self.config.COMPUTE_TYPE}, batch {self.config.BATCH_SIZE})")
+            print(f"   🎚️ Tier: {self.config.TIER} ({self.config.MODEL_NAME}, beam {self.config.BEAM_SIZE})")
+            self.model = load_asr_model(self.config)
         
         self.timing['model_load'] = time.time() - start
         print(f"   ⏱️ Model loaded: {self.timing['model_load']:.2f}s")
     
-    def process(self, audio_file: str, meeting_type_id: int = 0) -> Dict[str, Any]:
+    def _free_gpu_memory(self):
+        """Reclaim VRAM after dropping a per-job model (pooled models stay resident)"""
+        if self.model_pool is None:
+            clear_gpu_memory()
+    
+    def _transcribe(self, audio) -> Dict[str, Any]:
+        """
+        Run batched ASR, halving the batch size on out-of-memory instead of failing.
+        The reduced batch size is kept for the rest of this pipeline's jobs.
+        Short recordings on a shared model go through the pool's micro-batcher.
+        """
+        if self.model_pool is not None:
+            max_audio = self.config.MICROBATCH_MAX_AUDIO
+            if max_audio and len(audio) / SAMPLE_RATE <= max_audio:
+                # Short recording: share batches with other concurrent jobs
+                return self.model_pool.get_batcher(self.config.TIER).transcribe(audio, language=self.config.LANGUAGE)
+        
+        model_lock = self.model_pool.inference_lock if self.model_pool is not None else nullcontext()
+        while True:
+            try:
+                with model_lock:
+                    return self.model.transcribe(
+                        audio,
+                        batch_size=self.config.BATCH_SIZE,
+                        language=self.config.LANGUAGE,
+                    )
+            except (RuntimeError, MemoryError) as e:
+                if not is_out_of_memory(e) or self.config.BATCH_SIZE <= 1:
+                    raise
+                self.config.BATCH_SIZE = max(1, self.config.BATCH_SIZE // 2)
+                print(f"   ⚠️ Out of memory, retrying with batch size {self.config.BATCH_SIZE}")
+                clear_gpu_memory()
+    
+    def transcribe_window(self, audio) -> str:
+        """
+        Transcribe a short in-memory audio window (used by live streaming).
+        Keeps the model loaded between calls.
+        """
+        self._load_model()
+        result = self._transcribe(audio)
+        return ' '.join(seg.get('text', '').strip() for seg in result.get('segments', []))
+    
+    def _run_gpu_stages(self, audio, job: Optional[Job] = None) -> Dict[str, Any]:
+        """
+        Transcription, diarization and alignment (the stages that need the GPU).
+        With a scheduler job, checks for preemption between stages.
+        """
+        # Step 2: Load model
+        self._load_model()
+        
+        # Step 3: Transcribe
+        print("🎯 Transcribing...")
+        trans_start = time.time()
+        result = self._transcribe(audio)
+        trans_time = time.time() - trans_start
+        print(f"   ⏱️ Transcription: {trans_time:.2f}s")
+        
+        # Step 3b: Re-decode (or drop) repetition loops and low-confidence segments
+        hallucination = None
+        if self.config.HALLUCINATION_FILTER:
+            result['segments'], hallucination = filter_hallucinations(
+                result.get('segments', []),
+                audio,
+                self.model,
+                repetition_threshold=self.config.HALLUCINATION_REPETITION,
+                compression_threshold=self.config.HALLUCINATION_COMPRESSION,
+                logprob_threshold=self.config.HALLUCINATION_LOGPROB,
+                batch_size=self.config.BATCH_SIZE,
+                lock=self.model_pool.inference_lock if self.model_pool is not None else None,
+            )
+            if hallucination['flagged']:
+                print(f"   🔁 Hallucination filter: {hallucination['flagged']} flagged, "
+                      f"{hallucination['redecoded']} re-decoded, {hallucination['dropped']} dropped "
+                      f"({hallucination['redecoded_seconds']:.1f}s re-decoded, {hallucination['time']:.2f}s)")
+        
+        # Extract text for summary
+        combined_text = ' '.join(
+            seg.get('text', '').strip() 
+            for seg in result.get('segments', [])
+        )
+        
+        # Clear transcription model to free VRAM
+        if self.model_pool is None:
+            self.model.unload()
+        self.model = None
+        self._free_gpu_memory()
+        
+        if job is not None:
+            job.checkpoint(remaining_fraction=0.4)
+        
+        # Step 4: Run speaker diarization (first, so the align policy can use the speaker count)
+        diarize_segments = None
+        diarize_time = 0.0
+        if self.config.DIARIZE:
+            print("👥 Running speaker diarization...")
+            diarize_start = time.time()
+            if self.model_pool is not None:
+                diarize_model = self.model_pool.get_diarize()
+            else:
+                diarize_model = load_diarize_model(self.config)
+            diarize_segments = diarize_model(
+                audio,
+                min_speakers=self.config.MIN_SPEAKERS,
+                max_speakers=self.config.MAX_SPEAKERS,
+            )
+            diarize_time = time.time() - diarize_start
+            print(f"   ⏱️ Diarization: {diarize_time:.2f}s")
+            
+            # Clear diarization model
+            del diarize_model
+            self._free_gpu_memory()
+        else:
+            print(f"   ⏭️ Diarization skipped (tier: {self.config.TIER})")
+        
+        if job is not None:
+            job.checkpoint(remaining_fraction=0.1)
+        
+        # Step 5: Align transcript (word-level timestamps for better speaker assignment)
+        print(f"📐 Aligning transcript (policy: {self.config.ALIGN_POLICY})...")
+        result, alignment_info = align_transcript(
+            result,
+            audio,
+            language=self.config.LANGUAGE,
+            device=self.config.DEVICE,
+            policy=self.config.ALIGN_POLICY,
+            num_speakers=count_speakers(diarize_segments) if diarize_segments is not None else 1,
+            cache=self.model_pool.align_cache if self.model_pool is not None else None,
+        )
+        align_time = alignment_info['time']
+        if alignment_info['applied']:
+            print(f"   ⏱️ Alignment: {align_time:.2f}s")
+        elif alignment_info['error']:
+            print(f"   ⚠️ Alignment skipped (will use segment-level timestamps): {alignment_info['error']}")
+        else:
+            saved = alignment_info['estimated_time_saved']
+            saved_note = f", ~{saved:.1f}s saved" if saved is not None else ""
+            print(f"   ⏭️ Alignment skipped ({alignment_info['reason']}{saved_note})")
+        
+        return {
+            'result': result,
+            'combined_text': combined_text,
+            'diarize_segments': diarize_segments,
+            'alignment': alignment_info,
+            'hallucination': hallucination,
+            'transcription': trans_time,
+            'diarization': diarize_time,
+        }
+    
+    def process(self, audio_file: str, meeting_type_id: int = 0, job: Optional[Job] = None,
+                force_refresh: bool = False) -> Dict[str, Any]:
         """
         Process audio file: transcribe and summarize.
         
         Args:
             audio_file: Path to audio file
             meeting_type_id: Meeting type ID (0=auto-detect, 1-11=specific type)
+            job: Scheduler handle; GPU stages wait for a slot and may be preempted
+                 between stages (None = run immediately)
+            force_refresh: Regenerate the summary even if an identical one is cached
         
         Returns structured output with:
         - Full transcript with segments
@@ -92,93 +303,54 @@ class TranscribeSummaryPipeline:
         print(f"📁 Audio file: {audio_file}")
         print()
         
-        # Step 1: Load model
-        self._load_model()
+        # Step 0: Video containers → audio-only file (stream copy), used by every later stage
+        ingest = prepare_audio(audio_file)
+        if ingest['demuxed']:
+            print(f"🎞️ Demuxed {ingest['audio_codec']} audio from video "
+                  f"({ingest['source_bytes'] / 1e6:.0f} MB → {ingest['audio_bytes'] / 1e6:.0f} MB, "
+                  f"{ingest['time']:.2f}s)")
+        try:
+            return self._process_audio(audio_file, ingest, meeting_type_id, job, force_refresh, total_start)
+        except BaseException:
+            # Failed or cancelled: nobody will pick up the demuxed audio
+            if ingest.get('dir'):
+                shutil.rmtree(ingest['dir'], ignore_errors=True)
+            raise
+    
+    def _process_audio(self, source_file: str, ingest: Dict[str, Any], meeting_type_id: int,
+                       job: Optional[Job], force_refresh: bool, total_start: float) -> Dict[str, Any]:
+        """process() after ingest; `ingest['audio_file']` is the audio every stage reads"""
+        audio_file = ingest['audio_file']
         
-        # Step 2: Load audio
+        # Step 1: Load audio (before the model, so the job's cost is known when scheduling)
+        load_ml_stack()
         print("🔄 Loading audio...")
         audio_start = time.time()
         audio = whisperx.load_audio(audio_file)
         audio_time = time.time() - audio_start
         print(f"   ⏱️ Audio loaded: {audio_time:.2f}s")
         
-        # Step 3: Transcribe
-        print("🎯 Transcribing...")
-        trans_start = time.time()
-        result = self.model.transcribe(
-            audio,
-            batch_size=self.config.BATCH_SIZE,
-            language=self.config.LANGUAGE,
-            task="transcribe",
-        )
-        trans_time = time.time() - trans_start
-        print(f"   ⏱️ Transcription: {trans_time:.2f}s")
-        
-        # Extract text for summary
-        combined_text = ' '.join(
-            seg.get('text', '').strip() 
-            for seg in result.get('segments', [])
-        )
-        
-        # Clear transcription model to free VRAM
-        del self.model
-        self.model = None
-        clear_gpu_memory()
-        
-        # Step 4: Align transcript (word-level timestamps for better speaker assignment)
-        print("📐 Aligning transcript (word-level timestamps)...")
-        align_start = time.time()
+        if job is not None:
+            job.set_cost(estimate_cost(len(audio) / SAMPLE_RATE, self.config.MODEL_NAME))
+            print(f"⏳ Waiting for GPU slot (priority {job.priority}, cost {job.cost:.0f})...")
+            job.acquire()
         try:
-            align_model, align_metadata = whisperx.load_align_model(
-                language_code=self.config.LANGUAGE,
-                device=self.config.DEVICE
-            )
-            result = whisperx.align(
-                result["segments"],
-                align_model,
-                align_metadata,
-                audio,
-                self.config.DEVICE,
-                return_char_alignments=False,
-            )
-            align_time = time.time() - align_start
-            print(f"   ⏱️ Alignment: {align_time:.2f}s")
-            
-            # Clear alignment model
-            del align_model
-            clear_gpu_memory()
-        except Exception as e:
-            align_time = 0
-            print(f"   ⚠️ Alignment skipped (will use segment-level timestamps): {e}")
-        
-        # Step 5: Run speaker diarization
-        print("👥 Running speaker diarization...")
-        diarize_start = time.time()
-        try:
-            diarize_model = whisperx.diarize.DiarizationPipeline(
-                use_auth_token=self.config.HF_TOKEN,
-                device=self.config.DEVICE
-            )
-        except TypeError:
-            # Newer pyannote versions use 'token' instead of 'use_auth_token'
-            diarize_model = whisperx.diarize.DiarizationPipeline(
-                token=self.config.HF_TOKEN,
-                device=self.config.DEVICE
-            )
-        diarize_segments = diarize_model(
-            audio,
-            min_speakers=self.config.MIN_SPEAKERS,
-            max_speakers=self.config.MAX_SPEAKERS,
-        )
-        diarize_time = time.time() - diarize_start
-        print(f"   ⏱️ Diarization: {diarize_time:.2f}s")
+            stages = self._run_gpu_stages(audio, job)
+        finally:
+            if job is not None:
+                job.release()
+        result = stages['result']
+        diarize_segments = stages['diarize_segments']
+        alignment_info = stages['alignment']
+        combined_text = stages['combined_text']
+        trans_time = stages['transcription']
+        diarize_time = stages['diarization']
+        align_time = alignment_info['time']
         
         # Assign speakers to segments (with word-level alignment = much better accuracy)
-        result = whisperx.assign_word_speakers(diarize_segments, result)
-        
-        # Clear diarization model
-        del diarize_model
-        clear_gpu_memory()
+        if diarize_segments is not None:
+            result = whisperx.assign_word_speakers(diarize_segments, result)
+        timeline = SpeakerTimeline(intervals_from_diarization(diarize_segments, format_speaker))
         
         # Build speaker summary and transcript with generic speaker labels
         segments = sorted(result.get('segments', []), key=lambda x: x['start'])
@@ -188,12 +360,18 @@ class TranscribeSummaryPipeline:
         
         for segment in segments:
             speaker = format_speaker(segment.get('speaker'))
+            if segment.get('speaker') is None:
+                # WhisperX leaves segments without speaker when no word overlaps a turn exactly
+                speaker = timeline.dominant_speaker(segment['start'], segment['end']) or speaker
             # Keep generic labels (คนพูด 1, คนพูด 2, ...)
             segment['speaker'] = speaker
+            for word in segment.get('words') or ():
+                if word.get('speaker') is not None:
+                    word['speaker'] = format_speaker(word['speaker'])
             
             duration = segment['end'] - segment['start']
             text = segment.get('text', '').strip()
-            word_count = len(text.split())
+            word_count = count_words(text)
             speakers_time[speaker] = speakers_time.get(speaker, 0) + duration
             speakers_words[speaker] = speakers_words.get(speaker, 0) + word_count
             # Build transcript with speaker labels
@@ -204,31 +382,71 @@ class TranscribeSummaryPipeline:
             'speaking_time': speakers_time,
             'word_count': speakers_words,
         }
+        if len(timeline):
+            # Exact times from the diarization turns (overlapping speech counts for everyone speaking)
+            stats = timeline.statistics()
+            speaker_summary.update(stats)
+            speaker_summary['speaking_time'] = merge_speaking_time(speakers_time, stats['speaking_time'])
+            print(f"   🗣️ Overlapping speech: {format_time(stats['total_overlap'])}")
+        
+        # Don't pay for clips and a summary nobody will receive
+        if job is not None:
+            job.raise_if_cancelled()
+        
+        # Playback proxy + peaks from the decoded waveform, encoded on a CPU thread
+        # while clips are cut and the summary API call is in flight
+        playback = {}
+        playback_thread = None
+        if self.config.PLAYBACK_PROXY:
+            playback_thread = threading.Thread(
+                target=self._build_playback, args=(audio, playback), name="playback-proxy", daemon=True
+            )
+            playback_thread.start()
         
-        # Step 4: Extract audio clips per speaker (~10s each)
-        print("🔊 Extracting speaker audio clips...")
-        clip_start = time.time()
-        clip_dir = tempfile.mkdtemp(prefix="speaker_clips_")
-        speaker_clips = extract_speaker_clips(
-            audio_file=audio_file,
-            segments=segments,
-            clip_dir=clip_dir,
-            target_duration=10.0
-        )
-        clip_time = time.time() - clip_start
-        print(f"   ⏱️ Clip extraction: {clip_time:.2f}s")
-        
-        # Step 3: Run summary with diarization data
-        meeting_info = MEETING_TYPES.get(meeting_type_id, MEETING_TYPES[0])
-        print(f"🤖 Running AI Summary ({meeting_info['thai']})...")
-        summary_start = time.time()
-        summary_text = summarize_with_diarization(
-            transcript_with_speakers, 
-            speaker_summary,
-            meeting_type_id=meeting_type_id
-        )
-        summary_time = time.time() - summary_start
-        print(f"   ⏱️ Summary API: {summary_time:.2f}s")
+        clip_dir = None
+        try:
+            # Step 4: Extract audio clips per speaker (~10s each)
+            print("🔊 Extracting speaker audio clips...")
+            clip_start = time.time()
+            clip_dir = tempfile.mkdtemp(prefix="speaker_clips_")
+            speaker_clips = extract_speaker_clips(
+                audio_file=audio_file,
+                segments=segments,
+                clip_dir=clip_dir,
+                target_duration=10.0
+            )
+            clip_time = time.time() - clip_start
+            print(f"   ⏱️ Clip extraction: {clip_time:.2f}s")
+        
+            # Step 3: Run summary with diarization data
+            meeting_info = MEETING_TYPES.get(meeting_type_id, MEETING_TYPES[0])
+            print(f"🤖 Running AI Summary ({meeting_info['thai']})...")
+            summary_text, summary_info = summarize_meeting(
+                transcript_with_speakers, 
+                speaker_summary,
+                meeting_type_id=meeting_type_id,
+                model=self.config.SUMMARY_MODEL,
+                force_refresh=force_refresh,
+            )
+            summary_time = summary_info['time']
+            classification = summary_info['classification']
+            if classification is not None:
+                detected = MEETING_TYPES.get(classification['meeting_type_id'] or 0)
+                print(f"   🏷️ Meeting type: {detected['thai']} ({classification['model']}, {classification['time']:.2f}s)")
+            if summary_info['cache_hit']:
+                print(f"   ⚡ Summary cache hit: {summary_time:.2f}s")
+            else:
+                print(f"   ⏱️ Summary API: {summary_time:.2f}s")
+        except BaseException:
+            # Failed or cancelled: wait for the encoder, then drop the temp files
+            if playback_thread is not None:
+                playback_thread.join()
+            for temp_dir in (playback.get('dir'), clip_dir):
+                if temp_dir:
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+        if playback_thread is not None:
+            playback_thread.join()
         
         total_time = time.time() - total_start
         
@@ -238,19 +456,30 @@ class TranscribeSummaryPipeline:
         
         # Build output
         output = {
-            'audio_file': audio_file,
+            'audio_file': source_file,
             'processing_time': {
+                'ingest': ingest['time'],
                 'model_load': self.timing.get('model_load', 0),
                 'audio_load': audio_time,
                 'transcription': trans_time,
+                'hallucination_filter': stages['hallucination']['time'] if stages['hallucination'] else 0,
                 'alignment': align_time,
                 'diarization': diarize_time,
+                'classification': classification['time'] if classification else 0,
                 'summarization': summary_time,
+                'summary_cache_hit': summary_info['cache_hit'],
                 'clip_extraction': clip_time,
+                'playback': playback.get('time', 0),
                 'total': total_time,
             },
             'audio_length_seconds': audio_length,
             'speed_factor': speed_factor,
+            'hardware': self.config.describe(),
+            'tier': self.config.TIER,
+            'summary_model': self.config.SUMMARY_MODEL,
+            'alignment': alignment_info,
+            'hallucination': stages['hallucination'],
+            'scheduling': job.describe() if job is not None else None,
             'full_transcript': {
                 'segments': segments,
                 'combined_text': combined_text,
@@ -258,12 +487,31 @@ class TranscribeSummaryPipeline:
                 'speaker_summary': speaker_summary,
             },
             'summary': summary_text,
+            'meeting_type_id': summary_info['meeting_type_id'],
             'speaker_clips': speaker_clips,
             'clip_dir': clip_dir,
+            'playback': playback or None,
+            'ingest': ingest,
         }
         
         return output
     
+    def _build_playback(self, audio, playback: Dict[str, Any]):
+        """Encode the playback proxy / seek index / peaks into a temp dir (fills `playback`)"""
+        start = time.time()
+        try:
+            playback_dir = tempfile.mkdtemp(prefix="playback_")
+            playback.update(build_playback(
+                audio, SAMPLE_RATE, playback_dir,
+                bitrate=self.config.PLAYBACK_BITRATE,
+                peaks_per_second=self.config.PEAKS_PER_SECOND,
+            ))
+            playback['dir'] = playback_dir
+        except Exception as e:
+            print(f"   ⚠️ Playback proxy failed: {e}")
+        playback['time'] = time.time() - start
+        print(f"   ⏱️ Playback proxy: {playback['time']:.2f}s")
+    
     def print_results(self, output: Dict[str, Any]):
         """Pretty print the results"""
         print("\n" + "=" * 60)
@@ -272,12 +520,17 @@ class TranscribeSummaryPipeline:
         
         pt = output['processing_time']
         print(f"⏱️ Total processing time: {pt['total']:.2f}s")
+        if output.get('tier'):
+            print(f"   - Tier: {output['tier']}")
         print(f"   - Model load: {pt['model_load']:.2f}s")
         print(f"   - Audio load: {pt['audio_load']:.2f}s")
         print(f"   - Transcription: {pt['transcription']:.2f}s")
+        print(f"   - Hallucination filter: {pt.get('hallucination_filter', 0):.2f}s")
         print(f"   - Alignment: {pt.get('alignment', 0):.2f}s")
         print(f"   - Diarization: {pt['diarization']:.2f}s")
-        print(f"   - Summarization: {pt['summarization']:.2f}s")
+        print(f"   - Classification: {pt.get('classification', 0):.2f}s")
+        print(f"   - Summarization: {pt['summarization']:.2f}s"
+              f"{' (cache hit)' if pt.get('summary_cache_hit') else ''}")
         print(f"   - Audio length: {output['audio_length_seconds']:.1f}s")
         print(f"   - Speed: {output['speed_factor']:.1f}x realtime")
         
@@ -0,0 +1,194 @@
+"""
+GPU job scheduler: priority classes, cost estimates and fair sharing between API keys.
+
+Jobs hold one of `slots` GPU slots while they run their GPU stages (ASR, diarization,
+alignment). Waiting jobs are ordered by priority class first, then by policy:
+- "sjf": shortest (remaining) estimated cost first
+- "wfq": start-time fair queuing per API key, so one key's long uploads can't starve
+         other keys; within a key, jobs run in arrival order
+Between pipeline stages a running job calls `checkpoint()`; if a better-ranked job is
+waiting it gives up its slot and re-queues (preemption at stage boundaries).
+A cancelled job (e.g. its client disconnected) stops at its next wait or stage boundary.
+"""
+import itertools
+import threading
+import time
+from typing import Dict, Optional
+
+SCHEDULER_POLICIES = ("sjf", "wfq")
+
+# Strict priority order (lower = scheduled first)
+PRIORITY_CLASSES = {
+    "interactive": 0,   # Live streams, someone is waiting on screen
+    "normal": 1,
+    "batch": 2,         # Bulk / overnight uploads
+}
+
+# Relative decode cost per audio second (large-v3 = 1.0)
+MODEL_COST = {
+    "large-v3": 1.0,
+    "large-v2": 1.0,
+    "large": 1.0,
+    "large-v3-turbo": 0.5,
+    "medium": 0.5,
+    "small": 0.25,
+    "base": 0.12,
+    "tiny": 0.06,
+}
+
+
+class JobCancelled(Exception):
+    """Raised in the pipeline thread when its job was cancelled"""
+
+
+def estimate_cost(audio_seconds: float, model_name: str) -> float:
+    """Estimated GPU cost of a job: audio duration × model cost"""
+    return audio_seconds * MODEL_COST.get(model_name, 1.0)
+
+
+class Job:
+    """
+    A job's handle on the scheduler. Created by `JobScheduler.submit`; the pipeline
+    sets the cost once the audio length is known, then calls `acquire()`,
+    `checkpoint()` between stages and `release()` when its GPU work is done.
+    """
+
+    def __init__(self, scheduler: "JobScheduler", api_key: str, priority: str, seq: int):
+        self.scheduler = scheduler
+        self.api_key = api_key
+        self.priority = priority
+        self.seq = seq
+        self.cost = 0.0
+        self.remaining_cost = 0.0
+        self.start_tag = 0.0
+        self.running = False
+        self.queue_wait = 0.0
+        self.preemptions = 0
+        self.cancelled = False
+
+    def set_cost(self, cost: float):
+        self.cost = cost
+        self.remaining_cost = cost
+
+    def acquire(self):
+        self.scheduler._acquire(self)
+
+    def cancel(self):
+        """Ask the job to stop (takes effect while queued or at the next stage boundary)"""
+        self.scheduler._cancel(self)
+
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise JobCancelled("Job cancelled")
+
+    def checkpoint(self, remaining_fraction: float):
+        """Stage boundary: update the remaining cost and yield to better-ranked waiting jobs"""
+        self.raise_if_cancelled()
+        self.remaining_cost = self.cost * remaining_fraction
+        self.scheduler._checkpoint(self)
+
+    def release(self):
+        self.scheduler._release(self)
+
+    def describe(self) -> Dict:
+        return {
+            'priority': self.priority,
+            'estimated_cost': round(self.cost, 2),
+            'queue_wait': round(self.queue_wait, 3),
+            'preemptions': self.preemptions,
+            'cancelled': self.cancelled,
+        }
+
+
+class JobScheduler:
+    """Admission control for GPU stages (thread-safe; pipelines run in worker threads)"""
+
+    def __init__(self, slots: int = 1, policy: str = "wfq", key_weights: Optional[Dict[str, float]] = None):
+        if policy not in SCHEDULER_POLICIES:
+            raise ValueError(f"Unknown scheduler policy '{policy}'. Available: {', '.join(SCHEDULER_POLICIES)}")
+        self.slots = max(1, slots)
+        self.policy = policy
+        self.key_weights = key_weights or {}
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._running = 0
+        self._seq = itertools.count()
+        self._virtual_time = 0.0
+        self._last_finish: Dict[str, float] = {}
+
+    def submit(self, api_key: str = "anonymous", priority: str = "normal") -> Job:
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority '{priority}'. Available: {', '.join(PRIORITY_CLASSES)}")
+        return Job(self, api_key or "anonymous", priority, next(self._seq))
+
+    def stats(self) -> Dict:
+        with self._cond:
+            return {
+                'policy': self.policy,
+                'slots': self.slots,
+                'running': self._running,
+                'waiting': len(self._waiting),
+            }
+
+    def _rank(self, job: Job):
+        if self.policy == "sjf":
+            return (PRIORITY_CLASSES[job.priority], job.remaining_cost, job.seq)
+        return (PRIORITY_CLASSES[job.priority], job.start_tag, job.seq)
+
+    def _tag(self, job: Job):
+        """Start-time fair queuing tags: a key's next job starts after its previous one finishes"""
+        weight = self.key_weights.get(job.api_key, 1.0)
+        job.start_tag = max(self._virtual_time, self._last_finish.get(job.api_key, 0.0))
+        self._last_finish[job.api_key] = job.start_tag + job.remaining_cost / weight
+
+    def _acquire(self, job: Job, requeue: bool = False):
+        start = time.time()
+        with self._cond:
+            job.raise_if_cancelled()
+            if not requeue:
+                self._tag(job)  # Preempted jobs keep their original tag
+            self._waiting.append(job)
+            self._dispatch()
+            while not job.running:
+                if job.cancelled:
+                    self._waiting.remove(job)
+                    job.queue_wait += time.time() - start
+                    raise JobCancelled("Job cancelled while queued")
+                self._cond.wait()
+        job.queue_wait += time.time() - start
+
+    def _dispatch(self):
+        """Hand free slots to the best-ranked waiting jobs (caller holds the lock)"""
+        while self._running < self.slots and self._waiting:
+            best = min(self._waiting, key=self._rank)
+            self._waiting.remove(best)
+            best.running = True
+            self._running += 1
+            self._virtual_time = max(self._virtual_time, best.start_tag)
+        self._cond.notify_all()
+
+    def _release(self, job: Job):
+        with self._cond:
+            if job.running:
+                job.running = False
+                self._running -= 1
+            elif job in self._waiting:
+                self._waiting.remove(job)
+            self._dispatch()
+
+    def _cancel(self, job: Job):
+        with self._cond:
+            job.cancelled = True
+            self._cond.notify_all()  # Wake the job if it is waiting for a slot
+
+    def _checkpoint(self, job: Job):
+        with self._cond:
+            if not self._waiting or not job.running:
+                return
+            if min(self._rank(w) for w in self._waiting) >= self._rank(job):
+                return
+            job.running = False
+            self._running -= 1
+            job.preemptions += 1
+        print(f"   ⏸️ Job preempted at stage boundary (priority {job.priority})")
+        self._acquire(job, requeue=True)
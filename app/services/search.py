@@ -0,0 +1,171 @@
+"""
+Transcript search: Thai-aware tokenization on top of an SQLite FTS5 index.
+
+Thai is written without spaces, so Thai runs are indexed as overlapping character
+bigrams ("สวัสดี" → "สว วั ัส สด ดี") and queries become phrase queries over the
+same bigrams, which matches any contiguous substring without needing a dictionary.
+Latin words and numbers are indexed whole (case-folded). FTS5's `ascii` tokenizer
+then just splits on the spaces we insert (`unicode61` would drop Thai vowel marks).
+
+The index lives in the meeting store's database and is updated in the same
+transaction as each meeting save / update / delete; re-indexing a meeting only
+touches that meeting's rows.
+
+Segment ids (the FTS rowids) are `(meeting key << SEGMENT_BITS) + segment index`, where
+the meeting key is the meeting's creation time in milliseconds and is kept when the
+meeting is re-indexed. Walking the FTS index by rowid DESC therefore yields the newest
+meetings first and can stop at LIMIT without sorting every hit.
+"""
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+_THAI_RUN = re.compile(r"[\u0E00-\u0E7F]+")
+_TOKEN_RUN = re.compile(r"[\u0E00-\u0E7F]+|[^\W_\u0E00-\u0E7F]+")
+
+# Segment rows (indexed by meeting for cheap re-indexing) + external-content FTS5 table
+# kept in sync by triggers
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS segment_text (
+    id INTEGER PRIMARY KEY,
+    meeting_id TEXT NOT NULL,
+    speaker TEXT,
+    start REAL,
+    "end" REAL,
+    text TEXT NOT NULL,
+    tokens TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_segment_text_meeting ON segment_text (meeting_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS segment_index USING fts5(
+    tokens,
+    content = 'segment_text',
+    content_rowid = 'id',
+    tokenize = 'ascii'
+);
+CREATE TRIGGER IF NOT EXISTS segment_text_ai AFTER INSERT ON segment_text BEGIN
+    INSERT INTO segment_index (rowid, tokens) VALUES (new.id, new.tokens);
+END;
+CREATE TRIGGER IF NOT EXISTS segment_text_ad AFTER DELETE ON segment_text BEGIN
+    INSERT INTO segment_index (segment_index, rowid, tokens) VALUES ('delete', old.id, old.tokens);
+END;
+"""
+
+SORT_ORDERS = {
+    "recent": "segment_index.rowid DESC",
+    "relevance": "bm25(segment_index)",
+}
+
+SEGMENT_BITS = 20  # Up to ~1M segments per meeting
+
+
+def _thai_tokens(run: str) -> List[str]:
+    if len(run) == 1:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def tokenize(text: str) -> List[List[str]]:
+    """Text → list of runs, each a list of index tokens (Thai bigrams or one word)"""
+    runs = []
+    for match in _TOKEN_RUN.finditer(text or ""):
+        run = match.group()
+        if _THAI_RUN.fullmatch(run):
+            runs.append(_thai_tokens(run))
+        else:
+            runs.append([run.casefold()])
+    return runs
+
+
+def index_text(text: str) -> str:
+    """Space-separated tokens stored in the FTS column"""
+    return " ".join(token for run in tokenize(text) for token in run)
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """
+    FTS5 MATCH expression: every run of the query must appear (AND), each Thai run
+    as a phrase of its bigrams. A single Thai character becomes a prefix query.
+    Returns None for queries without searchable characters.
+    """
+    parts = []
+    for run in tokenize(query):
+        if len(run) == 1 and _THAI_RUN.fullmatch(run[0]) and len(run[0]) == 1:
+            parts.append(f'"{run[0]}"*')
+        else:
+            parts.append('"' + " ".join(run) + '"')
+    return " ".join(parts) or None
+
+
+def _meeting_key(conn, meeting_id: str) -> int:
+    """
+    Creation time in ms from the meetings row (written first in the same transaction),
+    moved past id ranges already used by another meeting created in the same ms
+    """
+    row = conn.execute("SELECT created_at FROM meetings WHERE id = ?", (meeting_id,)).fetchone()
+    key = max(1, int((row[0] if row else time.time()) * 1000))
+    while conn.execute(
+        "SELECT 1 FROM segment_text WHERE id BETWEEN ? AND ? LIMIT 1",
+        (key << SEGMENT_BITS, ((key + 1) << SEGMENT_BITS) - 1),
+    ).fetchone():
+        key += 1
+    return key
+
+
+def index_meeting(conn, meeting_id: str, segments: List[Dict[str, Any]]):
+    """(Re)index one meeting's segments (caller owns the transaction)"""
+    remove_meeting(conn, meeting_id)
+    base = _meeting_key(conn, meeting_id) << SEGMENT_BITS
+    conn.executemany(
+        'INSERT INTO segment_text (id, meeting_id, speaker, start, "end", text, tokens) VALUES (?,?,?,?,?,?,?)',
+        [
+            (base + index, meeting_id, seg.get('speaker'), seg.get('start'), seg.get('end'),
+             (seg.get('text') or '').strip(), index_text(seg.get('text', '')))
+            for index, seg in enumerate(segments)
+        ],
+    )
+
+
+def remove_meeting(conn, meeting_id: str):
+    conn.execute("DELETE FROM segment_text WHERE meeting_id = ?", (meeting_id,))
+
+
+def search(
+    conn,
+    query: str,
+    limit: int = 20,
+    offset: int = 0,
+    speaker: Optional[str] = None,
+    meeting_type_id: Optional[int] = None,
+    sort: str = "recent",
+) -> List[Dict[str, Any]]:
+    """
+    Matching segments, each with its meeting, speaker and timestamp.
+
+    sort="recent" walks the index newest meeting first and stops at `limit` (fast for
+    any query); sort="relevance" ranks by BM25, which has to score every match.
+    """
+    if sort not in SORT_ORDERS:
+        raise ValueError(f"Unknown sort '{sort}'. Available: {', '.join(SORT_ORDERS)}")
+    match = build_match_query(query)
+    if match is None:
+        return []
+
+    sql = (
+        'SELECT s.meeting_id, s.speaker, s.start, s."end", s.text, '
+        "m.audio_file, m.meeting_type_id, m.created_at "
+        "FROM segment_index "
+        "JOIN segment_text s ON s.id = segment_index.rowid "
+        "JOIN meetings m ON m.id = s.meeting_id "
+        "WHERE segment_index MATCH ?"
+    )
+    params: list = [match]
+    if speaker is not None:
+        sql += " AND s.speaker = ?"
+        params.append(speaker)
+    if meeting_type_id is not None:
+        sql += " AND m.meeting_type_id = ?"
+        params.append(meeting_type_id)
+    sql += f" ORDER BY {SORT_ORDERS[sort]} LIMIT ? OFFSET ?"
+    params += [limit, offset]
+
+    return [dict(row) for row in conn.execute(sql, params).fetchall()]
@@ -0,0 +1,198 @@
+"""
+Persistent meeting store (SQLite).
+
+Each processed meeting is one row: listing columns (type, duration, speakers, time)
+are plain indexed columns, and the transcript is a single zlib-compressed columnar
+JSON blob ({"start": [...], "end": [...], "speaker": [...], "text": [...]}), so
+listing thousands of meetings never touches segment data. Segments are also
+indexed for full-text search (FTS5, see search.py).
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from . import search as search_index
+
+DEFAULT_DB_PATH = os.path.join("data", "meetings.db")
+
+SEGMENT_COLUMNS = ("start", "end", "speaker", "text")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    audio_file TEXT NOT NULL,
+    meeting_type_id INTEGER NOT NULL,
+    audio_length_seconds REAL NOT NULL,
+    num_segments INTEGER NOT NULL,
+    speakers TEXT NOT NULL,
+    speaker_summary TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    processing_time TEXT NOT NULL,
+    segments BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_meetings_created ON meetings (created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_meetings_type_created ON meetings (meeting_type_id, created_at DESC);
+"""
+
+# Columns returned by list() (no transcript blob) and by get(include_segments=False)
+_LIST_COLUMNS = (
+    "id", "created_at", "audio_file", "meeting_type_id",
+    "audio_length_seconds", "num_segments", "speakers",
+)
+_DETAIL_COLUMNS = _LIST_COLUMNS + ("speaker_summary", "summary", "processing_time")
+
+
+def pack_segments(segments: List[Dict[str, Any]]) -> bytes:
+    """Segments → compressed columnar JSON (word-level timings are not kept)"""
+    columns = {name: [seg.get(name) for seg in segments] for name in SEGMENT_COLUMNS}
+    columns["start"] = [round(value, 3) for value in columns["start"]]
+    columns["end"] = [round(value, 3) for value in columns["end"]]
+    raw = json.dumps(columns, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(raw, 6)
+
+
+def unpack_segments(blob: bytes) -> List[Dict[str, Any]]:
+    """Inverse of pack_segments"""
+    columns = json.loads(zlib.decompress(blob).decode("utf-8"))
+    return [dict(zip(SEGMENT_COLUMNS, row)) for row in zip(*(columns[name] for name in SEGMENT_COLUMNS))]
+
+
+def transcript_from_segments(segments: List[Dict[str, Any]]) -> str:
+    """Rebuild the "[speaker]: text" transcript the summarizer uses"""
+    return "\n".join(f"[{seg.get('speaker')}]: {(seg.get('text') or '').strip()}" for seg in segments)
+
+
+class MeetingStore:
+    """SQLite-backed store of processed meetings (one connection per operation, WAL mode)"""
+
+    def __init__(self, path: str = None):
+        self.path = path or os.environ.get("MEETING_DB", DEFAULT_DB_PATH)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._write_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            conn.executescript(search_index.SCHEMA)
+            # Backfill the search index for databases created before it existed, or
+            # re-index rows with sequential ids (before ids carried the creation time)
+            indexed = conn.execute("SELECT COUNT(*) FROM segment_text").fetchone()[0]
+            stale = conn.execute(
+                "SELECT 1 FROM segment_text WHERE id < ? LIMIT 1", (1 << search_index.SEGMENT_BITS,)
+            ).fetchone()
+            if (not indexed or stale) and conn.execute("SELECT COUNT(*) FROM meetings").fetchone()[0]:
+                for meeting_id, blob in conn.execute("SELECT id, segments FROM meetings").fetchall():
+                    search_index.index_meeting(conn, meeting_id, unpack_segments(blob))
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, avoids an fsync per save
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def save(self, meeting_id: str, record: Dict[str, Any]) -> str:
+        """
+        Insert or replace a meeting.
+
+        record keys: audio_file, meeting_type_id, audio_length_seconds, segments,
+        speaker_summary, summary, processing_time (optional), created_at (optional)
+        """
+        segments = record['segments']
+        speakers = sorted({seg.get('speaker') for seg in segments if seg.get('speaker')})
+        row = (
+            meeting_id,
+            record.get('created_at', time.time()),
+            record['audio_file'],
+            record['meeting_type_id'],
+            record['audio_length_seconds'],
+            len(segments),
+            json.dumps(speakers, ensure_ascii=False),
+            json.dumps(record['speaker_summary'], ensure_ascii=False),
+            record['summary'],
+            json.dumps(record.get('processing_time') or {}),
+            pack_segments(segments),
+        )
+        with self._write_lock, self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO meetings VALUES (?,?,?,?,?,?,?,?,?,?,?)", row)
+            search_index.index_meeting(conn, meeting_id, segments)
+        return meeting_id
+
+    def update(self, meeting_id: str, segments=None, speaker_summary=None, summary=None) -> bool:
+        """Update transcript / speaker summary / summary (e.g. after renaming speakers)"""
+        fields = {}
+        if segments is not None:
+            fields['segments'] = pack_segments(segments)
+            fields['num_segments'] = len(segments)
+            fields['speakers'] = json.dumps(
+                sorted({seg.get('speaker') for seg in segments if seg.get('speaker')}), ensure_ascii=False
+            )
+        if speaker_summary is not None:
+            fields['speaker_summary'] = json.dumps(speaker_summary, ensure_ascii=False)
+        if summary is not None:
+            fields['summary'] = summary
+        if not fields:
+            return False
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._write_lock, self._connect() as conn:
+            cursor = conn.execute(
+                f"UPDATE meetings SET {assignments} WHERE id = ?", (*fields.values(), meeting_id)
+            )
+            if cursor.rowcount and segments is not None:
+                search_index.index_meeting(conn, meeting_id, segments)
+            return cursor.rowcount > 0
+
+    def list(self, limit: int = 50, offset: int = 0, meeting_type_id: Optional[int] = None) -> Dict[str, Any]:
+        """Newest first, without transcripts: {"total": int, "meetings": [...]}"""
+        where, params = "", []
+        if meeting_type_id is not None:
+            where, params = "WHERE meeting_type_id = ?", [meeting_type_id]
+        with self._connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM meetings {where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT {', '.join(_LIST_COLUMNS)} FROM meetings {where} "
+                f"ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                [*params, limit, offset],
+            ).fetchall()
+        meetings = []
+        for row in rows:
+            item = dict(row)
+            item['speakers'] = json.loads(item['speakers'])
+            meetings.append(item)
+        return {'total': total, 'meetings': meetings}
+
+    def get(self, meeting_id: str, include_segments: bool = True) -> Optional[Dict[str, Any]]:
+        """Full meeting record (segments decompressed), or None"""
+        columns = ", ".join(_DETAIL_COLUMNS + (("segments",) if include_segments else ()))
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT {columns} FROM meetings WHERE id = ?", (meeting_id,)).fetchone()
+        if row is None:
+            return None
+        record = dict(row)
+        for name in ('speakers', 'speaker_summary', 'processing_time'):
+            record[name] = json.loads(record[name])
+        if include_segments:
+            record['segments'] = unpack_segments(record['segments'])
+        return record
+
+    def delete(self, meeting_id: str) -> bool:
+        with self._write_lock, self._connect() as conn:
+            search_index.remove_meeting(conn, meeting_id)
+            return conn.execute("DELETE FROM meetings WHERE id = ?", (meeting_id,)).rowcount > 0
+
+    def search(self, query: str, limit: int = 20, offset: int = 0, speaker: Optional[str] = None,
+               meeting_type_id: Optional[int] = None, sort: str = "recent") -> List[Dict[str, Any]]:
+        """Full-text search over all transcripts (see app/services/search.py)"""
+        with self._connect() as conn:
+            return search_index.search(conn, query, limit, offset, speaker, meeting_type_id, sort)
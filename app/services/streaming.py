@@ -0,0 +1,168 @@
+"""
+Near-real-time transcription over a stream of PCM frames.
+Buffers incoming audio, detects utterance boundaries with an energy VAD,
+and runs rolling-window WhisperX transcription to emit partial and final segments.
+"""
+import wave
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+
+class EnergyVAD:
+    """
+    Lightweight frame-energy voice activity detector for endpointing.
+    Tracks an adaptive noise floor so it works for both quiet rooms and noisy mics.
+    """
+
+    def __init__(self, frame_ms: int = 30, threshold_ratio: float = 3.0, min_rms: float = 0.005):
+        self.frame_size = int(SAMPLE_RATE * frame_ms / 1000)
+        self.threshold_ratio = threshold_ratio
+        self.min_rms = min_rms
+        self.noise_floor = min_rms
+
+    def is_speech(self, frame: np.ndarray) -> bool:
+        """Classify one frame and update the noise floor on non-speech frames"""
+        rms = float(np.sqrt(np.mean(frame * frame))) if len(frame) else 0.0
+        speech = rms > max(self.min_rms, self.noise_floor * self.threshold_ratio)
+        if not speech:
+            # Slow exponential average so short pauses don't raise the floor
+            self.noise_floor = 0.95 * self.noise_floor + 0.05 * max(rms, 1e-4)
+        return speech
+
+
+class StreamingTranscriber:
+    """
+    Rolling-window transcriber for a single live stream.
+
+    Audio is fed as 16 kHz float32 samples. While an utterance is in progress a
+    partial transcript is produced every `partial_interval` seconds; when the VAD
+    sees `endpoint_silence` seconds of silence (or the utterance reaches
+    `max_window`) the window is transcribed once more and emitted as final.
+    """
+
+    def __init__(
+        self,
+        transcribe_fn: Callable[[np.ndarray], str],
+        partial_interval: float = 1.5,
+        endpoint_silence: float = 0.6,
+        max_window: float = 15.0,
+        vad: EnergyVAD = None,
+    ):
+        self.transcribe_fn = transcribe_fn
+        self.partial_interval = partial_interval
+        self.endpoint_silence = endpoint_silence
+        self.max_window = max_window
+        self.vad = vad or EnergyVAD()
+
+        self._chunks: List[np.ndarray] = []   # Full recording (for final pipeline run)
+        self._pending = np.zeros(0, dtype=np.float32)  # Samples not yet classified by VAD
+        self._utterance: List[np.ndarray] = []
+        self._utterance_start: Optional[float] = None
+        self._utterance_samples = 0
+        self._silence_samples = 0
+        self._since_partial = 0
+        self.total_samples = 0
+
+    @property
+    def audio(self) -> np.ndarray:
+        """Full received audio as a single array"""
+        if not self._chunks:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(self._chunks)
+
+    def feed(self, samples: np.ndarray) -> List[Dict[str, Any]]:
+        """Add samples and return any partial/final events they produced"""
+        self._chunks.append(samples)
+        self._pending = np.concatenate([self._pending, samples])
+
+        events = []
+        frame_size = self.vad.frame_size
+        offset = 0
+        while len(self._pending) - offset >= frame_size:
+            frame = self._pending[offset:offset + frame_size]
+            offset += frame_size
+            event = self._process_frame(frame)
+            if event:
+                events.append(event)
+        self._pending = self._pending[offset:]
+        return events
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """Finalize any in-progress utterance at end of stream"""
+        if len(self._pending):
+            if self._utterance_start is not None:
+                self._utterance.append(self._pending)
+            self.total_samples += len(self._pending)
+            self._pending = np.zeros(0, dtype=np.float32)
+        event = self._finalize_utterance()
+        return [event] if event else []
+
+    def _process_frame(self, frame: np.ndarray) -> Optional[Dict[str, Any]]:
+        speech = self.vad.is_speech(frame)
+        frame_start = self.total_samples / SAMPLE_RATE
+        self.total_samples += len(frame)
+
+        if self._utterance_start is None:
+            if not speech:
+                return None
+            self._utterance_start = frame_start
+
+        self._utterance.append(frame)
+        self._utterance_samples += len(frame)
+        self._since_partial += len(frame)
+        self._silence_samples = 0 if speech else self._silence_samples + len(frame)
+
+        if (self._silence_samples >= self.endpoint_silence * SAMPLE_RATE
+                or self._utterance_samples >= self.max_window * SAMPLE_RATE):
+            return self._finalize_utterance()
+
+        if self._since_partial >= self.partial_interval * SAMPLE_RATE:
+            self._since_partial = 0
+            return self._make_event('partial')
+        return None
+
+    def _make_event(self, event_type: str) -> Optional[Dict[str, Any]]:
+        window = np.concatenate(self._utterance)
+        text = self.transcribe_fn(window).strip()
+        if not text:
+            return None
+        return {
+            'type': event_type,
+            'start': self._utterance_start,
+            'end': self._utterance_start + len(window) / SAMPLE_RATE,
+            'text': text,
+        }
+
+    def _finalize_utterance(self) -> Optional[Dict[str, Any]]:
+        event = self._make_event('final') if self._utterance else None
+        self._utterance = []
+        self._utterance_start = None
+        self._utterance_samples = 0
+        self._silence_samples = 0
+        self._since_partial = 0
+        return event
+
+
+def pcm16_to_float32(data: bytes, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Convert little-endian 16-bit mono PCM to 16 kHz float32 samples"""
+    samples = np.frombuffer(data, dtype='<i2').astype(np.float32) / 32768.0
+    if sample_rate != SAMPLE_RATE and len(samples):
+        # Linear resample — good enough for speech recognition input
+        target_len = int(round(len(samples) * SAMPLE_RATE / sample_rate))
+        positions = np.linspace(0, len(samples) - 1, num=target_len)
+        samples = np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+    return samples
+
+
+def write_wav(path: str, samples: np.ndarray) -> str:
+    """Write 16 kHz float32 samples as a 16-bit mono WAV file"""
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype('<i2')
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(pcm.tobytes())
+    return path
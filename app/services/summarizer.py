@@ -1,12 +1,30 @@
 import requests
 import os
+import re
+import time
+from typing import Any, Dict, Optional, Tuple
+
 from ..models.meeting import MEETING_TYPES, get_meeting_focus_prompt
+from .summary_cache import SummaryCache, get_summary_cache, summary_cache_key
 
 # NTC AI Gateway API configuration
 # Note: In a real OOP app, this might be injected from a config
 NTC_API_KEY = os.getenv("NTC_API_KEY")
 NTC_API_URL = os.getenv("NTC_API_URL", "https://aigateway.ntictsolution.com/v1/chat/completions")
 
+# Bump whenever the summary prompt templates change (invalidates cached summaries)
+PROMPT_VERSION = "2026-10-2"
+SUMMARY_TEMPERATURE = 0.4
+SUMMARY_MAX_TOKENS = 4000
+
+# Auto-detect (meeting_type_id=0) first asks a cheap model for the type from a short
+# transcript sample, so the main call gets that type's focused prompt instead of the
+# full type table. Empty CLASSIFY_MODEL = single-pass auto-detect prompt.
+CLASSIFY_MODEL = os.getenv("CLASSIFY_MODEL", "gpt-4.1-mini")
+CLASSIFY_SAMPLE_TURNS = 12      # Turns from the start + the same number from the middle
+CLASSIFY_MAX_TURN_CHARS = 200
+CLASSIFY_MAX_TOKENS = 4
+
 def get_meeting_type_prompt(meeting_type_id: int) -> str:
     """Get the prompt instruction for a specific meeting type"""
     if meeting_type_id == 0:
@@ -36,19 +54,64 @@ def get_meeting_type_prompt(meeting_type_id: int) -> str:
 สรุปเนื้อหาตามโครงสร้างข้างต้น โดยเน้นความละเอียดในประเด็นหัวใจหลัก"""
 
 
-def summarize_with_diarization(
-    transcript_with_speakers: str,
-    speaker_summary: dict,
-    meeting_type_id: int = 0,
-    language: str = "Thai"
-) -> str:
-    """Summarize transcription with speaker diarization data."""
-    if not NTC_API_KEY:
-        return "Error: NTC_API_KEY not found in environment variables"
-    
-    # Build speaker info string
+def classification_sample(transcript_with_speakers: str, turns: int = CLASSIFY_SAMPLE_TURNS) -> str:
+    """First and middle `turns` lines of the transcript, each cut to CLASSIFY_MAX_TURN_CHARS"""
+    lines = [line for line in transcript_with_speakers.splitlines() if line.strip()]
+    if len(lines) > 2 * turns:
+        middle = len(lines) // 2
+        lines = lines[:turns] + ["..."] + lines[middle:middle + turns]
+    return "\n".join(line[:CLASSIFY_MAX_TURN_CHARS] for line in lines)
+
+
+def classify_meeting_type(transcript_with_speakers: str, model: str = None) -> Dict[str, Any]:
+    """
+    Cheap first phase of auto-detect: meeting type from a transcript sample.
+    Returns {'meeting_type_id' (None if undecided), 'model', 'time'}.
+    """
+    start = time.time()
+    model = model or CLASSIFY_MODEL
+    types_list = "\n".join(
+        f"{num}. {info['name']} ({info['thai']})" for num, info in MEETING_TYPES.items() if num > 0
+    )
+    payload = {
+        "model": model,
+        "messages": [
+            {
+                "role": "system",
+                "content": f"""จัดประเภทการประชุมจากตัวอย่างบทสนทนา ตอบเป็นตัวเลขประเภทเพียงตัวเดียว
+
+{types_list}"""
+            },
+            {"role": "user", "content": classification_sample(transcript_with_speakers)},
+        ],
+        "temperature": 0,
+        "max_tokens": CLASSIFY_MAX_TOKENS,
+    }
+    meeting_type_id = None
+    if NTC_API_KEY:
+        try:
+            response = requests.post(
+                NTC_API_URL,
+                headers={"Authorization": f"Bearer {NTC_API_KEY}", "Content-Type": "application/json"},
+                json=payload,
+                timeout=30,
+            )
+            response.raise_for_status()
+            match = re.search(r"\d+", response.json()["choices"][0]["message"]["content"])
+            if match and int(match.group()) in MEETING_TYPES and int(match.group()) > 0:
+                meeting_type_id = int(match.group())
+        except (requests.exceptions.RequestException, KeyError, IndexError, ValueError) as e:
+            print(f"   ⚠️ Meeting type classification failed (using auto-detect prompt): {e}")
+    return {'meeting_type_id': meeting_type_id, 'model': model, 'time': time.time() - start}
+
+
+def build_speaker_info(speaker_summary: dict) -> str:
+    """Per-speaker time / share / words (+ turn-taking stats) lines for the prompt"""
     speakers_time = speaker_summary.get('speaking_time', {})
     speakers_words = speaker_summary.get('word_count', {})
+    speakers_overlap = speaker_summary.get('overlap_time', {})
+    speakers_turns = speaker_summary.get('turns', {})
+    speakers_interruptions = speaker_summary.get('interruptions', {})
     total_time = sum(speakers_time.values()) if speakers_time else 1
     
     speaker_info_lines = []
@@ -57,10 +120,89 @@ def summarize_with_diarization(
         words = speakers_words.get(speaker, 0)
         mins = int(time_sec // 60)
         secs = int(time_sec % 60)
-        speaker_info_lines.append(f"- {speaker}: {mins}:{secs:02d} ({pct:.1f}%), {words} คำ")
+        line = f"- {speaker}: {mins}:{secs:02d} ({pct:.1f}%), {words} คำ"
+        if speaker in speakers_turns:
+            # Turn-taking stats from the diarization timeline (who drives / interrupts the discussion)
+            line += (
+                f", พูด {speakers_turns[speaker]} ครั้ง"
+                f", พูดแทรก {speakers_interruptions.get(speaker, 0)} ครั้ง"
+                f", พูดซ้อน {speakers_overlap.get(speaker, 0):.0f} วินาที"
+            )
+        speaker_info_lines.append(line)
+    
+    return "\n".join(speaker_info_lines)
+
+
+def summarize_meeting(
+    transcript_with_speakers: str,
+    speaker_summary: dict,
+    meeting_type_id: int = 0,
+    language: str = "Thai",
+    model: str = "gpt-4.1",
+    force_refresh: bool = False,
+    cache: Optional[SummaryCache] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Summarize transcription with speaker diarization data, through the summary cache.
+    
+    With meeting_type_id=0 the type is classified first (classify_meeting_type) and the
+    main call uses that type's focused prompt.
+    
+    Returns (summary, info) with info = {'cache_hit', 'meeting_type_id' (the type the
+    summary was written for, 0 = undecided), 'classification' (None if not run), 'time'}.
+    `force_refresh` skips the cache lookup (the new summary still replaces the cached
+    one). Errors are not cached.
+    """
+    start = time.time()
+    cache = cache or get_summary_cache()
+    speaker_info = build_speaker_info(speaker_summary)
+    # Auto-detect summaries also depend on which model picked the meeting type
+    key = summary_cache_key(
+        transcript_with_speakers, speaker_info, meeting_type_id, PROMPT_VERSION, model, SUMMARY_TEMPERATURE,
+        language, classify_model=CLASSIFY_MODEL if meeting_type_id == 0 else "",
+    )
+    entry = None if force_refresh else cache.get(key)
+    classification = None
+    if entry is not None:
+        summary = entry['summary']
+        resolved_type = entry.get('meeting_type_id', meeting_type_id)
+    else:
+        resolved_type = meeting_type_id
+        if meeting_type_id == 0 and CLASSIFY_MODEL:
+            classification = classify_meeting_type(transcript_with_speakers)
+            resolved_type = classification['meeting_type_id'] or 0
+        summary = _summarize(transcript_with_speakers, speaker_summary, speaker_info, resolved_type, language, model)
+        if not summary.startswith("Error"):
+            cache.set(key, summary, model=model, meeting_type_id=resolved_type)
+    return summary, {
+        'cache_hit': entry is not None,
+        'meeting_type_id': resolved_type,
+        'classification': classification,
+        'time': time.time() - start,
+    }
+
+
+def summarize_with_diarization(
+    transcript_with_speakers: str,
+    speaker_summary: dict,
+    meeting_type_id: int = 0,
+    language: str = "Thai",
+    model: str = "gpt-4.1",
+    force_refresh: bool = False,
+) -> str:
+    """Summarize transcription with speaker diarization data."""
+    return summarize_meeting(
+        transcript_with_speakers, speaker_summary, meeting_type_id, language, model, force_refresh
+    )[0]
+
+
+def _summarize(transcript_with_speakers: str, speaker_summary: dict, speaker_info: str,
+               meeting_type_id: int, language: str, model: str) -> str:
+    """One gateway call (no cache)"""
+    if not NTC_API_KEY:
+        return "Error: NTC_API_KEY not found in environment variables"
     
-    speaker_info = "\n".join(speaker_info_lines)
-    num_speakers = len(speakers_time)
+    num_speakers = len(speaker_summary.get('speaking_time', {}))
     
     # Get meeting type instruction
     meeting_type_instruction = get_meeting_type_prompt(meeting_type_id)
@@ -72,7 +214,7 @@ def summarize_with_diarization(
     }
     
     payload = {
-        "model": "gpt-4.1",
+        "model": model,
         "messages": [
             {
                 "role": "system",
@@ -115,8 +257,8 @@ def summarize_with_diarization(
 {transcript_with_speakers}"""
             }
         ],
-        "temperature": 0.4,
-        "max_tokens": 4000
+        "temperature": SUMMARY_TEMPERATURE,
+        "max_tokens": SUMMARY_MAX_TOKENS
     }
     
     try:
@@ -0,0 +1,133 @@
+"""
+On-disk cache of LLM summaries.
+
+Re-exports, UI reloads, resummarize-after-rename with unchanged names and identical
+re-uploads send exactly the same prompt to the gateway. Summaries are stored under a
+SHA-256 of everything that determines the output: the whitespace-compacted transcript,
+the speaker info block, meeting type, prompt template version, model and temperature
+(plus the classifier model when the type is auto-detected).
+Entries expire after SUMMARY_CACHE_TTL seconds (0 disables the cache); each entry is one
+small JSON file, written atomically, so several server processes can share the directory.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_DIR = os.path.join("data", "summary_cache")
+DEFAULT_TTL = 7 * 24 * 3600
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def summary_cache_key(transcript: str, speaker_info: str, meeting_type_id: int,
+                      prompt_version: str, model: str, temperature: float, language: str = "Thai",
+                      classify_model: str = "") -> str:
+    """Hex SHA-256 over the summary inputs (transcript whitespace-normalized)"""
+    material = json.dumps(
+        [_WHITESPACE.sub(" ", transcript).strip(), speaker_info, meeting_type_id,
+         prompt_version, model, temperature, language, classify_model],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """Summary text by cache key, one JSON file per entry (<dir>/<key[:2]>/<key>.json)"""
+
+    def __init__(self, root: str = None, ttl: float = None):
+        self.root = root or os.environ.get("SUMMARY_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.ttl = ttl if ttl is not None else float(os.environ.get("SUMMARY_CACHE_TTL", DEFAULT_TTL))
+        self.stats = {"hits": 0, "misses": 0, "writes": 0}
+        self._stats_lock = threading.Lock()  # Shared by every request thread
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key + ".json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached {'summary', 'model', 'meeting_type_id', 'created_at'}; None if missing / expired / disabled"""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+        if time.time() - entry.get("created_at", 0) > self.ttl:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self._count("misses")
+            return None
+        self._count("hits")
+        return entry
+
+    def set(self, key: str, summary: str, model: str = None, meeting_type_id: int = None):
+        """Store an entry (best effort: a read-only or full disk only costs the cache)"""
+        if not self.enabled:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"created_at": time.time(), "model": model, "meeting_type_id": meeting_type_id,
+                           "summary": summary}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)  # Atomic: readers never see a partial entry
+        except OSError as e:
+            print(f"   ⚠️ Summary cache write failed: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self._count("writes")
+
+    def _count(self, name: str):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        """Consistent copy of the counters"""
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def prune(self) -> int:
+        """Delete expired entries; returns how many were removed (none while disabled)"""
+        if not self.enabled or not os.path.isdir(self.root):
+            return 0
+        cutoff = time.time() - self.ttl
+        removed = 0
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                path = os.path.join(directory, name)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except OSError:
+                    pass
+        return removed
+
+
+_summary_cache: Optional[SummaryCache] = None
+_summary_cache_lock = threading.Lock()
+
+
+def get_summary_cache() -> SummaryCache:
+    """Process-wide cache (created on first use)"""
+    global _summary_cache
+    with _summary_cache_lock:
+        if _summary_cache is None:
+            _summary_cache = SummaryCache()
+        return _summary_cache
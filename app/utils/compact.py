@@ -0,0 +1,112 @@
+"""
+Compact transcript payloads for the API.
+
+Raw WhisperX segments repeat every key per segment and carry per-word arrays with
+scores, so a long meeting serializes to tens of MB. The compact form is columnar:
+one array per field, speakers dictionary-encoded, times rounded to milliseconds,
+and word-level data only when asked for (flattened, with per-segment offsets).
+"""
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+TIME_DECIMALS = 3
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(float(value), TIME_DECIMALS)
+
+
+def compact_segments(segments: List[Dict[str, Any]], include_words: bool = False) -> Dict[str, Any]:
+    """
+    Segments → columns:
+        {"speakers": [...], "start": [...], "end": [...], "speaker": [index, ...], "text": [...]}
+    With include_words, also "words": {"offsets": [n+1 ints], "word", "start", "end", "score"}
+    where segment i's words are the slice offsets[i]:offsets[i+1].
+    """
+    speakers: List[str] = []
+    speaker_index: Dict[str, int] = {}
+    columns: Dict[str, list] = {"start": [], "end": [], "speaker": [], "text": []}
+    words: Dict[str, list] = {"offsets": [0], "word": [], "start": [], "end": [], "score": []}
+
+    for seg in segments:
+        speaker = seg.get("speaker")
+        if speaker is None:
+            columns["speaker"].append(None)
+        else:
+            if speaker not in speaker_index:
+                speaker_index[speaker] = len(speakers)
+                speakers.append(speaker)
+            columns["speaker"].append(speaker_index[speaker])
+        columns["start"].append(_round(seg.get("start")))
+        columns["end"].append(_round(seg.get("end")))
+        columns["text"].append((seg.get("text") or "").strip())
+
+        if include_words:
+            for word in seg.get("words") or []:
+                words["word"].append(word.get("word", ""))
+                words["start"].append(_round(word.get("start")))
+                words["end"].append(_round(word.get("end")))
+                score = word.get("score")
+                words["score"].append(None if score is None else round(float(score), 3))
+            words["offsets"].append(len(words["word"]))
+
+    payload = {"speakers": speakers, **columns}
+    if include_words:
+        payload["words"] = words
+    return payload
+
+
+def expand_segments(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Inverse of compact_segments (row dicts; words included when present)"""
+    speakers = payload["speakers"]
+    words = payload.get("words")
+    rows = []
+    for i, (start, end, speaker, text) in enumerate(
+        zip(payload["start"], payload["end"], payload["speaker"], payload["text"])
+    ):
+        row = {"start": start, "end": end, "speaker": None if speaker is None else speakers[speaker], "text": text}
+        if words is not None:
+            lo, hi = words["offsets"][i], words["offsets"][i + 1]
+            row["words"] = [
+                {"word": words["word"][j], "start": words["start"][j], "end": words["end"][j], "score": words["score"][j]}
+                for j in range(lo, hi)
+            ]
+        rows.append(row)
+    return rows
+
+
+def segment_page(
+    segments: List[Dict[str, Any]],
+    offset: int = 0,
+    limit: int = 500,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Select a page of segments, optionally restricted to those overlapping [start, end)
+    seconds first. Returns {"total", "offset", "limit", "next_offset", "segments"}.
+    """
+    if start is not None or end is not None:
+        lo = start if start is not None else float("-inf")
+        hi = end if end is not None else float("inf")
+        segments = [seg for seg in segments if seg["end"] > lo and seg["start"] < hi]
+    page = segments[offset:offset + limit]
+    next_offset = offset + len(page)
+    return {
+        "total": len(segments),
+        "offset": offset,
+        "limit": limit,
+        "next_offset": next_offset if next_offset < len(segments) else None,
+        "segments": page,
+    }
+
+
+def encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Compact JSON body (no whitespace, Thai kept as UTF-8)"""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def payload_etag(body: bytes) -> str:
+    """Strong ETag for an encoded body"""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
@@ -1,7 +1,10 @@
 import os
 import re
+import json
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from xml.sax.saxutils import escape as xml_escape
+from ..models.meeting import MEETING_TYPES
 from ..utils.formatting import format_speaker as default_format_speaker_func, format_time
 
 # Check for python-docx availability
@@ -9,17 +12,92 @@ try:
     from docx import Document
     from docx.shared import Pt
     from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls, qn
+    from lxml import etree
     DOCX_AVAILABLE = True
 except ImportError:
     DOCX_AVAILABLE = False
 
+# Fast table path: rows are serialized as raw WordprocessingML and parsed in batches
+# instead of going through python-docx's per-cell object model
+_ROW_BATCH_SIZE = 2000
+_XML_INVALID_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+_RUN_BREAKS = re.compile(r'(\n|\t)')
+
+# Lightweight text export formats (streamed straight from the segment list)
+TEXT_EXPORT_FORMATS = {
+    'srt': {'media_type': 'application/x-subrip', 'extension': 'srt'},
+    'vtt': {'media_type': 'text/vtt', 'extension': 'vtt'},
+    'jsonl': {'media_type': 'application/x-ndjson', 'extension': 'jsonl'},
+    'markdown': {'media_type': 'text/markdown', 'extension': 'md'},
+}
+
+# Position templates based on meeting type
+POSITION_TEMPLATES = {
+    0: {"leader": "ประธาน", "main": "ผู้นำเสนอ", "participant": "ผู้เข้าร่วม"},
+    1: {"leader": "ประธาน", "main": "กรรมการ", "participant": "ผู้ถือหุ้น"},  # Shareholder
+    2: {"leader": "ประธาน", "main": "กรรมการ", "participant": "ผู้เข้าร่วม"},  # Board
+    3: {"leader": "ผู้จัดการโครงการ", "main": "ผู้รับผิดชอบ", "participant": "ทีมงาน"},  # Planning
+    4: {"leader": "ผู้รายงาน", "main": "ผู้รับผิดชอบ", "participant": "ผู้เข้าร่วม"},  # Progress
+    5: {"leader": "ผู้บริหาร", "main": "ผู้นำเสนอ", "participant": "ผู้เข้าร่วม"},  # Strategy
+    6: {"leader": "หัวหน้าทีม", "main": "ผู้เกี่ยวข้อง", "participant": "ผู้เข้าร่วม"},  # Incident
+    7: {"leader": "ผู้แทนบริษัท", "main": "ผู้นำเสนอ", "participant": "ลูกค้า"},  # Client
+    8: {"leader": "ผู้บรรยาย", "main": "ผู้ช่วยบรรยาย", "participant": "ผู้เข้าร่วม"},  # Workshop
+    9: {"leader": "ประธาน", "main": "ผู้บริหาร", "participant": "ผู้เข้าร่วม"},  # Executive
+    10: {"leader": "หัวหน้าทีม", "main": "ผู้นำเสนอ", "participant": "สมาชิกทีม"},  # Team
+    11: {"leader": "ประธาน", "main": "ผู้นำเสนอ", "participant": "ผู้เข้าร่วม"},  # General
+}
+
+# Header mapping for structured sections (bold-line headers in the GPT summary)
+SECTION_HEADERS = {
+    'ประเภท': 1,
+    'ผู้เข้าร่วมประชุม': 1,
+    'สรุปการประชุม': 1,
+    'การสั่งงาน': 1,
+    'มอบหมาย': 1,
+    'คำถามสำคัญ': 1,
+    'ข้อตกลง': 1,
+    'มติ': 1,
+    'สถานะ': 2,
+    'ความคืบหน้า': 2,
+    'ปัญหา': 2,
+    'แนวทางแก้': 2,
+    'งานถัดไป': 2,
+    'นโยบาย': 2,
+    'การอนุมัติ': 2,
+}
+
+# Markdown tokenizer, compiled once per process
+_EMOJI_PATTERN = re.compile("["
+    u"\U0001F600-\U0001F64F"  # emoticons
+    u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+    u"\U0001F680-\U0001F6FF"  # transport & map symbols
+    u"\U0001F1E0-\U0001F1FF"  # flags
+    u"\U00002702-\U000027B0"
+    u"\U000024C2-\U0001F251"
+    u"\U0001f926-\U0001f937"
+    u"\U00010000-\U0010ffff"
+    "]+", flags=re.UNICODE)
+_SECTION_HEADER_PATTERN = re.compile('|'.join(map(re.escape, SECTION_HEADERS)))
+_BLOCK_PATTERN = re.compile(
+    r'^(?:(?P<heading>#{1,6})[ \t]*'
+    r'|(?P<bullet>[-*•+])[ \t]+'
+    r'|(?P<number>\d{1,3}[.)])[ \t]+)?'
+    r'(?P<text>.*?)[ \t]*$'
+)
+_BOLD_LINE_PATTERN = re.compile(r'^\*\*([^*]+)\*\*:?$')
+_INLINE_BOLD_PATTERN = re.compile(r'(\*\*[^*]+\*\*)')
+_RULE_PATTERN = re.compile(r'^(?:-{3,}|\*{3,}|_{3,})$')
+_MAX_LIST_LEVEL = 3
+
 
 def _add_formatted_text(paragraph, text: str):
     """Helper function to add text with markdown bold formatting to a paragraph."""
     # Split by bold markers (**text**)
-    parts = re.split(r'(\*\*[^*]+\*\*)', text)
-    
-    for part in parts:
+    for part in _INLINE_BOLD_PATTERN.split(text):
+        if not part:
+            continue
         if part.startswith('**') and part.endswith('**'):
             run = paragraph.add_run(part[2:-2])
             run.bold = True
@@ -27,15 +105,89 @@ def _add_formatted_text(paragraph, text: str):
             paragraph.add_run(part)
 
 
+def _resolve_speaker(segment: Dict, format_speaker) -> str:
+    """Use speaker name as-is (already mapped by pipeline), formatting raw SPEAKER_XX labels"""
+    speaker = segment.get('speaker', '') or ''
+    if not speaker or speaker.startswith('SPEAKER_'):
+        speaker = format_speaker(segment.get('speaker'))
+    return speaker
+
+
+def _run_xml(text: str) -> str:
+    """Build a w:r element for text the same way python-docx does (newline -> w:br, tab -> w:tab)."""
+    parts = []
+    for piece in _RUN_BREAKS.split(_XML_INVALID_CHARS.sub('', text)):
+        if piece == '\n':
+            parts.append('<w:br/>')
+        elif piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece:
+            space = ' xml:space="preserve"' if piece[0].isspace() or piece[-1].isspace() else ''
+            parts.append(f'<w:t{space}>{xml_escape(piece)}</w:t>')
+    return f"<w:r>{''.join(parts)}</w:r>" if parts else ''
+
+
+def _append_text_run(paragraph, text: str):
+    """Append a plain run to a paragraph without python-docx's per-character text handling."""
+    run = paragraph._p.add_r()
+    for piece in _RUN_BREAKS.split(_XML_INVALID_CHARS.sub('', text)):
+        if piece == '\n':
+            etree.SubElement(run, qn('w:br'))
+        elif piece == '\t':
+            etree.SubElement(run, qn('w:tab'))
+        elif piece:
+            t = etree.SubElement(run, qn('w:t'))
+            t.text = piece
+            if piece[0].isspace() or piece[-1].isspace():
+                t.set(qn('xml:space'), 'preserve')
+
+
+def _append_table_rows(table, rows: Iterable[Sequence[str]]):
+    """
+    Append text rows to a python-docx table in bulk.
+    
+    Produces the same XML as table.add_row() + cell.text, but builds it as a string
+    and parses it once per batch, so cost stays linear for tens of thousands of rows.
+    """
+    tbl = table._tbl
+    cell_props = [
+        f'<w:tcPr><w:tcW w:type="dxa" w:w="{grid_col.get(qn("w:w"))}"/></w:tcPr>'
+        if grid_col.get(qn("w:w")) else ''
+        for grid_col in tbl.tblGrid.gridCol_lst
+    ]
+    
+    def flush(batch):
+        fragment = parse_xml(f"<w:tbl {nsdecls('w')}>{''.join(batch)}</w:tbl>")
+        tbl.extend(list(fragment))
+    
+    batch = []
+    for row in rows:
+        cells = ''.join(
+            f"<w:tc>{props}<w:p>{_run_xml(text)}</w:p></w:tc>"
+            for props, text in zip(cell_props, row)
+        )
+        batch.append(f"<w:tr>{cells}</w:tr>")
+        if len(batch) >= _ROW_BATCH_SIZE:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+
 def export_transcript_to_docx(
     segments: List[Dict],
     output_path: str,
     audio_file: str = None,
     audio_length: float = None,
-    format_speaker_func = None
+    format_speaker_func = None,
+    fast: bool = True
 ) -> str:
     """
     Export raw transcript from WhisperX to DOCX file.
+    
+    Args:
+        fast: Build table rows as raw XML in batches (default). Set False to use
+              python-docx table.add_row() per segment (slow for long meetings).
     """
     if not DOCX_AVAILABLE:
         return "Error: python-docx not installed. Run: pip install python-docx"
@@ -83,22 +235,24 @@ def export_transcript_to_docx(
             for run in paragraph.runs:
                 run.bold = True
     
-    # Add segments
+    # Sort once and resolve speaker labels (used by both the table and combined text)
+    rows = []
     for segment in sorted(segments, key=lambda x: x.get('start', 0)):
-        row = table.add_row().cells
-        
-        start = segment.get('start', 0)
-        end = segment.get('end', 0)
-        # Use speaker name as-is (already mapped by pipeline)
-        speaker = segment.get('speaker', '') or ''
-        if not speaker or speaker.startswith('SPEAKER_'):
-            speaker = format_speaker(segment.get('speaker'))
-        text = segment.get('text', '').strip()
-        
-        row[0].text = format_time(start)
-        row[1].text = format_time(end)
-        row[2].text = speaker
-        row[3].text = text
+        rows.append((
+            format_time(segment.get('start', 0)),
+            format_time(segment.get('end', 0)),
+            _resolve_speaker(segment, format_speaker),
+            segment.get('text', '').strip(),
+        ))
+    
+    # Add segments
+    if fast:
+        _append_table_rows(table, rows)
+    else:
+        for row_values in rows:
+            row = table.add_row().cells
+            for cell, value in zip(row, row_values):
+                cell.text = value
     
     # Add Combined Text section
     doc.add_paragraph()
@@ -109,13 +263,7 @@ def export_transcript_to_docx(
     current_speaker = None
     current_text = []
     
-    for segment in sorted(segments, key=lambda x: x.get('start', 0)):
-        # Use speaker name as-is (already mapped by pipeline)
-        speaker = segment.get('speaker', '') or ''
-        if not speaker or speaker.startswith('SPEAKER_'):
-            speaker = format_speaker(segment.get('speaker'))
-        text = segment.get('text', '').strip()
-        
+    for _, _, speaker, text in rows:
         if speaker == current_speaker:
             current_text.append(text)
         else:
@@ -130,13 +278,119 @@ def export_transcript_to_docx(
     
     # Add combined text to document
     combined_text = "\n\n".join(combined_lines)
-    p = doc.add_paragraph(combined_text)
+    if fast:
+        _append_text_run(doc.add_paragraph(), combined_text)
+    else:
+        doc.add_paragraph(combined_text)
     
     # Save document
     doc.save(output_path)
     return output_path
 
 
+def _remove_emoji(text: str) -> str:
+    """Remove emoji from text"""
+    return _EMOJI_PATTERN.sub('', text).strip()
+
+
+def _list_style(base: str, level: int) -> str:
+    """Word list style name for a nesting level (List Bullet, List Bullet 2, ...)"""
+    return base if level <= 1 else f"{base} {level}"
+
+
+def _add_markdown(doc, markdown_text: str):
+    """
+    Single-pass markdown-to-DOCX parser for GPT summaries.
+    
+    Supports # headings, bold-line section headers, nested bullet/numbered
+    lists (nesting from relative indentation) and inline **bold**.
+    """
+    list_indents = []  # Indent widths of the currently open list levels
+    
+    for raw_line in markdown_text.split('\n'):
+        line = _remove_emoji(raw_line.rstrip()) if raw_line.strip() else ''
+        if not line or _RULE_PATTERN.match(line):
+            continue
+        
+        # Emoji removal strips leading indentation, so measure it on the raw line
+        indent = len(raw_line[:len(raw_line) - len(raw_line.lstrip())].expandtabs(4))
+        token = _BLOCK_PATTERN.match(line)
+        text = token.group('text')
+        
+        if token.group('bullet') or token.group('number'):
+            while list_indents and indent < list_indents[-1]:
+                list_indents.pop()
+            if not list_indents or indent > list_indents[-1]:
+                list_indents.append(indent)
+            level = min(len(list_indents), _MAX_LIST_LEVEL)
+            
+            if token.group('bullet'):
+                p = doc.add_paragraph(style=_list_style('List Bullet', level))
+            else:
+                # Keep the model's own numbering; Word's auto-numbering would
+                # continue across separate lists in the document
+                p = doc.add_paragraph(style=_list_style('List Continue', level))
+                p.add_run(f"{token.group('number')} ")
+            _add_formatted_text(p, text)
+            continue
+        
+        list_indents = []
+        
+        if token.group('heading'):
+            doc.add_heading(text.strip('*').strip(), level=min(len(token.group('heading')), 3))
+            continue
+        
+        bold_line = _BOLD_LINE_PATTERN.match(text)
+        if bold_line:
+            # Bold header - check if it's a section header
+            header_text = bold_line.group(1).strip()
+            section = _SECTION_HEADER_PATTERN.search(header_text)
+            if section:
+                doc.add_heading(header_text, level=SECTION_HEADERS[section.group(0)])
+            else:
+                p = doc.add_paragraph()
+                run = p.add_run(header_text)
+                run.bold = True
+                run.font.size = Pt(12)
+            continue
+        
+        # Regular paragraph
+        p = doc.add_paragraph()
+        _add_formatted_text(p, text)
+
+
+def _add_speaking_stats_table(doc, speaker_summary: Dict, sorted_speakers: List, total_time: float):
+    """Per-speaker speaking statistics table (turn-taking columns when the timeline is available)"""
+    speakers_words = speaker_summary.get('word_count', {})
+    has_timeline = 'turns' in speaker_summary
+    headers = ['ผู้พูด', 'เวลาพูด', 'สัดส่วน', 'จำนวนคำ']
+    if has_timeline:
+        headers += ['จำนวนครั้ง', 'พูดซ้อน', 'พูดแทรก', 'ถูกแทรก']
+    
+    table = doc.add_table(rows=1, cols=len(headers))
+    table.style = 'Table Grid'
+    for cell, header in zip(table.rows[0].cells, headers):
+        cell.text = header
+        cell.paragraphs[0].runs[0].bold = True
+    
+    for speaker, time_sec in sorted_speakers:
+        pct = (time_sec / total_time * 100) if total_time > 0 else 0
+        values = [speaker, format_time(time_sec), f"{pct:.1f}%", str(speakers_words.get(speaker, 0))]
+        if has_timeline:
+            values += [
+                str(speaker_summary['turns'].get(speaker, 0)),
+                format_time(speaker_summary.get('overlap_time', {}).get(speaker, 0)),
+                str(speaker_summary.get('interruptions', {}).get(speaker, 0)),
+                str(speaker_summary.get('interrupted', {}).get(speaker, 0)),
+            ]
+        for cell, value in zip(table.add_row().cells, values):
+            cell.text = value
+    
+    if has_timeline and speaker_summary.get('total_overlap'):
+        note = doc.add_paragraph()
+        note.add_run(f"เวลาที่มีผู้พูดพร้อมกัน: {format_time(speaker_summary['total_overlap'])}").italic = True
+
+
 def export_summary_to_docx(
     summary_text: str,
     output_path: str,
@@ -155,22 +409,6 @@ def export_summary_to_docx(
     if not DOCX_AVAILABLE:
         return "Error: python-docx not installed. Run: pip install python-docx"
     
-    # Position templates based on meeting type
-    POSITION_TEMPLATES = {
-        0: {"leader": "ประธาน", "main": "ผู้นำเสนอ", "participant": "ผู้เข้าร่วม"},
-        1: {"leader": "ประธาน", "main": "กรรมการ", "participant": "ผู้ถือหุ้น"},  # Shareholder
-        2: {"leader": "ประธาน", "main": "กรรมการ", "participant": "ผู้เข้าร่วม"},  # Board
-        3: {"leader": "ผู้จัดการโครงการ", "main": "ผู้รับผิดชอบ", "participant": "ทีมงาน"},  # Planning
-        4: {"leader": "ผู้รายงาน", "main": "ผู้รับผิดชอบ", "participant": "ผู้เข้าร่วม"},  # Progress
-        5: {"leader": "ผู้บริหาร", "main": "ผู้นำเสนอ", "participant": "ผู้เข้าร่วม"},  # Strategy
-        6: {"leader": "หัวหน้าทีม", "main": "ผู้เกี่ยวข้อง", "participant": "ผู้เข้าร่วม"},  # Incident
-        7: {"leader": "ผู้แทนบริษัท", "main": "ผู้นำเสนอ", "participant": "ลูกค้า"},  # Client
-        8: {"leader": "ผู้บรรยาย", "main": "ผู้ช่วยบรรยาย", "participant": "ผู้เข้าร่วม"},  # Workshop
-        9: {"leader": "ประธาน", "main": "ผู้บริหาร", "participant": "ผู้เข้าร่วม"},  # Executive
-        10: {"leader": "หัวหน้าทีม", "main": "ผู้นำเสนอ", "participant": "สมาชิกทีม"},  # Team
-        11: {"leader": "ประธาน", "main": "ผู้นำเสนอ", "participant": "ผู้เข้าร่วม"},  # General
-    }
-    
     doc = Document()
     
     # Title
@@ -233,97 +471,114 @@ def export_summary_to_docx(
                     sub_p = doc.add_paragraph(style='List Bullet 2')
                     sub_p.add_run(speaker)
             
+            _add_speaking_stats_table(doc, speaker_summary, sorted_speakers, total_time)
+            
             doc.add_paragraph()  # Spacer after participant section
     
     # ============ END PARTICIPANT HEADER SECTION ============
     
-    # Header mapping for structured sections
-    section_headers = {
-        'ประเภท': 1,
-        'ผู้เข้าร่วมประชุม': 1,
-        'สรุปการประชุม': 1,
-        'การสั่งงาน': 1,
-        'มอบหมาย': 1,
-        'คำถามสำคัญ': 1,
-        'ข้อตกลง': 1,
-        'มติ': 1,
-        'สถานะ': 2,
-        'ความคืบหน้า': 2,
-        'ปัญหา': 2,
-        'แนวทางแก้': 2,
-        'งานถัดไป': 2,
-        'นโยบาย': 2,
-        'การอนุมัติ': 2,
-    }
-    
-    def remove_emoji(text):
-        """Remove emoji from text"""
-        emoji_pattern = re.compile("["
-            u"\U0001F600-\U0001F64F"  # emoticons
-            u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-            u"\U0001F680-\U0001F6FF"  # transport & map symbols
-            u"\U0001F1E0-\U0001F1FF"  # flags
-            u"\U00002702-\U000027B0"
-            u"\U000024C2-\U0001F251"
-            u"\U0001f926-\U0001f937"
-            u"\U00010000-\U0010ffff"
-            "]+", flags=re.UNICODE)
-        return emoji_pattern.sub('', text).strip()
-    
-    def get_header_level(text):
-        """Determine header level based on content"""
-        clean_text = remove_emoji(text)
-        for keyword, level in section_headers.items():
-            if keyword in clean_text:
-                return level
-        return None
-    
     # Parse markdown and add to document
-    lines = summary_text.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        # Remove emoji from line
-        clean_line = remove_emoji(line)
-        
-        # Handle headers (**, ##, etc.)
-        if line.startswith('**') and line.endswith('**'):
-            # Bold header - check if it's a section header
-            text = line.strip('*').strip()
-            clean_text = remove_emoji(text)
-            header_level = get_header_level(text)
-            
-            if header_level:
-                doc.add_heading(clean_text, level=header_level)
-            else:
-                p = doc.add_paragraph()
-                run = p.add_run(clean_text)
-                run.bold = True
-                run.font.size = Pt(12)
-        elif line.startswith('##'):
-            text = remove_emoji(line.lstrip('#').strip())
-            doc.add_heading(text, level=2)
-        elif line.startswith('#'):
-            text = remove_emoji(line.lstrip('#').strip())
-            doc.add_heading(text, level=1)
-        elif line.startswith('- ') or line.startswith('• '):
-            # Bullet point
-            text = remove_emoji(line[2:].strip())
-            p = doc.add_paragraph(style='List Bullet')
-            _add_formatted_text(p, text)
-        else:
-            # Regular paragraph
-            p = doc.add_paragraph()
-            _add_formatted_text(p, clean_line)
+    _add_markdown(doc, summary_text)
     
     # Save document
     doc.save(output_path)
     return output_path
 
 
+# ===================== TEXT EXPORTS (SRT / WebVTT / JSONL / Markdown) =====================
+# Generators yield one chunk per segment, so output can be streamed to a file or HTTP
+# response without building the whole document in memory. Segments are expected in
+# time order (as returned by the pipeline).
+
+def _format_timestamp(seconds: float, separator: str = ',') -> str:
+    """Format seconds to HH:MM:SS,mmm (SRT) or HH:MM:SS.mmm (WebVTT)"""
+    millis = int(round(max(seconds or 0, 0) * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    mins, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{mins:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def iter_srt(segments: Iterable[Dict], format_speaker_func = None) -> Iterator[str]:
+    """Yield SRT cues, one per segment"""
+    format_speaker = format_speaker_func or default_format_speaker_func
+    index = 0
+    for segment in segments:
+        text = segment.get('text', '').strip()
+        if not text:
+            continue
+        index += 1
+        start = _format_timestamp(segment.get('start', 0))
+        end = _format_timestamp(segment.get('end', 0))
+        yield f"{index}\n{start} --> {end}\n[{_resolve_speaker(segment, format_speaker)}]: {text}\n\n"
+
+
+def _vtt_escape(text: str) -> str:
+    """Escape cue text: '<' and '&' are markup in WebVTT, '-->' ends a cue timing"""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('-->', '->')
+
+
+def iter_vtt(segments: Iterable[Dict], format_speaker_func = None) -> Iterator[str]:
+    """Yield a WebVTT document with speakers as voice tags"""
+    format_speaker = format_speaker_func or default_format_speaker_func
+    yield "WEBVTT\n\n"
+    for segment in segments:
+        text = segment.get('text', '').strip()
+        if not text:
+            continue
+        start = _format_timestamp(segment.get('start', 0), '.')
+        end = _format_timestamp(segment.get('end', 0), '.')
+        # Speaker names are user-supplied (rename); inside the <v> tag '>' ends the annotation
+        speaker = _vtt_escape(' '.join(_resolve_speaker(segment, format_speaker).split())).replace('>', '&gt;')
+        yield f"{start} --> {end}\n<v {speaker}>{_vtt_escape(text)}\n\n"
+
+
+def iter_jsonl(segments: Iterable[Dict], format_speaker_func = None) -> Iterator[str]:
+    """Yield one JSON object per segment (start, end, speaker, text) for search indexers"""
+    format_speaker = format_speaker_func or default_format_speaker_func
+    for segment in segments:
+        record = {
+            'start': round(segment.get('start', 0), 3),
+            'end': round(segment.get('end', 0), 3),
+            'speaker': _resolve_speaker(segment, format_speaker),
+            'text': segment.get('text', '').strip(),
+        }
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def iter_markdown_summary(
+    summary_text: str,
+    speaker_summary: Dict = None,
+    meeting_type_id: int = 0
+) -> Iterator[str]:
+    """Yield a Markdown summary document with a participant table"""
+    yield "# สรุปการประชุม\n\n"
+    if meeting_type_id in MEETING_TYPES and meeting_type_id > 0:
+        info = MEETING_TYPES[meeting_type_id]
+        yield f"**ประเภทการประชุม:** {info['thai']} ({info['name']})\n\n"
+    
+    speakers_time = (speaker_summary or {}).get('speaking_time', {})
+    speakers_words = (speaker_summary or {}).get('word_count', {})
+    if speakers_time:
+        total_time = sum(speakers_time.values())
+        yield "## ผู้เข้าร่วมประชุม\n\n| ผู้พูด | เวลาพูด | สัดส่วน | จำนวนคำ |\n|---|---|---|---|\n"
+        for speaker, time_sec in sorted(speakers_time.items(), key=lambda x: -x[1]):
+            pct = (time_sec / total_time * 100) if total_time > 0 else 0
+            mins, secs = int(time_sec // 60), int(time_sec % 60)
+            yield f"| {speaker} | {mins}:{secs:02d} | {pct:.1f}% | {speakers_words.get(speaker, 0)} |\n"
+        yield "\n"
+    
+    yield summary_text.strip() + "\n"
+
+
+def write_text_export(chunks: Iterable[str], output_path: str) -> str:
+    """Write streamed export chunks to a UTF-8 file"""
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for chunk in chunks:
+            f.write(chunk)
+    return output_path
+
+
 def export_both(
     segments: List[Dict],
     summary_text: str,
@@ -333,10 +588,11 @@ def export_both(
     format_speaker_func = None,
     output_dir: str = "doc",
     speaker_summary: Dict = None,
-    meeting_type_id: int = 0
+    meeting_type_id: int = 0,
+    formats: Sequence[str] = ('docx',)
 ) -> Dict[str, str]:
     """
-    Export both transcript and summary to DOCX files.
+    Export both transcript and summary to DOCX files (plus optional text formats).
     
     Args:
         segments: Transcription segments from WhisperX
@@ -348,7 +604,14 @@ def export_both(
         output_dir: Directory to save DOCX files
         speaker_summary: Dictionary with 'speaking_time' and 'word_count' per speaker
         meeting_type_id: Meeting type ID for position formatting
+        formats: Any of 'docx', 'srt', 'vtt', 'jsonl', 'markdown'
+    
+    Returns paths keyed by 'transcript'/'summary' (DOCX) and by format name.
     """
+    unknown = set(formats) - {'docx', *TEXT_EXPORT_FORMATS}
+    if unknown:
+        raise ValueError(f"Unsupported export format(s): {', '.join(sorted(unknown))}")
+    
     # Ensure output directory exists
     if not os.path.isabs(output_dir):
         # If relative path, make it relative to current working directory
@@ -364,21 +627,37 @@ def export_both(
     
     results = {}
     
-    # Export transcript
-    results['transcript'] = export_transcript_to_docx(
-        segments=segments,
-        output_path=transcript_path,
-        audio_file=audio_file,
-        audio_length=audio_length,
-        format_speaker_func=format_speaker_func
-    )
-    
-    # Export summary with speaker info and meeting type for participant header
-    results['summary'] = export_summary_to_docx(
-        summary_text=summary_text,
-        output_path=summary_path,
-        speaker_summary=speaker_summary,
-        meeting_type_id=meeting_type_id
-    )
+    if 'docx' in formats:
+        # Export transcript
+        results['transcript'] = export_transcript_to_docx(
+            segments=segments,
+            output_path=transcript_path,
+            audio_file=audio_file,
+            audio_length=audio_length,
+            format_speaker_func=format_speaker_func
+        )
+        
+        # Export summary with speaker info and meeting type for participant header
+        results['summary'] = export_summary_to_docx(
+            summary_text=summary_text,
+            output_path=summary_path,
+            speaker_summary=speaker_summary,
+            meeting_type_id=meeting_type_id
+        )
+    
+    text_exporters = {
+        'srt': lambda: iter_srt(segments, format_speaker_func),
+        'vtt': lambda: iter_vtt(segments, format_speaker_func),
+        'jsonl': lambda: iter_jsonl(segments, format_speaker_func),
+        'markdown': lambda: iter_markdown_summary(summary_text, speaker_summary, meeting_type_id),
+    }
+    for fmt in formats:
+        if fmt in text_exporters:
+            suffix = 'summary' if fmt == 'markdown' else 'transcript'
+            extension = TEXT_EXPORT_FORMATS[fmt]['extension']
+            results[fmt] = write_text_export(
+                text_exporters[fmt](),
+                os.path.join(output_dir, f"{base_filename}_{suffix}.{extension}")
+            )
     
     return results
@@ -0,0 +1,104 @@
+"""
+Upload ingest: demux the audio stream out of video containers once.
+
+Screen-recorded meetings arrive as .mp4 / .webm with a video track that every ffmpeg
+call (audio load, one per speaker clip, playback slicing) would otherwise demux and
+skip again. ffprobe tells us whether there is a real video stream; if so the first
+audio stream is stream-copied (`-vn -c:a copy`: no decode, no re-encode) into a
+matching audio-only container and all later stages use that file.
+"""
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+# Audio codec → audio-only container that can hold it without re-encoding
+AUDIO_CONTAINERS = {
+    "aac": ".m4a",
+    "alac": ".m4a",
+    "mp3": ".mp3",
+    "opus": ".ogg",
+    "vorbis": ".ogg",
+    "flac": ".flac",
+}
+FALLBACK_CONTAINER = ".mka"  # Matroska audio holds any codec
+
+
+def probe(path: str) -> Optional[Dict[str, Any]]:
+    """{'has_video', 'audio_codec', 'duration'} from ffprobe, or None if it can't run"""
+    cmd = ['ffprobe', '-v', 'error', '-print_format', 'json', '-show_streams', '-show_format', path]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    info = json.loads(result.stdout or "{}")
+    streams = info.get("streams", [])
+    # Cover art in audio files is a video stream flagged attached_pic
+    has_video = any(
+        s.get("codec_type") == "video" and not s.get("disposition", {}).get("attached_pic")
+        for s in streams
+    )
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+    duration = info.get("format", {}).get("duration")
+    return {
+        "has_video": has_video,
+        "audio_codec": audio.get("codec_name") if audio else None,
+        "duration": float(duration) if duration else None,
+    }
+
+
+def demux_audio(path: str, codec: str, output_dir: str) -> Optional[str]:
+    """Stream-copy the first audio stream into an audio-only file; path or None"""
+    ext = AUDIO_CONTAINERS.get(codec, ".wav" if codec.startswith("pcm_") else FALLBACK_CONTAINER)
+    output_path = os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + ext)
+    cmd = ['ffmpeg', '-y', '-v', 'error', '-i', path, '-map', '0:a:0', '-vn', '-sn', '-dn', '-c:a', 'copy', output_path]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        print(f"   ⚠️ ffmpeg error: {e}")
+        return None
+    if result.returncode != 0 or not os.path.exists(output_path):
+        print(f"   ⚠️ Audio demux failed: {result.stderr.strip()[:200]}")
+        return None
+    return output_path
+
+
+def prepare_audio(path: str) -> Dict[str, Any]:
+    """
+    Audio file for the pipeline to use.
+
+    Returns {'audio_file', 'demuxed', 'has_video', 'audio_codec', 'dir', 'source_bytes',
+    'audio_bytes', 'time'}; 'dir' is a temp dir holding the demuxed file (caller cleans up).
+    Anything unexpected (no ffprobe, no audio stream, demux error) falls back to the
+    original file, which ffmpeg decodes as before.
+    """
+    start = time.time()
+    info = probe(path) or {}
+    ingest = {
+        'audio_file': path,
+        'demuxed': False,
+        'has_video': info.get('has_video'),
+        'audio_codec': info.get('audio_codec'),
+        'dir': None,
+        'source_bytes': os.path.getsize(path),
+        'audio_bytes': os.path.getsize(path),
+    }
+    if info.get('has_video') and info.get('audio_codec'):
+        work_dir = tempfile.mkdtemp(prefix="ingest_")
+        demuxed = demux_audio(path, info['audio_codec'], work_dir)
+        if demuxed:
+            ingest.update({
+                'audio_file': demuxed,
+                'demuxed': True,
+                'dir': work_dir,
+                'audio_bytes': os.path.getsize(demuxed),
+            })
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    ingest['time'] = time.time() - start
+    return ingest
@@ -0,0 +1,118 @@
+"""
+Low-bitrate playback proxy, seek index and waveform peaks.
+
+Built from the 16 kHz mono waveform the pipeline has already decoded, so the original
+upload (possibly a 500 MB WAV or video) is never decoded a second time:
+- proxy: mono Opus in Ogg (~24 kbps, ~10 MB per hour), AAC/M4A if ffmpeg lacks libopus
+- seek index: [seconds, byte offset] pairs from the Ogg page granule positions, so a
+  player can turn a transcript timestamp into an HTTP Range request directly
+- peaks: min/max pairs per bucket in the audiowaveform JSON format (peaks.js etc.)
+"""
+import json
+import os
+import struct
+import subprocess
+from typing import Dict, List, Optional
+
+import numpy as np
+
+OPUS_GRANULE_RATE = 48000  # Opus granule positions always count 48 kHz samples
+SEEK_INDEX_INTERVAL = 5.0  # Seconds between seek index entries
+
+
+def compute_peaks(audio: np.ndarray, sample_rate: int, peaks_per_second: int = 20) -> Dict:
+    """Min/max per bucket, 8-bit, audiowaveform v2 JSON layout"""
+    samples_per_pixel = max(1, sample_rate // peaks_per_second)
+    n = len(audio) // samples_per_pixel * samples_per_pixel
+    data: List[int] = []
+    if n:
+        buckets = np.asarray(audio[:n], dtype=np.float32).reshape(-1, samples_per_pixel)
+        pairs = np.stack([buckets.min(axis=1), buckets.max(axis=1)], axis=1)
+        data = np.clip(np.round(pairs * 127), -128, 127).astype(np.int8).ravel().tolist()
+    return {
+        "version": 2,
+        "channels": 1,
+        "sample_rate": sample_rate,
+        "samples_per_pixel": samples_per_pixel,
+        "bits": 8,
+        "length": len(data) // 2,
+        "data": data,
+    }
+
+
+def _encode(pcm: bytes, sample_rate: int, codec_args: List[str], output_path: str) -> bool:
+    cmd = [
+        'ffmpeg', '-y', '-v', 'error',
+        '-f', 's16le', '-ar', str(sample_rate), '-ac', '1', '-i', 'pipe:0',
+        *codec_args,
+        output_path,
+    ]
+    try:
+        result = subprocess.run(cmd, input=pcm, capture_output=True, timeout=600)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        print(f"   ⚠️ ffmpeg error: {e}")
+        return False
+    if result.returncode != 0:
+        print(f"   ⚠️ ffmpeg proxy error: {result.stderr.decode(errors='replace').strip()[:200]}")
+    return result.returncode == 0 and os.path.exists(output_path)
+
+
+def encode_proxy(audio: np.ndarray, sample_rate: int, output_dir: str, bitrate: str = "24k") -> Optional[str]:
+    """Encode the waveform to proxy.ogg (Opus) or proxy.m4a (AAC fallback); path or None"""
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+    opus_path = os.path.join(output_dir, "proxy.ogg")
+    if _encode(pcm, sample_rate, ['-c:a', 'libopus', '-b:a', bitrate, '-application', 'voip'], opus_path):
+        return opus_path
+    aac_path = os.path.join(output_dir, "proxy.m4a")
+    if _encode(pcm, sample_rate, ['-c:a', 'aac', '-b:a', bitrate, '-movflags', '+faststart'], aac_path):
+        return aac_path
+    return None
+
+
+def ogg_seek_index(path: str, interval: float = SEEK_INDEX_INTERVAL) -> List[List[float]]:
+    """
+    [[seconds, byte_offset], ...] for the first Ogg page at or after each `interval`.
+    Decoding from a page start is valid for Opus (the player pre-rolls internally).
+    """
+    index: List[List[float]] = []
+    pre_skip = 0
+    next_time = 0.0
+    with open(path, "rb") as f:
+        data = f.read()
+    offset = 0
+    while offset + 27 <= len(data) and data[offset:offset + 4] == b"OggS":
+        granule = struct.unpack_from("<q", data, offset + 6)[0]
+        n_segments = data[offset + 26]
+        lacing = data[offset + 27:offset + 27 + n_segments]
+        header_size = 27 + n_segments
+        body_size = sum(lacing)
+        body = data[offset + header_size:offset + header_size + body_size]
+        if body.startswith(b"OpusHead") and len(body) >= 12:
+            pre_skip = struct.unpack_from("<H", body, 10)[0]
+        elif granule > 0:
+            # Granule = samples decoded by the end of this page; the page starts earlier,
+            # so index the page at its end time (seeking lands at or before the target)
+            seconds = max(0.0, (granule - pre_skip) / OPUS_GRANULE_RATE)
+            if seconds >= next_time:
+                index.append([round(seconds, 3), offset])
+                next_time = seconds + interval
+        offset += header_size + body_size
+    return index
+
+
+def build_playback(audio: np.ndarray, sample_rate: int, output_dir: str,
+                   bitrate: str = "24k", peaks_per_second: int = 20) -> Dict[str, Optional[str]]:
+    """Write proxy + seek index + peaks into output_dir; returns their paths (None if missing)"""
+    os.makedirs(output_dir, exist_ok=True)
+    peaks_path = os.path.join(output_dir, "peaks.json")
+    with open(peaks_path, "w") as f:
+        json.dump(compute_peaks(audio, sample_rate, peaks_per_second), f, separators=(",", ":"))
+
+    proxy_path = encode_proxy(audio, sample_rate, output_dir, bitrate)
+    index_path = None
+    if proxy_path and proxy_path.endswith(".ogg"):
+        index_path = os.path.join(output_dir, "seek_index.json")
+        with open(index_path, "w") as f:
+            json.dump({"interval": SEEK_INDEX_INTERVAL, "entries": ogg_seek_index(proxy_path)}, f,
+                      separators=(",", ":"))
+    return {"proxy": proxy_path, "seek_index": index_path, "peaks": peaks_path}
@@ -0,0 +1,75 @@
+"""
+Speaker label remapping utility.
+Rewrites generic speaker labels (คนพูด 1, คนพูด 2, ...) to real names in
+cached segments, speaker statistics and summary text without re-running the pipeline.
+"""
+import re
+from typing import Dict, List, Optional, Pattern
+
+
+def build_speaker_pattern(speaker_mapping: Dict[str, str]) -> Optional[Pattern]:
+    """
+    Compile a single regex matching every label in the mapping.
+
+    Longer labels are tried first and a trailing digit is not allowed,
+    so "คนพูด 1" never matches inside "คนพูด 10".
+    """
+    labels = [label for label, name in speaker_mapping.items() if label and name and label != name]
+    if not labels:
+        return None
+
+    labels.sort(key=len, reverse=True)
+    alternation = '|'.join(re.escape(label) for label in labels)
+    return re.compile(f"(?:{alternation})(?!\\d)")
+
+
+def remap_speaker_text(text: str, speaker_mapping: Dict[str, str], pattern: Pattern = None) -> str:
+    """Replace every speaker label in free text (summary, transcript) in a single pass."""
+    if not text:
+        return text
+
+    pattern = pattern or build_speaker_pattern(speaker_mapping)
+    if pattern is None:
+        return text
+    return pattern.sub(lambda m: speaker_mapping[m.group(0)], text)
+
+
+def remap_segments(segments: List[dict], speaker_mapping: Dict[str, str]) -> List[dict]:
+    """Return a copy of the segments with the 'speaker' field renamed (words[] included)."""
+    def rename(item: dict) -> dict:
+        speaker = item.get('speaker')
+        if speaker in speaker_mapping and speaker_mapping[speaker]:
+            return {**item, 'speaker': speaker_mapping[speaker]}
+        return item
+
+    remapped = []
+    for segment in segments:
+        segment = rename(segment)
+        if segment.get('words'):
+            segment = {**segment, 'words': [rename(word) for word in segment['words']]}
+        remapped.append(segment)
+    return remapped
+
+
+def remap_speaker_summary(speaker_summary: Dict, speaker_mapping: Dict[str, str]) -> Dict:
+    """
+    Rename the keys of every per-speaker statistic.
+
+    Numeric values are summed when two labels are mapped to the same name
+    (e.g. diarization split one person into two speakers).
+    """
+    remapped = {}
+    for stat_name, per_speaker in (speaker_summary or {}).items():
+        if not isinstance(per_speaker, dict):
+            remapped[stat_name] = per_speaker
+            continue
+
+        merged = {}
+        for speaker, value in per_speaker.items():
+            name = speaker_mapping.get(speaker) or speaker
+            if name in merged and isinstance(value, (int, float)):
+                merged[name] += value
+            else:
+                merged[name] = value
+        remapped[stat_name] = merged
+    return remapped
@@ -0,0 +1,155 @@
+"""
+Speaker timeline built from diarization output.
+
+Segment-based statistics credit each transcript segment's full duration to its single
+dominant speaker, so overlapping speech is misattributed. The timeline works on the
+diarization turns themselves:
+- an interval tree (sorted starts + max-end over an implicit balanced tree) answers
+  "who is speaking during [start, end]" in O(log n + k)
+- one sweep over the sorted start/end events computes exact per-speaker speaking
+  time, overlap time, turns and interruptions in O(n log n)
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+Interval = Tuple[float, float, str]
+
+# A start only counts as an interruption if the new speaker keeps going this long
+# (filters backchannels such as "ครับ" / "ค่ะ")
+MIN_INTERRUPTION_SECONDS = 1.0
+
+
+def intervals_from_diarization(diarize_segments, label: Callable[[str], str] = None) -> List[Interval]:
+    """(start, end, speaker) from a pyannote/WhisperX DataFrame or a list of dicts"""
+    if diarize_segments is None:
+        return []
+    if hasattr(diarize_segments, "itertuples"):
+        rows = ((row.start, row.end, row.speaker) for row in diarize_segments.itertuples())
+    else:
+        rows = ((seg["start"], seg["end"], seg["speaker"]) for seg in diarize_segments)
+    label = label or (lambda speaker: speaker)
+    return [(float(start), float(end), label(speaker)) for start, end, speaker in rows if end > start]
+
+
+class SpeakerTimeline:
+    """Static interval tree over diarization turns plus speaking statistics"""
+
+    def __init__(self, intervals: Iterable[Interval]):
+        self.intervals: List[Interval] = sorted(intervals)
+        # max_end[node] over the implicit tree whose nodes are index ranges [lo, hi)
+        self._max_end: Dict[Tuple[int, int], float] = {}
+        if self.intervals:
+            self._build(0, len(self.intervals))
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def _build(self, lo: int, hi: int) -> float:
+        mid = (lo + hi) // 2
+        max_end = self.intervals[mid][1]
+        if lo < mid:
+            max_end = max(max_end, self._build(lo, mid))
+        if mid + 1 < hi:
+            max_end = max(max_end, self._build(mid + 1, hi))
+        self._max_end[(lo, hi)] = max_end
+        return max_end
+
+    def overlapping(self, start: float, end: float) -> List[Interval]:
+        """Turns that overlap [start, end), in start order"""
+        found: List[Interval] = []
+        if self.intervals:
+            self._query(0, len(self.intervals), start, end, found)
+        return found
+
+    def _query(self, lo: int, hi: int, start: float, end: float, found: List[Interval]):
+        if lo >= hi or self._max_end[(lo, hi)] <= start:
+            return  # Every turn in this subtree ends before the query starts
+        mid = (lo + hi) // 2
+        if lo < mid:
+            self._query(lo, mid, start, end, found)
+        turn_start, turn_end, _ = self.intervals[mid]
+        if turn_start >= end:
+            return  # This turn and everything to its right start after the query
+        if turn_end > start:
+            found.append(self.intervals[mid])
+        if mid + 1 < hi:
+            self._query(mid + 1, hi, start, end, found)
+
+    def dominant_speaker(self, start: float, end: float) -> Optional[str]:
+        """Speaker with the most speech inside [start, end)"""
+        totals: Dict[str, float] = {}
+        for turn_start, turn_end, speaker in self.overlapping(start, end):
+            totals[speaker] = totals.get(speaker, 0.0) + min(end, turn_end) - max(start, turn_start)
+        return max(totals, key=totals.get) if totals else None
+
+    def statistics(self, min_interruption: float = MIN_INTERRUPTION_SECONDS) -> Dict:
+        """
+        Sweep the turn boundaries once.
+
+        Returns per-speaker dicts 'speaking_time', 'overlap_time', 'turns',
+        'interruptions' (made) and 'interrupted' (received), plus 'total_overlap'
+        (seconds with two or more speakers active).
+        """
+        speaking: Dict[str, float] = {}
+        overlap: Dict[str, float] = {}
+        turns: Dict[str, int] = {}
+        interruptions: Dict[str, int] = {}
+        interrupted: Dict[str, int] = {}
+        total_overlap = 0.0
+
+        # Ends sort before starts at the same time: touching turns don't overlap
+        events = []
+        for index, (start, end, speaker) in enumerate(self.intervals):
+            events.append((start, 1, index))
+            events.append((end, 0, index))
+            for stat in (speaking, overlap):
+                stat.setdefault(speaker, 0.0)
+            for stat in (turns, interruptions, interrupted):
+                stat.setdefault(speaker, 0)
+        events.sort()
+
+        active: Dict[str, int] = {}  # speaker -> number of open turns
+        previous_time = None
+        last_speaker = None
+        for time, is_start, index in events:
+            if previous_time is not None and time > previous_time and active:
+                elapsed = time - previous_time
+                for speaker in active:
+                    speaking[speaker] += elapsed
+                if len(active) > 1:
+                    total_overlap += elapsed
+                    for speaker in active:
+                        overlap[speaker] += elapsed
+            previous_time = time
+
+            start, end, speaker = self.intervals[index]
+            if is_start:
+                if speaker != last_speaker:
+                    turns[speaker] += 1
+                    last_speaker = speaker
+                others = [other for other in active if other != speaker]
+                if others and end - start >= min_interruption:
+                    interruptions[speaker] += 1
+                    for other in others:
+                        interrupted[other] += 1
+                active[speaker] = active.get(speaker, 0) + 1
+            else:
+                active[speaker] -= 1
+                if not active[speaker]:
+                    del active[speaker]
+
+        return {
+            'speaking_time': speaking,
+            'overlap_time': overlap,
+            'turns': turns,
+            'interruptions': interruptions,
+            'interrupted': interrupted,
+            'total_overlap': total_overlap,
+        }
+
+
+def merge_speaking_time(segment_time: Dict[str, float], timeline_time: Dict[str, float]) -> Dict[str, float]:
+    """
+    Timeline speaking time for speakers diarization knows, segment-derived time for
+    the rest (e.g. segments no diarization turn overlapped keep their label and time)
+    """
+    return {**segment_time, **timeline_time}
@@ -0,0 +1,161 @@
+"""
+Thai word segmentation for speaker statistics.
+
+Thai is written without spaces between words, so `len(text.split())` counts phrases,
+not words. This module segments Thai runs by dictionary maximal matching over a trie
+(fewest unknown characters first, then fewest words), and counts Latin words and
+numbers as whitespace/punctuation-separated tokens.
+
+Dictionary source, first available wins:
+1. THAI_DICT_PATH (one word per line)
+2. pythainlp's Thai word corpus (optional dependency)
+3. The bundled core vocabulary in app/utils/data/thai_words.txt
+"""
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from pythainlp.corpus.common import thai_words as _pythainlp_thai_words
+    PYTHAINLP_AVAILABLE = True
+except ImportError:
+    PYTHAINLP_AVAILABLE = False
+
+_BUNDLED_WORDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "thai_words.txt")
+
+_THAI_RUN = re.compile(r"[\u0E00-\u0E7F]+")
+_TOKEN = re.compile(r"[\u0E00-\u0E7F]+|[^\W_\u0E00-\u0E7F]+")
+
+# Characters that attach to the preceding consonant: a word can't start with them
+# (following vowels, above/below vowels, tone marks, thanthakhat, ...)
+_NON_INITIAL = frozenset("ะัาำิีึืฺุู็่้๊๋์ํ๎ๅ")
+# Leading vowels: a word can't end on them
+_NON_FINAL = frozenset("เแโใไ")
+
+_END = ""  # Trie terminal marker
+
+
+def _read_word_file(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def load_dictionary() -> List[str]:
+    """Word list from THAI_DICT_PATH, pythainlp, or the bundled vocabulary"""
+    custom = os.environ.get("THAI_DICT_PATH")
+    if custom:
+        return _read_word_file(custom)
+    if PYTHAINLP_AVAILABLE:
+        return list(_pythainlp_thai_words())
+    return _read_word_file(_BUNDLED_WORDS)
+
+
+def build_trie(words: Iterable[str]) -> Dict:
+    """Nested-dict trie; a node containing _END terminates a word"""
+    root: Dict = {}
+    for word in words:
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_END] = True
+    return root
+
+
+@lru_cache(maxsize=1)
+def _default_trie() -> Dict:
+    return build_trie(load_dictionary())
+
+
+def _cluster_end(text: str, i: int) -> int:
+    """End of the character cluster starting at i (a char plus attached marks/vowels)"""
+    n = len(text)
+    j = i + 1
+    if text[i] in _NON_FINAL and j < n:
+        j += 1
+    while j < n and text[j] in _NON_INITIAL:
+        j += 1
+    return j
+
+
+def _segment_thai(text: str, trie: Dict) -> List[str]:
+    """
+    Maximal matching over one Thai run. Forward DP over character positions with
+    cost = unknown clusters * (n + 1) + words (fewest unknowns, then fewest words);
+    consecutive unknown clusters are merged into one token (e.g. a name).
+    """
+    n = len(text)
+    weight = n + 1
+    inf = weight * weight
+    # Word boundaries can't fall before a mark/vowel that attaches to the previous char
+    boundary = [ch not in _NON_INITIAL for ch in text]
+    boundary.append(True)
+    cost = [inf] * (n + 1)
+    back = [0] * (n + 1)
+    known = [False] * (n + 1)
+    cost[0] = 0
+
+    for i in range(n):
+        base = cost[i]
+        if base == inf or not boundary[i]:
+            continue
+
+        node = trie
+        word_cost = base + 1
+        matched = False
+        for j in range(i, n):
+            node = node.get(text[j])
+            if node is None:
+                break
+            if _END in node and boundary[j + 1]:
+                matched = True
+                if word_cost < cost[j + 1]:
+                    cost[j + 1] = word_cost
+                    back[j + 1] = i
+                    known[j + 1] = True
+
+        if matched:
+            # As in newmm, only fall back to an unknown cluster where no dictionary word starts
+            continue
+        end = _cluster_end(text, i)
+        unknown_cost = base + weight + 1
+        if unknown_cost < cost[end]:
+            cost[end] = unknown_cost
+            back[end] = i
+            known[end] = False
+
+    tokens = []
+    end = n
+    pending_unknown = None  # End of an unknown run being merged (walking backwards)
+    while end > 0:
+        start = back[end]
+        if known[end]:
+            if pending_unknown is not None:
+                tokens.append(text[end:pending_unknown])
+                pending_unknown = None
+            tokens.append(text[start:end])
+        elif pending_unknown is None:
+            pending_unknown = end
+        end = start
+    if pending_unknown is not None:
+        tokens.append(text[:pending_unknown])
+    tokens.reverse()
+    return tokens
+
+
+def segment(text: str, trie: Optional[Dict] = None) -> List[str]:
+    """Split text into words (Thai by dictionary, other scripts by separators)"""
+    trie = trie if trie is not None else _default_trie()
+    words = []
+    for match in _TOKEN.finditer(text or ""):
+        token = match.group()
+        if _THAI_RUN.fullmatch(token):
+            words.extend(_segment_thai(token, trie))
+        else:
+            words.append(token)
+    return words
+
+
+def count_words(text: str, trie: Optional[Dict] = None) -> int:
+    """Number of words in text (Thai-aware replacement for len(text.split()))"""
+    return len(segment(text, trie))
@@ -1,4 +1,4 @@
-import { useState } from 'react'
+import { useEffect, useState } from 'react'
 import FileUploader from './components/FileUploader'
 import MeetingTypeSelect from './components/MeetingTypeSelect'
 import SpeakerIdentification from './components/SpeakerIdentification'
@@ -8,6 +8,61 @@ import ResultsTabs from './components/ResultsTabs'
 // API Base URL - uses proxy in dev, direct in production
 const API_BASE = '/api'
 
+// Jobs are processed asynchronously and polled, so long meetings outlive proxy timeouts.
+// The job id doubles as a resume token: keep it to pick the result up after a reload.
+const JOB_STORAGE_KEY = 'timsum.pendingJob'
+const POLL_INTERVAL_MS = 3000
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms))
+
+// Compact transcripts are columnar: speaker is an index into `speakers`
+const expandColumns = (columns) => columns.text.map((text, i) => ({
+    start: columns.start[i],
+    end: columns.end[i],
+    speaker: columns.speaker[i] === null ? null : columns.speakers[columns.speaker[i]],
+    text,
+}))
+
+// Job results carry the first page of segments inline; fetch the rest from segments_url
+async function loadTranscript(result) {
+    const transcript = result.transcript
+    if (!transcript.segment_columns) return result
+
+    const segments = expandColumns(transcript.segment_columns)
+    let offset = transcript.next_offset
+    while (offset !== null && offset !== undefined) {
+        const response = await fetch(`${transcript.segments_url}?offset=${offset}&limit=2000`)
+        if (!response.ok) throw new Error('โหลดบทถอดเสียงไม่สำเร็จ')
+        const page = await response.json()
+        segments.push(...expandColumns(page.segments))
+        offset = page.next_offset
+    }
+
+    return {
+        ...result,
+        transcript: {
+            ...transcript,
+            segments,
+            combined_text: segments.map(seg => seg.text).join(' '),
+        },
+    }
+}
+
+async function waitForJob(jobId) {
+    while (true) {
+        const response = await fetch(`${API_BASE}/jobs/${jobId}`)
+        if (response.status === 404) throw new Error('ไม่พบงานประมวลผล')
+        if (response.ok) {
+            const job = await response.json()
+            if (job.status === 'done') return loadTranscript(job.result)
+            if (job.status === 'failed' || job.status === 'cancelled') {
+                throw new Error(job.error || 'Processing failed')
+            }
+        }
+        await sleep(POLL_INTERVAL_MS)
+    }
+}
+
 function App() {
     const [file, setFile] = useState(null)
     const [meetingType, setMeetingType] = useState(0)
@@ -29,6 +84,33 @@ function App() {
         setSessionId(null)
     }
 
+    const runJob = async (jobId, progressTimers = []) => {
+        try {
+            const data = await waitForJob(jobId)
+            setResult(data)
+            setSessionId(data.session_id)
+            setProgress(100)
+            setCurrentStep(5)
+        } catch (err) {
+            setError(err.message || 'เกิดข้อผิดพลาดในการประมวลผล')
+        } finally {
+            progressTimers.forEach(timer => clearTimeout(timer))
+            localStorage.removeItem(JOB_STORAGE_KEY)
+            setIsProcessing(false)
+        }
+    }
+
+    // Resume a job that was still running when the page was closed or reloaded
+    useEffect(() => {
+        const pendingJob = localStorage.getItem(JOB_STORAGE_KEY)
+        if (pendingJob) {
+            setIsProcessing(true)
+            setCurrentStep(2)
+            setProgress(40)
+            runJob(pendingJob)
+        }
+    }, [])
+
     const handleSubmit = async () => {
         if (!file) return
 
@@ -60,29 +142,24 @@ function App() {
             const formData = new FormData()
             formData.append('audio', file)
             formData.append('meeting_type_id', meetingType)
+            formData.append('response_format', 'compact')
 
-            const response = await fetch(`${API_BASE}/transcribe-summarize`, {
+            const response = await fetch(`${API_BASE}/jobs`, {
                 method: 'POST',
                 body: formData,
             })
 
-            // Clear progress timers
-            progressTimers.forEach(timer => clearTimeout(timer))
-
             if (!response.ok) {
                 const errorData = await response.json()
                 throw new Error(errorData.detail || 'Processing failed')
             }
 
-            const data = await response.json()
-            setResult(data)
-            setSessionId(data.session_id)
-            setProgress(100)
-            setCurrentStep(5)
+            const { job_id } = await response.json()
+            localStorage.setItem(JOB_STORAGE_KEY, job_id)
+            await runJob(job_id, progressTimers)
         } catch (err) {
             setError(err.message || 'เกิดข้อผิดพลาดในการประมวลผล')
             progressTimers.forEach(timer => clearTimeout(timer))
-        } finally {
             setIsProcessing(false)
         }
     }
@@ -98,39 +175,42 @@ function App() {
         if (!result) return null
         if (!speakerMapping || Object.keys(speakerMapping).length === 0) return result
 
-        // Deep clone result
-        const mapped = JSON.parse(JSON.stringify(result))
-
-        // Replace speaker names in segments
-        mapped.transcript.segments = mapped.transcript.segments.map(seg => ({
+        // Only the renamed fields are copied; the rest of the result is shared
+        const segments = result.transcript.segments.map(seg => ({
             ...seg,
             speaker: speakerMapping[seg.speaker] || seg.speaker
         }))
 
         // Replace speaker names in summary text
-        let mappedSummary = mapped.summary
+        let mappedSummary = result.summary
         for (const [generic, real] of Object.entries(speakerMapping)) {
             mappedSummary = mappedSummary.replaceAll(generic, real)
         }
-        mapped.summary = mappedSummary
 
         // Replace speaker names in speaker_summary
         const newSpeakingTime = {}
         const newWordCount = {}
-        for (const [speaker, time] of Object.entries(mapped.transcript.speaker_summary.speaking_time)) {
+        for (const [speaker, time] of Object.entries(result.transcript.speaker_summary.speaking_time)) {
             const newName = speakerMapping[speaker] || speaker
-            newSpeakingTime[newName] = time
+            newSpeakingTime[newName] = (newSpeakingTime[newName] || 0) + time
         }
-        for (const [speaker, count] of Object.entries(mapped.transcript.speaker_summary.word_count)) {
+        for (const [speaker, count] of Object.entries(result.transcript.speaker_summary.word_count)) {
             const newName = speakerMapping[speaker] || speaker
-            newWordCount[newName] = count
-        }
-        mapped.transcript.speaker_summary = {
-            speaking_time: newSpeakingTime,
-            word_count: newWordCount,
+            newWordCount[newName] = (newWordCount[newName] || 0) + count
         }
 
-        return mapped
+        return {
+            ...result,
+            summary: mappedSummary,
+            transcript: {
+                ...result.transcript,
+                segments,
+                speaker_summary: {
+                    speaking_time: newSpeakingTime,
+                    word_count: newWordCount,
+                },
+            },
+        }
     }
 
     const handleSpeakerConfirm = (mapping) => {
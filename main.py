@@ -1,4 +1,5 @@
 import os
+import shutil
 import sys
 from dotenv import load_dotenv
 
@@ -8,6 +9,7 @@ load_dotenv()
 # Add project root to path to ensure imports work
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from app.core.config import DEFAULT_TIER, PROCESSING_TIERS
 from app.services.pipeline import TranscribeSummaryPipeline
 from app.models.meeting import get_meeting_types_menu, MEETING_TYPES
 from app.utils.export import export_both
@@ -40,8 +42,18 @@ def main():
     print(f"   โครงสร้าง: {selected_type['structure']}")
     print()
     
+    # Quality/speed tier (Enter = PIPELINE_TIER or accurate)
+    default_tier = os.environ.get("PIPELINE_TIER", DEFAULT_TIER)
+    while True:
+        tier = input(f"🎚️ เลือกระดับคุณภาพ ({' / '.join(PROCESSING_TIERS)}) [{default_tier}]: ").strip().lower()
+        tier = tier or default_tier
+        if tier in PROCESSING_TIERS:
+            break
+        print(f"❌ กรุณาเลือก {', '.join(PROCESSING_TIERS)}")
+    print()
+    
     # Run pipeline
-    pipeline = TranscribeSummaryPipeline()
+    pipeline = TranscribeSummaryPipeline(tier=tier)
     output = pipeline.process(audio_file, meeting_type_id=meeting_type_id)
     pipeline.print_results(output)
     
@@ -56,13 +68,22 @@ def main():
             audio_length=output['audio_length_seconds'],
             format_speaker_func=format_speaker,
             speaker_summary=output['full_transcript'].get('speaker_summary'),
-            meeting_type_id=meeting_type_id
+            meeting_type_id=meeting_type_id,
+            formats=('docx', 'srt', 'vtt', 'markdown')
         )
         print(f"\n📄 Files exported:")
         print(f"   - Transcript: {results['transcript']}")
         print(f"   - Summary: {results['summary']}")
+        print(f"   - Subtitles: {results['srt']}, {results['vtt']}")
+        print(f"   - Markdown: {results['markdown']}")
     except Exception as e:
         print(f"\n⚠️ Could not export DOCX: {e}")
+    
+    # Demuxed audio of a video input and the playback proxy (served by the API only)
+    # are only needed while processing
+    for temp in (output.get('ingest'), output.get('playback')):
+        if temp and temp.get('dir'):
+            shutil.rmtree(temp['dir'], ignore_errors=True)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,63 @@
+"""
+Benchmark for transcript DOCX export (fast XML path vs python-docx add_row).
+
+Usage:
+    python tests/bench_docx_export.py              # 1k, 10k, 50k segments (fast path)
+    python tests/bench_docx_export.py --legacy     # also time the add_row() path
+    python tests/bench_docx_export.py --memory     # report peak Python memory (slower)
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.export import export_transcript_to_docx
+
+
+def make_segments(count: int):
+    """Synthetic Thai meeting segments (~2.5s each, 4 speakers)"""
+    return [
+        {
+            "start": i * 2.5,
+            "end": i * 2.5 + 2.2,
+            "speaker": f"คนพูด {i % 4 + 1}",
+            "text": f"วาระที่ {i // 50 + 1} สรุปความคืบหน้าของโครงการและมอบหมายงานให้ทีม รายการที่ {i}",
+        }
+        for i in range(count)
+    ]
+
+
+def bench(segments, fast: bool, memory: bool):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "transcript.docx")
+        if memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        export_transcript_to_docx(segments, output_path, audio_file="bench.wav",
+                                  audio_length=segments[-1]["end"], fast=fast)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if memory else 0
+        tracemalloc.stop()
+        size = os.path.getsize(output_path)
+    return elapsed, peak, size
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--legacy", action="store_true", help="Also run the python-docx add_row() path")
+    parser.add_argument("--memory", action="store_true", help="Track peak memory with tracemalloc")
+    args = parser.parse_args()
+
+    print(f"{'segments':>9} {'path':<7} {'time (s)':>9} {'peak MB':>8} {'docx KB':>8}")
+    print("-" * 46)
+    for count in [int(n) for n in args.sizes.split(",")]:
+        segments = make_segments(count)
+        paths = [("fast", True)] + ([("legacy", False)] if args.legacy else [])
+        for name, fast in paths:
+            elapsed, peak, size = bench(segments, fast, args.memory)
+            print(f"{count:>9} {name:<7} {elapsed:>9.2f} {peak / 1e6:>8.1f} {size / 1e3:>8.0f}")
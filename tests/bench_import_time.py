@@ -0,0 +1,72 @@
+"""
+Import-time benchmark for the API server (cold start until /api/health can answer).
+
+Usage:
+    python tests/bench_import_time.py            # human-readable report
+    python tests/bench_import_time.py --json     # one JSON line for tracking over time
+    python tests/bench_import_time.py --runs 10 --module main
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("torch", "whisperx", "pyannote.audio", "transformers")
+
+
+def measure(module: str):
+    """Import `module` in a fresh interpreter; return (total_us, per-module cumulative us, heavy modules loaded)"""
+    probe = (
+        f"import sys, json; import {module}; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line[len("import time:"):].split("|")
+        if cum.strip().isdigit():
+            # Keep the indentation: nested imports are indented under their parent
+            cumulative[name[1:].rstrip()] = int(cum)
+
+    return cumulative.get(module, 0), cumulative, json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="api")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    totals = []
+    for _ in range(args.runs):
+        total, cumulative, heavy = measure(args.module)
+        totals.append(total / 1000)
+
+    result = {
+        "module": args.module,
+        "runs": args.runs,
+        "median_ms": round(statistics.median(totals), 1),
+        "min_ms": round(min(totals), 1),
+        "heavy_modules_loaded": heavy,
+    }
+
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(f"📦 import {args.module}: median {result['median_ms']} ms (min {result['min_ms']} ms, {args.runs} runs)")
+        print(f"   Heavy ML modules loaded at import: {', '.join(heavy) or 'none'}")
+        print(f"   Slowest direct imports of {args.module}:")
+        direct = {name.strip(): us for name, us in cumulative.items() if len(name) - len(name.lstrip()) == 2}
+        for name, us in sorted(direct.items(), key=lambda x: -x[1])[:10]:
+            print(f"     {us / 1000:8.1f} ms  {name}")
@@ -0,0 +1,83 @@
+"""
+Transcript search benchmark: index synthetic Thai meetings, then time queries.
+
+Usage:
+    python tests/bench_search.py                        # 20k meetings × 40 segments
+    python tests/bench_search.py --meetings 50000 --segments 30 --db /tmp/bench.db
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.store import MeetingStore
+
+WORDS = [
+    "งบประมาณ", "โครงการ", "ประชุม", "อนุมัติ", "รายงาน", "ความคืบหน้า", "ไตรมาส",
+    "ฝ่ายขาย", "ลูกค้า", "สัญญา", "กำหนดการ", "ทบทวน", "เป้าหมาย", "ผลการดำเนินงาน",
+    "บุคลากร", "จัดซื้อ", "ระบบ", "พัฒนา", "ทดสอบ", "ส่งมอบ", "ครับ", "ค่ะ", "นะครับ",
+    "budget", "KPI", "deadline", "server", "Q3",
+]
+QUERIES = ["งบประมาณ", "อนุมัติงบประมาณ", "ความคืบหน้าโครงการ", "deadline", "ส่งมอบ ระบบ", "ผลการดำเนินงานไตรมาส"]
+
+
+def synthetic_segments(rng: random.Random, count: int):
+    t = 0.0
+    segments = []
+    for _ in range(count):
+        duration = rng.uniform(2, 15)
+        text = "".join(rng.choice(WORDS) + (" " if rng.random() < 0.3 else "") for _ in range(rng.randint(5, 25)))
+        segments.append({"start": t, "end": t + duration, "speaker": f"คนพูด {rng.randint(1, 5)}", "text": text})
+        t += duration
+    return segments
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcript search benchmark")
+    parser.add_argument("--meetings", type=int, default=20000)
+    parser.add_argument("--segments", type=int, default=40, help="Segments per meeting")
+    parser.add_argument("--db", default=None, help="Database path (default: temp file)")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per query")
+    parser.add_argument("--sort", choices=["recent", "relevance"], default="recent")
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix="bench_search_"), "meetings.db")
+    store = MeetingStore(db_path)
+    rng = random.Random(42)
+
+    existing = store.list(limit=1)["total"]
+    if existing < args.meetings:
+        print(f"Indexing {args.meetings - existing} meetings × {args.segments} segments into {db_path} ...")
+        start = time.perf_counter()
+        for i in range(existing, args.meetings):
+            store.save(f"meeting-{i}", {
+                "audio_file": f"meeting-{i}.mp3",
+                "meeting_type_id": rng.randint(1, 11),
+                "audio_length_seconds": 3600.0,
+                "segments": synthetic_segments(rng, args.segments),
+                "speaker_summary": {},
+                "summary": "",
+                "created_at": float(i),
+            })
+        elapsed = time.perf_counter() - start
+        print(f"  {elapsed:.1f}s ({(args.meetings - existing) / elapsed:.0f} meetings/s incremental)")
+
+    print(f"\n{'query':<24}{'hits':>6}{'median ms':>12}{'p95 ms':>10}")
+    for query in QUERIES:
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            hits = store.search(query, limit=20, sort=args.sort)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        print(f"{query:<24}{len(hits):>6}{statistics.median(timings):>12.1f}{p95:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Thai word-counting benchmark for the speaker-statistics stage.
+
+Usage:
+    python tests/bench_thai_words.py                    # 5000 segments
+    python tests/bench_thai_words.py --segments 20000 --words 40
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils import thai_words
+
+
+def synthetic_segments(words, count: int, words_per_segment: int, rng: random.Random):
+    """Meeting-like segments: dictionary words, an occasional space, unknown names and numbers"""
+    extras = ["สมชาย", "ปิยะพงษ์", "KPI", "2025", "Q3"]
+    segments = []
+    for _ in range(count):
+        parts = []
+        for _ in range(words_per_segment):
+            parts.append(rng.choice(extras) if rng.random() < 0.05 else rng.choice(words))
+            if rng.random() < 0.15:
+                parts.append(" ")
+        segments.append("".join(parts))
+    return segments
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Thai word segmentation benchmark")
+    parser.add_argument("--segments", type=int, default=5000)
+    parser.add_argument("--words", type=int, default=25, help="Words per segment")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    dictionary = thai_words.load_dictionary()
+    trie = thai_words.build_trie(dictionary)
+    build_time = time.perf_counter() - start
+
+    rng = random.Random(7)
+    segments = synthetic_segments(sorted(set(dictionary)), args.segments, args.words, rng)
+    chars = sum(len(s) for s in segments)
+
+    start = time.perf_counter()
+    thai_counts = [thai_words.count_words(s, trie) for s in segments]
+    thai_time = time.perf_counter() - start
+
+    split_counts = [len(s.split()) for s in segments]
+
+    source = ("THAI_DICT_PATH" if os.environ.get("THAI_DICT_PATH")
+              else "pythainlp" if thai_words.PYTHAINLP_AVAILABLE else "bundled")
+    print(f"Dictionary: {len(dictionary)} words ({source}), trie built in {build_time * 1000:.1f} ms")
+    print(f"Segments:   {args.segments} ({chars:,} chars, ~{args.words} words each)")
+    print(f"Segmenter:  {thai_time * 1000:.0f} ms total, {thai_time / args.segments * 1e6:.0f} µs/segment")
+    print(f"Mean words/segment: segmenter {sum(thai_counts) / len(segments):.1f}, "
+          f"split() {sum(split_counts) / len(segments):.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Replay a WAV file through the live transcription WebSocket.
+
+Usage:
+    python tests/stream_client.py audio/meeting.wav
+    python tests/stream_client.py audio/meeting.wav --url ws://localhost:8000/api/transcribe-stream --speed 4
+
+The WAV must be 16-bit mono PCM (any sample rate). Convert other files with:
+    ffmpeg -i input.mp3 -ac 1 -ar 16000 -sample_fmt s16 output.wav
+"""
+import argparse
+import asyncio
+import json
+import time
+import wave
+
+import websockets
+
+
+async def replay(wav_path: str, url: str, meeting_type_id: int, speed: float, chunk_ms: int):
+    with wave.open(wav_path, 'rb') as wav:
+        if wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+            raise SystemExit("❌ WAV must be 16-bit mono PCM")
+        sample_rate = wav.getframerate()
+        frames_per_chunk = int(sample_rate * chunk_ms / 1000)
+        chunks = []
+        while True:
+            data = wav.readframes(frames_per_chunk)
+            if not data:
+                break
+            chunks.append(data)
+
+    uri = f"{url}?meeting_type_id={meeting_type_id}&sample_rate={sample_rate}"
+    print(f"📡 Connecting to {uri}")
+    started = time.time()
+
+    async with websockets.connect(uri, max_size=None) as ws:
+        async def sender():
+            for data in chunks:
+                await ws.send(data)
+                await asyncio.sleep(chunk_ms / 1000 / speed)
+            await ws.send(json.dumps({"type": "stop"}))
+            print(f"📤 Sent {len(chunks)} chunks ({time.time() - started:.1f}s)")
+
+        async def receiver():
+            async for raw in ws:
+                event = json.loads(raw)
+                elapsed = time.time() - started
+                if event['type'] in ('partial', 'final'):
+                    marker = '…' if event['type'] == 'partial' else '✅'
+                    print(f"[{elapsed:6.1f}s] {marker} {event['start']:7.2f}-{event['end']:7.2f} {event['text']}")
+                elif event['type'] == 'result':
+                    result = event['result']
+                    print(f"\n[{elapsed:6.1f}s] 🤖 Final result: {len(result['transcript']['segments'])} segments")
+                    print(result['summary'])
+                else:
+                    print(f"[{elapsed:6.1f}s] {event}")
+
+        await asyncio.gather(sender(), receiver())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a WAV file through /api/transcribe-stream")
+    parser.add_argument("wav", help="16-bit mono WAV file")
+    parser.add_argument("--url", default="ws://localhost:8000/api/transcribe-stream")
+    parser.add_argument("--meeting-type", type=int, default=0)
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed (1.0 = realtime)")
+    parser.add_argument("--chunk-ms", type=int, default=100)
+    args = parser.parse_args()
+
+    asyncio.run(replay(args.wav, args.url, args.meeting_type, args.speed, args.chunk_ms))
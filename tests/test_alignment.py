@@ -0,0 +1,39 @@
+"""
+Tests for the alignment skip policy
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.alignment import AlignmentCache, align_transcript, count_speakers, should_align
+
+
+def test_policy_decisions():
+    assert should_align("always", 1)[0] is True
+    assert should_align("never", 3)[0] is False
+    assert should_align("multi-speaker", 1)[0] is False
+    assert should_align("multi-speaker", 2)[0] is True
+    with pytest.raises(ValueError):
+        should_align("sometimes", 2)
+
+
+def test_count_speakers_from_segment_list():
+    segments = [{"speaker": "SPEAKER_00"}, {"speaker": "SPEAKER_01"}, {"speaker": "SPEAKER_00"}]
+    assert count_speakers(segments) == 2
+    assert count_speakers([]) == 0
+
+
+def test_skip_reports_estimated_savings():
+    cache = AlignmentCache(device="cpu")
+    cache.record(audio_seconds=100.0, align_seconds=5.0)
+    result = {"segments": [{"start": 0.0, "end": 2.0, "text": "สวัสดี"}]}
+
+    aligned, info = align_transcript(result, [0.0] * 16000 * 60, "th", "cpu",
+                                     policy="multi-speaker", num_speakers=1, cache=cache)
+
+    assert aligned is result
+    assert info["applied"] is False
+    assert info["estimated_time_saved"] == pytest.approx(3.0)
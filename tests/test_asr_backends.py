@@ -0,0 +1,60 @@
+"""
+Tests for the pluggable ASR backends (fake backend through the pipeline and batcher)
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import PipelineConfig
+from app.services.asr_backends import ASRBackend, FakeBackend, create_backend
+from app.services.batching import SAMPLE_RATE, MicroBatcher
+from app.services.pipeline import TranscribeSummaryPipeline
+
+
+def _config(**overrides):
+    return PipelineConfig(profile="cpu-int8", **{"asr_backend": "fake", **overrides})
+
+
+def test_fake_backend_is_deterministic():
+    backend = create_backend(_config())
+    assert isinstance(backend, FakeBackend) and not backend.loaded
+    backend.load()
+
+    audio = np.zeros(70 * SAMPLE_RATE, dtype=np.float32)
+    result = backend.transcribe(audio, batch_size=4, language="th")
+    assert result == backend.transcribe(audio, batch_size=1, language="th")
+    assert [(seg["start"], seg["end"]) for seg in result["segments"]] == [(0.0, 30.0), (30.0, 60.0), (60.0, 70.0)]
+
+    batcher = MicroBatcher(backend, batch_size=8, max_wait=0.01)
+    assert batcher.transcribe(audio, language="th") == result
+
+    backend.unload()
+    assert not backend.loaded
+
+
+def test_pipeline_uses_configured_backend():
+    pipeline = TranscribeSummaryPipeline(_config())
+    text = pipeline.transcribe_window(np.zeros(5 * SAMPLE_RATE, dtype=np.float32))
+    assert text == "ทดสอบ 5.0 วินาที"
+    assert isinstance(pipeline.model, FakeBackend)
+
+    with pytest.raises(ValueError):
+        TranscribeSummaryPipeline(_config(asr_backend="nope"))
+
+
+def test_incomplete_backend_fails_at_creation():
+    class NoChunkDecoding(ASRBackend):
+        loaded = False
+
+        def load(self):
+            pass
+
+        def transcribe(self, audio, batch_size, language=None):
+            return {"segments": [], "language": language}
+
+    with pytest.raises(TypeError):
+        NoChunkDecoding(_config())
@@ -0,0 +1,96 @@
+"""
+Tests for cross-request ASR micro-batching (chunks from concurrent jobs share calls)
+"""
+import os
+import sys
+import threading
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.batching import MicroBatcher, SAMPLE_RATE, fixed_chunks
+
+
+class FakeASR:
+    """ASR backend stand-in: 'transcribes' each chunk as its duration"""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def transcribe_chunks(self, chunks, batch_size):
+        self.batch_sizes.append(len(chunks))
+        return [f"{len(chunk) / SAMPLE_RATE:.0f}s" for chunk in chunks]
+
+
+def test_concurrent_jobs_share_batches():
+    model = FakeASR()
+    batcher = MicroBatcher(model, batch_size=8, max_wait=0.5,
+                           chunker=lambda audio: fixed_chunks(audio, 10.0))
+    durations = [25, 12, 40, 5]  # 3 + 2 + 4 + 1 = 10 chunks
+    results = {}
+
+    def job(seconds):
+        audio = np.zeros(seconds * SAMPLE_RATE, dtype=np.float32)
+        results[seconds] = batcher.transcribe(audio, language="th")
+
+    threads = [threading.Thread(target=job, args=(d,)) for d in durations]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert sum(model.batch_sizes) == 10
+    assert len(model.batch_sizes) < 10
+    assert max(model.batch_sizes) <= 8
+
+    assert [seg["text"] for seg in results[25]["segments"]] == ["10s", "10s", "5s"]
+    assert [seg["text"] for seg in results[5]["segments"]] == ["5s"]
+    assert results[40]["segments"][-1] == {"text": "10s", "start": 30.0, "end": 40.0}
+
+
+def test_out_of_memory_splits_batch():
+    class OOMOnLargeBatches(FakeASR):
+        def transcribe_chunks(self, chunks, batch_size):
+            if batch_size > 2:
+                raise RuntimeError("CUDA out of memory")
+            return super().transcribe_chunks(chunks, batch_size)
+
+    model = OOMOnLargeBatches()
+    batcher = MicroBatcher(model, batch_size=8, max_wait=0.05,
+                           chunker=lambda audio: fixed_chunks(audio, 1.0))
+    result = batcher.transcribe(np.zeros(5 * SAMPLE_RATE, dtype=np.float32))
+
+    assert len(result["segments"]) == 5
+    assert batcher.batch_size <= 2
+
+
+def test_failing_chunk_only_fails_its_job():
+    class BadChunk(FakeASR):
+        def transcribe_chunks(self, chunks, batch_size):
+            if any(len(chunk) == 3 * SAMPLE_RATE for chunk in chunks):
+                self.batch_sizes.append(len(chunks))
+                raise ValueError("corrupt audio")
+            return super().transcribe_chunks(chunks, batch_size)
+
+    model = BadChunk()
+    batcher = MicroBatcher(model, batch_size=8, max_wait=0.5,
+                           chunker=lambda audio: fixed_chunks(audio, 10.0))
+    outcomes = {}
+
+    def job(seconds):
+        try:
+            outcomes[seconds] = batcher.transcribe(np.zeros(seconds * SAMPLE_RATE, dtype=np.float32))
+        except ValueError as e:
+            outcomes[seconds] = e
+
+    threads = [threading.Thread(target=job, args=(seconds,)) for seconds in (3, 15)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert model.batch_sizes[0] == 3  # Both jobs shared the failed batch, then retried per chunk
+    assert isinstance(outcomes[3], ValueError)
+    assert [seg["text"] for seg in outcomes[15]["segments"]] == ["10s", "5s"]
+    assert batcher.snapshot() == {"calls": 2, "chunks": 2, "jobs": 2}
@@ -0,0 +1,56 @@
+"""
+Tests for compact columnar transcript payloads and the paged segments endpoint
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.compact import compact_segments, expand_segments, segment_page
+
+SEGMENTS = [
+    {"start": 0.0, "end": 2.5, "speaker": "คนพูด 1", "text": " สวัสดีครับ ",
+     "words": [{"word": "สวัสดี", "start": 0.0, "end": 1.2, "score": 0.91}, {"word": "ครับ", "score": 0.5}]},
+    {"start": 2.5, "end": 4.01234, "speaker": "คนพูด 2", "text": "ค่ะ", "words": []},
+    {"start": 4.5, "end": 6.0, "speaker": "คนพูด 1", "text": "เริ่มประชุม"},
+]
+
+
+def test_columns_round_trip():
+    payload = compact_segments(SEGMENTS, include_words=True)
+    assert payload["speakers"] == ["คนพูด 1", "คนพูด 2"]
+    assert payload["speaker"] == [0, 1, 0]
+    assert payload["end"][1] == 4.012
+    assert payload["words"]["offsets"] == [0, 2, 2, 2]
+
+    rows = expand_segments(payload)
+    assert rows[0]["text"] == "สวัสดีครับ"
+    assert rows[0]["words"][1] == {"word": "ครับ", "start": None, "end": None, "score": 0.5}
+    assert "words" not in compact_segments(SEGMENTS)
+
+
+def test_page_by_time_range():
+    page = segment_page(SEGMENTS, offset=0, limit=1, start=2.0, end=5.0)
+    assert page["total"] == 3
+    assert page["next_offset"] == 1
+    page = segment_page(SEGMENTS, offset=0, limit=10, start=4.1)
+    assert [seg["start"] for seg in page["segments"]] == [4.5]
+    assert page["next_offset"] is None
+
+
+def test_segments_endpoint_etag():
+    from fastapi.testclient import TestClient
+    import api
+
+    api.result_sessions["compact-test"] = {"segments": SEGMENTS}
+    client = TestClient(api.app)
+    first = client.get("/api/session/compact-test/segments", params={"limit": 2})
+    assert first.status_code == 200
+    body = first.json()
+    assert body["next_offset"] == 2
+    assert body["segments"]["text"] == ["สวัสดีครับ", "ค่ะ"]
+
+    etag = first.headers["etag"]
+    cached = client.get("/api/session/compact-test/segments", params={"limit": 2}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    api.result_sessions.pop("compact-test")
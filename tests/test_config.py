@@ -0,0 +1,49 @@
+"""
+Tests for pipeline settings resolution (hardware profile sizing, env parsing)
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import PipelineConfig
+from app.core.hardware import select_profile
+
+
+def _gpu(memory_gb):
+    return {"cuda_available": True, "gpu_memory_gb": memory_gb, "cpu_cores": 16}
+
+
+def test_a100_40gb_keeps_batch_24():
+    profile = select_profile(_gpu(42505273344 / 1024 ** 3))  # torch total_memory of an A100 40GB
+    assert (profile["profile"], profile["COMPUTE_TYPE"], profile["BATCH_SIZE"]) == ("cuda-fp16", "float16", 24)
+    assert select_profile(_gpu(80.0))["BATCH_SIZE"] == 48
+
+
+def test_invalid_numeric_env_names_the_setting(monkeypatch):
+    monkeypatch.setenv("PIPELINE_BATCH_SIZE", "abc")
+    with pytest.raises(ValueError, match="PIPELINE_BATCH_SIZE"):
+        PipelineConfig(profile="cpu-int8")
+
+    monkeypatch.setenv("PIPELINE_BATCH_SIZE", "12")
+    monkeypatch.setenv("PIPELINE_MIN_SPEAKERS", "none")
+    config = PipelineConfig(profile="cpu-int8")
+    assert config.BATCH_SIZE == 12 and config.MIN_SPEAKERS is None
+
+
+def test_unset_and_bool_env_values(monkeypatch):
+    monkeypatch.setenv("PIPELINE_DIARIZE", "off")
+    monkeypatch.setenv("PIPELINE_INITIAL_PROMPT", "none")
+    config = PipelineConfig(profile="cpu-int8")
+    assert config.DIARIZE is False and config.INITIAL_PROMPT == "none"
+
+    monkeypatch.setenv("PIPELINE_BATCH_SIZE", "")
+    with pytest.raises(ValueError, match="PIPELINE_BATCH_SIZE"):
+        PipelineConfig(profile="cpu-int8")
+    monkeypatch.delenv("PIPELINE_BATCH_SIZE")
+
+    monkeypatch.setenv("PIPELINE_DIARIZE", "ture")
+    with pytest.raises(ValueError, match="Invalid bool for PIPELINE_DIARIZE"):
+        PipelineConfig(profile="cpu-int8")
@@ -0,0 +1,72 @@
+"""
+Tests for the markdown-to-DOCX summary parser (GPT-style markdown)
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.export import DOCX_AVAILABLE, _add_markdown
+
+pytestmark = pytest.mark.skipif(not DOCX_AVAILABLE, reason="python-docx not installed")
+
+
+def _render(markdown_text: str):
+    from docx import Document
+    doc = Document()
+    _add_markdown(doc, markdown_text)
+    return [(p.style.name, p.text) for p in doc.paragraphs]
+
+
+def test_headings_and_rules():
+    assert _render("# ภาพรวม\n## ประเด็น\n### รายละเอียด\n---\n***\nข้อความ") == [
+        ("Heading 1", "ภาพรวม"),
+        ("Heading 2", "ประเด็น"),
+        ("Heading 3", "รายละเอียด"),
+        ("Normal", "ข้อความ"),
+    ]
+
+
+def test_nested_lists_up_to_three_levels():
+    markdown = (
+        "- งานหลัก\n"
+        "  - งานย่อย\n"
+        "    - รายละเอียด\n"
+        "      - ลึกเกินสามระดับ\n"
+        "1. ขั้นแรก\n"
+        "   1. ขั้นย่อย\n"
+        "      1. ขั้นย่อยสุด\n"
+        "- กลับระดับแรก"
+    )
+    assert _render(markdown) == [
+        ("List Bullet", "งานหลัก"),
+        ("List Bullet 2", "งานย่อย"),
+        ("List Bullet 3", "รายละเอียด"),
+        ("List Bullet 3", "ลึกเกินสามระดับ"),
+        ("List Continue", "1. ขั้นแรก"),
+        ("List Continue 2", "1. ขั้นย่อย"),
+        ("List Continue 3", "1. ขั้นย่อยสุด"),
+        ("List Bullet", "กลับระดับแรก"),
+    ]
+
+
+def test_bold_runs():
+    from docx import Document
+    doc = Document()
+    _add_markdown(doc, "- ผู้รับผิดชอบ: **สมชาย** ภายใน **ศุกร์**")
+    runs = [(run.text, bool(run.bold)) for run in doc.paragraphs[0].runs]
+    assert runs == [("ผู้รับผิดชอบ: ", False), ("สมชาย", True), (" ภายใน ", False), ("ศุกร์", True)]
+
+
+def test_numbering_restarts_in_separate_lists():
+    markdown = "1. ก\n2. ข\n3. ค\n\nข้อความคั่น\n\n1. ง\n2. จ"
+    assert _render(markdown) == [
+        ("List Continue", "1. ก"),
+        ("List Continue", "2. ข"),
+        ("List Continue", "3. ค"),
+        ("Normal", "ข้อความคั่น"),
+        ("List Continue", "1. ง"),
+        ("List Continue", "2. จ"),
+    ]
@@ -0,0 +1,54 @@
+"""
+Tests for the post-ASR hallucination filter (loop detection, re-decode, drop)
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.hallucination import (
+    REDECODE_OPTIONS, check_segment, compression_ratio, filter_hallucinations, repetition_ratio,
+)
+
+NORMAL = ("วันนี้เราจะมาประชุมเรื่องงบประมาณประจำปีของฝ่ายการตลาด โดยมีวาระหลักสามเรื่อง "
+          "เรื่องแรกคือการทบทวนค่าใช้จ่ายไตรมาสที่ผ่านมา เรื่องที่สองคือแผนการจัดกิจกรรมส่งเสริมการขาย")
+LOOP = "ขอบคุณครับ " * 20
+
+
+class ScriptedBackend:
+    """Returns queued texts for re-decoded windows and records the call"""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.calls = []
+
+    def transcribe_chunks(self, chunks, batch_size, options=None):
+        self.calls.append(([len(chunk) for chunk in chunks], options))
+        return self.texts[:len(chunks)]
+
+
+def test_detectors_separate_loops_from_speech():
+    assert repetition_ratio(LOOP) > 0.9 and repetition_ratio(NORMAL) < 0.1
+    assert compression_ratio(LOOP) > 5 and compression_ratio(NORMAL) < 2.0
+    assert check_segment({"text": NORMAL}, 0.5, 2.4, -1.0) == []
+    assert check_segment({"text": "สวัสดี", "avg_logprob": -1.5}, 0.5, 2.4, -1.0) == ["low_logprob"]
+
+
+def test_flagged_windows_are_redecoded_or_dropped():
+    audio = np.zeros(40 * 16000, dtype=np.float32)
+    segments = [
+        {"text": NORMAL, "start": 0.0, "end": 10.0},
+        {"text": LOOP, "start": 10.0, "end": 25.0},
+        {"text": LOOP, "start": 25.0, "end": 30.0},
+    ]
+    backend = ScriptedBackend(["ปิดประชุมครับ", LOOP])
+    kept, report = filter_hallucinations(segments, audio, backend)
+
+    assert [seg["text"] for seg in kept] == [NORMAL, "ปิดประชุมครับ"]
+    assert kept[1]["start"] == 10.0 and kept[1]["end"] == 25.0
+    assert backend.calls == [([15 * 16000, 5 * 16000], REDECODE_OPTIONS)]
+    assert report["flagged"] == 2 and report["redecoded"] == 1 and report["dropped"] == 1
+    assert report["redecoded_seconds"] == 20.0
+    assert report["reasons"] == {"repetition": 2, "compression": 2}
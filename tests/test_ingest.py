@@ -0,0 +1,69 @@
+"""
+Tests for the video ingest fast path (ffprobe + audio stream copy)
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils import ingest
+
+
+def test_probe_ignores_cover_art(monkeypatch):
+    streams = {
+        "streams": [
+            {"codec_type": "video", "codec_name": "mjpeg", "disposition": {"attached_pic": 1}},
+            {"codec_type": "audio", "codec_name": "mp3"},
+        ],
+        "format": {"duration": "61.5"},
+    }
+    monkeypatch.setattr(ingest.subprocess, "run", lambda *a, **k: subprocess.CompletedProcess(a, 0, json.dumps(streams), ""))
+    assert ingest.probe("song.mp3") == {"has_video": False, "audio_codec": "mp3", "duration": 61.5}
+
+
+def test_falls_back_to_original_without_video(tmp_path, monkeypatch):
+    path = tmp_path / "meeting.mp4"
+    path.write_bytes(b"\0" * 10)
+    monkeypatch.setattr(ingest, "probe", lambda p: None)  # e.g. ffprobe not installed
+    result = ingest.prepare_audio(str(path))
+    assert result["audio_file"] == str(path) and not result["demuxed"] and result["dir"] is None
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_demux_video(tmp_path):
+    video = tmp_path / "screen.mp4"
+    subprocess.run([
+        "ffmpeg", "-v", "error", "-f", "lavfi", "-i", "testsrc=duration=2:size=320x240",
+        "-f", "lavfi", "-i", "sine=duration=2", "-c:v", "libx264", "-c:a", "aac", "-shortest", str(video),
+    ], check=True)
+    result = ingest.prepare_audio(str(video))
+    assert result["demuxed"] and result["audio_file"].endswith(".m4a")
+    assert result["audio_bytes"] < result["source_bytes"]
+    shutil.rmtree(result["dir"])
+
+
+def test_failed_job_removes_demuxed_audio(tmp_path, monkeypatch):
+    from app.core.config import PipelineConfig
+    from app.services import pipeline as pipeline_module
+
+    work_dir = tmp_path / "ingest_x"
+    work_dir.mkdir()
+    (work_dir / "audio.m4a").write_bytes(b"\0" * 10)
+    monkeypatch.setattr(pipeline_module, "prepare_audio", lambda path: {
+        "audio_file": str(work_dir / "audio.m4a"), "demuxed": True, "audio_codec": "aac",
+        "source_bytes": 100, "audio_bytes": 10, "dir": str(work_dir), "time": 0.0,
+    })
+
+    def fail():
+        raise RuntimeError("CUDA error")
+
+    monkeypatch.setattr(pipeline_module, "load_ml_stack", fail)
+    pipeline = pipeline_module.TranscribeSummaryPipeline(PipelineConfig(profile="cpu-int8", asr_backend="fake"))
+    with pytest.raises(RuntimeError):
+        pipeline.process("screen.mp4")
+    assert not work_dir.exists()
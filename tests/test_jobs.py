@@ -0,0 +1,85 @@
+"""
+Tests for durable async jobs (submit, poll, restart recovery)
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.jobs import JobStore, new_job_id, valid_job_id
+from app.services.media import MediaStore
+from app.services.store import MeetingStore
+
+
+def test_job_lifecycle_and_restart(tmp_path):
+    store = JobStore(str(tmp_path / "meetings.db"))
+    job_id = new_job_id()
+    assert valid_job_id(job_id) and not valid_job_id("../etc")
+    assert store.create(job_id, "a.mp3", 0, "normal")
+    assert not store.create(job_id, "a.mp3", 0, "normal")
+
+    store.set_status(job_id, "done", result={"summary": "สรุป"})
+    record = store.get(job_id)
+    assert record["status"] == "done" and record["result"] == {"summary": "สรุป"}
+
+    other = new_job_id()
+    store.create(other, "b.mp3", 0, "batch")
+    store.set_status(other, "running")
+    assert JobStore(store.path).fail_interrupted() == 1
+    assert store.get(other)["status"] == "failed"
+
+
+class FakePipeline:
+    def __init__(self, model_pool=None, tier=None):
+        self.tier = tier or "accurate"
+
+    def process(self, audio_file, meeting_type_id=0, job=None, force_refresh=False):
+        job.acquire()
+        job.release()
+        segments = [{"start": 0.0, "end": 1.0, "speaker": "คนพูด 1", "text": "สวัสดี"}]
+        return {
+            'audio_length_seconds': 1.0,
+            'processing_time': {'model_load': 0, 'audio_load': 0, 'transcription': 0,
+                                'diarization': 0, 'summarization': 0, 'total': 0},
+            'full_transcript': {
+                'segments': segments,
+                'combined_text': "สวัสดี",
+                'transcript_with_speakers': "[คนพูด 1]: สวัสดี",
+                'speaker_summary': {'speaking_time': {"คนพูด 1": 1.0}, 'word_count': {"คนพูด 1": 1}},
+            },
+            'summary': "สรุป",
+            'speaker_clips': {},
+            'tier': self.tier,
+        }
+
+
+def test_submit_and_poll(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import api
+
+    db = str(tmp_path / "meetings.db")
+    monkeypatch.setattr(api, "TranscribeSummaryPipeline", FakePipeline)
+    monkeypatch.setattr(api, "_job_store", JobStore(db))
+    monkeypatch.setattr(api, "_meeting_store", MeetingStore(db))
+    monkeypatch.setattr(api, "_media_store", MediaStore(str(tmp_path / "media")))
+    client = TestClient(api.app)
+
+    submitted = client.post("/api/jobs", files={"audio": ("m.wav", b"RIFF", "audio/wav")},
+                            data={"tier": "draft"})
+    assert submitted.status_code == 202
+    status_url = submitted.json()["status_url"]
+
+    for _ in range(100):
+        record = client.get(status_url).json()
+        if record["status"] == "done":
+            break
+        time.sleep(0.02)
+    assert record["status"] == "done"
+    assert record["result"]["summary"] == "สรุป"
+    assert record["result"]["tier"] == "draft"
+    transcript = record["result"]["transcript"]
+    assert transcript["segments"] is None and transcript["segment_columns"]["text"] == ["สวัสดี"]
+    assert transcript["segments_url"] == f"/api/session/{record['result']['session_id']}/segments"
+    assert client.get(record["result"]["audio_url"]).content == b"RIFF"
+    assert client.get("/api/jobs/unknown-job-id-123456").status_code == 404
@@ -0,0 +1,111 @@
+"""
+Tests for meeting media storage and range / conditional serving
+"""
+import os
+import shutil
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.media import MediaStore, content_etag
+
+
+def test_store_original_and_serve_ranges(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import api
+
+    upload = tmp_path / "upload.mp3"
+    upload.write_bytes(bytes(range(256)) * 40)
+    media = MediaStore(str(tmp_path / "media"))
+    path = media.store_original("meeting-1", str(upload))
+    assert not upload.exists() and media.original_path("meeting-1") == path
+    with pytest.raises(ValueError):
+        media.meeting_dir("../escape")
+
+    monkeypatch.setattr(api, "_media_store", media)
+    client = TestClient(api.app)
+    url = "/api/meetings/meeting-1/audio"
+
+    full = client.get(url)
+    assert full.status_code == 200 and len(full.content) == 10240
+    assert full.headers["etag"] == content_etag(path)
+    assert "immutable" in full.headers["cache-control"]
+
+    partial = client.get(url, headers={"Range": "bytes=100-199"})
+    assert partial.status_code == 206
+    assert partial.content == (bytes(range(256)) * 40)[100:200]
+
+    assert client.get(url, headers={"If-None-Match": full.headers["etag"]}).status_code == 304
+    assert client.get(url, params={"start": 5, "end": 2}).status_code == 400
+    assert client.get("/api/meetings/missing/audio").status_code == 404
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_slice_is_cached(tmp_path):
+    import subprocess
+
+    source = tmp_path / "tone.wav"
+    subprocess.run(["ffmpeg", "-v", "error", "-f", "lavfi", "-i", "sine=duration=5", str(source)], check=True)
+    media = MediaStore(str(tmp_path / "media"))
+    media.store_original("m", str(source))
+    first = media.slice("m", 1.04, 2.0)
+    assert first and first == media.slice("m", 1.0, 2.0)
+
+
+def test_playback_artifacts(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import api
+
+    work = tmp_path / "playback"
+    work.mkdir()
+    (work / "peaks.json").write_text('{"version":2,"data":[]}')
+    media = MediaStore(str(tmp_path / "media"))
+    stored = media.store_playback("meeting-2", {"peaks": str(work / "peaks.json"), "proxy": None, "dir": str(work)})
+    assert list(stored) == ["peaks"] and not work.exists()
+
+    monkeypatch.setattr(api, "_media_store", media)
+    client = TestClient(api.app)
+    assert client.get("/api/meetings/meeting-2/playback/peaks").json()["version"] == 2
+    assert client.get("/api/meetings/meeting-2/playback/proxy").status_code == 404
+    assert client.get("/api/meetings/meeting-2/playback/other").status_code == 404
+
+
+def test_playback_discarded_when_audio_storage_disabled(tmp_path, monkeypatch):
+    import api
+    from app.services.store import MeetingStore
+
+    work = tmp_path / "playback"
+    work.mkdir()
+    (work / "peaks.json").write_text("{}")
+    monkeypatch.setattr(api, "STORE_MEETING_AUDIO", False)
+    monkeypatch.setattr(api, "_meeting_store", MeetingStore(str(tmp_path / "meetings.db")))
+    monkeypatch.setattr(api, "_media_store", MediaStore(str(tmp_path / "media")))
+    result = {
+        'audio_length_seconds': 1.0,
+        'processing_time': {'model_load': 0, 'audio_load': 0, 'transcription': 0,
+                            'diarization': 0, 'summarization': 0, 'total': 0},
+        'full_transcript': {'segments': [], 'combined_text': "", 'transcript_with_speakers': "",
+                            'speaker_summary': {'speaking_time': {}, 'word_count': {}}},
+        'summary': "สรุป",
+        'playback': {'peaks': str(work / "peaks.json"), 'dir': str(work), 'time': 0.1},
+    }
+    response = api._build_transcribe_response(result, "m.wav", 0)
+    assert response.playback is None and not work.exists()
+    assert not os.listdir(tmp_path / "media")
+
+
+def test_file_digest_hashes_in_blocks(tmp_path, monkeypatch):
+    import hashlib
+
+    from app.services import media
+
+    data = os.urandom(3000)
+    path = tmp_path / "original.bin"
+    path.write_bytes(data)
+    monkeypatch.setattr(media, "HASH_READ_SIZE", 1024)
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)  # Python 3.10 has none
+
+    assert media.file_digest(str(path)) == hashlib.sha256(data).hexdigest()
+    assert (tmp_path / "original.bin.sha256").read_text() == hashlib.sha256(data).hexdigest()
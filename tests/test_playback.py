@@ -0,0 +1,46 @@
+"""
+Tests for waveform peaks and the Ogg seek index of the playback proxy
+"""
+import os
+import struct
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.playback import compute_peaks, ogg_seek_index
+
+
+def test_peaks_min_max_per_bucket():
+    audio = np.zeros(16000, dtype=np.float32)
+    audio[100] = 1.0
+    audio[900] = -0.5
+    peaks = compute_peaks(audio, 16000, peaks_per_second=20)
+    assert peaks["samples_per_pixel"] == 800 and peaks["length"] == 20
+    assert peaks["data"][:4] == [0, 127, -64, 0]
+
+
+def _ogg_page(granule: int, body: bytes) -> bytes:
+    lacing = []
+    remaining = len(body)
+    while remaining >= 255:
+        lacing.append(255)
+        remaining -= 255
+    lacing.append(remaining)
+    header = b"OggS" + bytes([0, 0]) + struct.pack("<qIII", granule, 1, 0, 0) + bytes([len(lacing)])
+    return header + bytes(lacing) + body
+
+
+def test_seek_index_from_granules(tmp_path):
+    opus_head = b"OpusHead" + bytes([1, 1]) + struct.pack("<H", 312) + b"\0" * 7
+    pages = [_ogg_page(0, opus_head), _ogg_page(0, b"OpusTags")]
+    for second in range(1, 13):
+        pages.append(_ogg_page(second * 48000 + 312, b"x" * 300))
+    path = tmp_path / "proxy.ogg"
+    path.write_bytes(b"".join(pages))
+
+    index = ogg_seek_index(str(path), interval=5.0)
+    assert [entry[0] for entry in index] == [1.0, 6.0, 11.0]
+    data = path.read_bytes()
+    assert all(data[offset:offset + 4] == b"OggS" for _, offset in index)
@@ -0,0 +1,123 @@
+"""
+Tests for GPU job scheduling (SJF, fair queuing per API key, stage-boundary preemption)
+"""
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.scheduler import JobCancelled, JobScheduler
+
+
+def _run_after_blocker(scheduler, jobs):
+    """Hold the only slot while `jobs` queue up, then record the order they run in"""
+    blocker = scheduler.submit(api_key="blocker")
+    blocker.set_cost(1.0)
+    blocker.acquire()
+
+    order = []
+
+    def run(name, job):
+        job.acquire()
+        order.append(name)
+        time.sleep(0.01)
+        job.release()
+
+    threads = []
+    for name, job in jobs:
+        thread = threading.Thread(target=run, args=(name, job))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.02)  # Deterministic arrival order
+
+    blocker.release()
+    for thread in threads:
+        thread.join(timeout=5)
+    return order
+
+
+def test_shortest_job_first():
+    scheduler = JobScheduler(slots=1, policy="sjf")
+    jobs = []
+    for name, cost in [("board-meeting", 14400.0), ("standup", 300.0), ("sync", 900.0)]:
+        job = scheduler.submit(api_key=name)
+        job.set_cost(cost)
+        jobs.append((name, job))
+
+    assert _run_after_blocker(scheduler, jobs) == ["standup", "sync", "board-meeting"]
+
+
+def test_fair_queuing_between_keys():
+    scheduler = JobScheduler(slots=1, policy="wfq")
+    jobs = []
+    for name, key in [("a1", "team-a"), ("a2", "team-a"), ("a3", "team-a"), ("b1", "team-b")]:
+        job = scheduler.submit(api_key=key)
+        job.set_cost(100.0)
+        jobs.append((name, job))
+
+    order = _run_after_blocker(scheduler, jobs)
+    assert order.index("b1") < order.index("a2")
+
+
+def test_priority_class_preempts_at_checkpoint():
+    scheduler = JobScheduler(slots=1, policy="sjf")
+    long_job = scheduler.submit(priority="batch")
+    long_job.set_cost(10000.0)
+    long_job.acquire()
+
+    live = scheduler.submit(priority="interactive")
+    live.set_cost(60.0)
+    started = threading.Event()
+
+    def run_live():
+        live.acquire()
+        started.set()
+        time.sleep(0.05)
+        live.release()
+
+    thread = threading.Thread(target=run_live)
+    thread.start()
+    time.sleep(0.02)
+    assert not started.is_set()
+
+    long_job.checkpoint(remaining_fraction=0.5)  # Blocks until the live job is done
+    assert started.is_set()
+    assert long_job.preemptions == 1
+    long_job.release()
+    thread.join(timeout=5)
+
+
+def test_cancel_queued_and_running_jobs():
+    scheduler = JobScheduler(slots=1)
+    running = scheduler.submit(api_key="a")
+    running.set_cost(10.0)
+    running.acquire()
+
+    queued = scheduler.submit(api_key="b")
+    queued.set_cost(1.0)
+    errors = []
+
+    def wait_for_slot():
+        try:
+            queued.acquire()
+        except JobCancelled as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=wait_for_slot)
+    thread.start()
+    time.sleep(0.05)
+    queued.cancel()
+    thread.join(timeout=5)
+    assert len(errors) == 1
+    assert scheduler.stats()['waiting'] == 0
+
+    running.cancel()
+    with pytest.raises(JobCancelled):
+        running.checkpoint(0.5)
+    running.release()
+    assert scheduler.stats()['running'] == 0
+    assert "a" not in running.describe().values()  # API keys never reach responses / job store
@@ -0,0 +1,37 @@
+"""
+Tests for speaker label remapping (rename speakers without re-running the pipeline)
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.speaker_mapping import remap_speaker_text, remap_segments, remap_speaker_summary
+
+
+def test_remap_does_not_touch_longer_labels():
+    mapping = {"คนพูด 1": "สมชาย", "คนพูด 10": "สมหญิง"}
+    text = "**คนพูด 1** สั่งให้ **คนพูด 10** ทำรายงาน โดยคนพูด 1 เป็นผู้ตรวจ"
+    assert remap_speaker_text(text, mapping) == "**สมชาย** สั่งให้ **สมหญิง** ทำรายงาน โดยสมชาย เป็นผู้ตรวจ"
+
+
+def test_remap_segments_and_summary_merge_same_name():
+    mapping = {"คนพูด 1": "สมชาย", "คนพูด 2": "สมชาย"}
+    segments = [{"start": 0, "end": 1, "text": "a", "speaker": "คนพูด 1"},
+                {"start": 1, "end": 2, "text": "b", "speaker": "คนพูด 3"}]
+    assert [s["speaker"] for s in remap_segments(segments, mapping)] == ["สมชาย", "คนพูด 3"]
+    assert segments[0]["speaker"] == "คนพูด 1"  # original cache untouched
+
+    summary = remap_speaker_summary(
+        {"speaking_time": {"คนพูด 1": 10.0, "คนพูด 2": 5.0}, "word_count": {"คนพูด 1": 3, "คนพูด 2": 4}},
+        mapping,
+    )
+    assert summary == {"speaking_time": {"สมชาย": 15.0}, "word_count": {"สมชาย": 7}}
+
+
+def test_remap_segments_renames_word_speakers():
+    segments = [{"start": 0, "end": 1, "text": "a b", "speaker": "คนพูด 1",
+                 "words": [{"word": "a", "speaker": "คนพูด 1"}, {"word": "b", "speaker": "คนพูด 2"}]}]
+    remapped = remap_segments(segments, {"คนพูด 1": "สมชาย", "คนพูด 2": "สมหญิง"})
+    assert [word["speaker"] for word in remapped[0]["words"]] == ["สมชาย", "สมหญิง"]
+    assert segments[0]["words"][0]["speaker"] == "คนพูด 1"
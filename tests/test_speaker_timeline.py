@@ -0,0 +1,62 @@
+"""
+Tests for the diarization speaker timeline
+"""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.speaker_timeline import SpeakerTimeline, intervals_from_diarization, merge_speaking_time
+
+
+def test_overlap_turns_and_interruptions():
+    timeline = SpeakerTimeline([
+        (0.0, 10.0, "A"),
+        (8.0, 12.0, "B"),   # interrupts A, 2 s overlap
+        (12.0, 15.0, "A"),  # touches B's end: no overlap
+        (14.5, 14.8, "B"),  # backchannel: overlap but too short to count as interruption
+    ])
+    stats = timeline.statistics()
+    assert stats['speaking_time'] == pytest.approx({"A": 13.0, "B": 4.3})
+    assert stats['overlap_time'] == pytest.approx({"A": 2.3, "B": 2.3})
+    assert stats['total_overlap'] == pytest.approx(2.3)
+    assert stats['turns'] == {"A": 2, "B": 2}
+    assert stats['interruptions'] == {"A": 0, "B": 1}
+    assert stats['interrupted'] == {"A": 1, "B": 0}
+
+
+def test_same_speaker_overlap_is_not_double_counted():
+    stats = SpeakerTimeline([(0.0, 5.0, "A"), (3.0, 8.0, "A")]).statistics()
+    assert stats['speaking_time']["A"] == pytest.approx(8.0)
+    assert stats['total_overlap'] == 0
+
+
+def test_query_matches_brute_force():
+    rng = random.Random(7)
+    intervals = []
+    for _ in range(300):
+        start = rng.uniform(0, 600)
+        intervals.append((start, start + rng.uniform(0.2, 20), rng.choice("ABC")))
+    timeline = SpeakerTimeline(intervals)
+    for _ in range(100):
+        start = rng.uniform(0, 600)
+        end = start + rng.uniform(0.1, 30)
+        expected = sorted(i for i in intervals if i[0] < end and i[1] > start)
+        assert timeline.overlapping(start, end) == expected
+
+
+def test_dominant_speaker_and_labels():
+    rows = [{"start": 0.0, "end": 4.0, "speaker": "SPEAKER_00"}, {"start": 3.0, "end": 9.0, "speaker": "SPEAKER_01"}]
+    timeline = SpeakerTimeline(intervals_from_diarization(rows, str.lower))
+    assert timeline.dominant_speaker(2.0, 6.0) == "speaker_01"
+    assert timeline.dominant_speaker(20.0, 30.0) is None
+
+
+def test_speaking_time_keeps_speakers_missing_from_the_timeline():
+    timeline = SpeakerTimeline([(0.0, 4.0, "คนพูด 1"), (3.0, 6.0, "คนพูด 2")])
+    segment_time = {"คนพูด 1": 3.5, "คนพูด 2": 2.5, "ไม่ทราบ": 1.2}
+    merged = merge_speaking_time(segment_time, timeline.statistics()["speaking_time"])
+    assert merged == {"คนพูด 1": 4.0, "คนพูด 2": 3.0, "ไม่ทราบ": 1.2}
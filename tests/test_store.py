@@ -0,0 +1,88 @@
+"""
+Tests for the persistent meeting store
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.store import MeetingStore, pack_segments, unpack_segments
+
+
+def _record(meeting_type_id=1, created_at=0.0):
+    return {
+        'audio_file': 'meeting.mp3',
+        'meeting_type_id': meeting_type_id,
+        'audio_length_seconds': 12.5,
+        'segments': [
+            {'start': 0.0, 'end': 4.2, 'speaker': 'คนพูด 1', 'text': 'สวัสดีครับ', 'words': []},
+            {'start': 4.2, 'end': 12.5, 'speaker': 'คนพูด 2', 'text': 'เริ่มประชุมกันเลย'},
+        ],
+        'speaker_summary': {'speaking_time': {'คนพูด 1': 4.2, 'คนพูด 2': 8.3}},
+        'summary': '## สรุป',
+        'processing_time': {'total': 3.0},
+        'created_at': created_at,
+    }
+
+
+def test_segments_roundtrip_compactly():
+    segments = [{'start': i * 1.0, 'end': i + 0.5, 'speaker': 'คนพูด 1', 'text': 'ทดสอบ ' * 5} for i in range(500)]
+    blob = pack_segments(segments)
+    assert unpack_segments(blob) == segments
+    assert len(blob) < len(str(segments).encode('utf-8')) / 10
+
+
+def test_save_list_get_update_delete(tmp_path):
+    store = MeetingStore(str(tmp_path / "meetings.db"))
+    store.save("old", _record(meeting_type_id=1, created_at=1.0))
+    store.save("new", _record(meeting_type_id=2, created_at=2.0))
+
+    listing = store.list()
+    assert listing['total'] == 2
+    assert [m['id'] for m in listing['meetings']] == ["new", "old"]
+    assert listing['meetings'][0]['speakers'] == ['คนพูด 1', 'คนพูด 2']
+    assert 'segments' not in listing['meetings'][0]
+    assert [m['id'] for m in store.list(meeting_type_id=1)['meetings']] == ["old"]
+
+    meeting = store.get("old")
+    assert meeting['segments'][1] == {'start': 4.2, 'end': 12.5, 'speaker': 'คนพูด 2', 'text': 'เริ่มประชุมกันเลย'}
+    assert meeting['processing_time'] == {'total': 3.0}
+
+    renamed = [dict(seg, speaker='สมชาย') for seg in meeting['segments']]
+    assert store.update("old", segments=renamed, summary="## สรุปใหม่")
+    assert store.get("old")['speakers'] == ['สมชาย']
+    assert store.get("old", include_segments=False)['summary'] == "## สรุปใหม่"
+
+    assert store.delete("old")
+    assert store.get("old") is None
+
+
+def test_thai_search_returns_meeting_speaker_and_time(tmp_path):
+    store = MeetingStore(str(tmp_path / "meetings.db"))
+    store.save("m1", _record())
+    store.save("m2", {**_record(), 'segments': [
+        {'start': 30.0, 'end': 35.0, 'speaker': 'คนพูด 3', 'text': 'ขออนุมัติงบประมาณโครงการ Budget ปีหน้า'},
+    ]})
+
+    hits = store.search("งบประมาณ")
+    assert [(h['meeting_id'], h['speaker'], h['start']) for h in hits] == [("m2", "คนพูด 3", 30.0)]
+    assert store.search("budget")[0]['meeting_id'] == "m2"
+    assert store.search("ประชุม")[0]['meeting_id'] == "m1"
+    assert store.search("งบประชุม") == []
+
+    renamed = [dict(seg, speaker='สมชาย') for seg in store.get("m2")['segments']]
+    store.update("m2", segments=renamed)
+    assert store.search("งบประมาณ", sort="relevance")[0]['speaker'] == 'สมชาย'
+
+    store.delete("m2")
+    assert store.search("งบประมาณ") == []
+
+
+def test_recent_search_follows_meeting_age_not_last_edit(tmp_path):
+    store = MeetingStore(str(tmp_path / "meetings.db"))
+    store.save("old", _record(created_at=1.0))
+    store.save("new", _record(created_at=2.0))
+    store.update("old", segments=[dict(seg, speaker='สมชาย') for seg in store.get("old")['segments']])
+
+    hits = store.search("ประชุม")
+    assert [h['meeting_id'] for h in hits] == ["new", "old"]
@@ -0,0 +1,82 @@
+"""
+Tests for live-stream endpointing (partial/final events from the energy VAD)
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.streaming import StreamingTranscriber, SAMPLE_RATE, pcm16_to_float32
+
+
+def _tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+def test_utterances_are_endpointed_on_silence():
+    calls = []
+    streamer = StreamingTranscriber(transcribe_fn=lambda w: calls.append(len(w)) or "ข้อความ")
+
+    events = []
+    audio = np.concatenate([_silence(0.5), _tone(2.0), _silence(1.0), _tone(1.0), _silence(0.2)])
+    for start in range(0, len(audio), 1600):  # 100 ms frames
+        events += streamer.feed(audio[start:start + 1600])
+    events += streamer.flush()
+
+    finals = [e for e in events if e['type'] == 'final']
+    assert len(finals) == 2
+    assert abs(finals[0]['start'] - 0.5) < 0.05
+    assert finals[1]['start'] > finals[0]['end']
+    assert any(e['type'] == 'partial' for e in events)
+    assert len(streamer.audio) == len(audio)
+
+
+def test_pcm16_resampling():
+    pcm = (np.ones(8000) * 1000).astype('<i2').tobytes()  # 1 s at 8 kHz
+    samples = pcm16_to_float32(pcm, sample_rate=8000)
+    assert len(samples) == SAMPLE_RATE
+    assert np.allclose(samples, 1000 / 32768.0)
+
+
+def test_websocket_rejects_bad_rate_and_buffers_odd_bytes(monkeypatch):
+    from fastapi.testclient import TestClient
+    from starlette.websockets import WebSocketDisconnect
+    import api
+
+    fed = []
+
+    class RecordingTranscriber:
+        total_samples = 0
+
+        def __init__(self, transcribe_fn):
+            pass
+
+        def feed(self, samples):
+            fed.append(samples)
+            return []
+
+        def flush(self):
+            return []
+
+    monkeypatch.setattr(api, "StreamingTranscriber", RecordingTranscriber)
+    client = TestClient(api.app)
+
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/api/transcribe-stream?sample_rate=0") as ws:
+            ws.receive_json()
+
+    pcm = (np.arange(3) * 1000).astype('<i2').tobytes()  # 6 bytes, sent as 3 + 3
+    with client.websocket_connect("/api/transcribe-stream") as ws:
+        ws.send_bytes(pcm[:3])
+        ws.send_bytes(pcm[3:])
+        ws.send_json({"type": "stop"})
+    assert [len(samples) for samples in fed] == [1, 2]
+    assert np.allclose(np.concatenate(fed), np.arange(3) * 1000 / 32768.0)
@@ -0,0 +1,63 @@
+"""
+Tests for two-phase summarization (cheap meeting-type classification, then focused prompt)
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.meeting import MEETING_TYPES
+from app.services import summarizer
+from app.services.summary_cache import SummaryCache
+
+TRANSCRIPT = "\n".join(f"[คนพูด {i % 3 + 1}]: วาระที่ {i} " + "ข้อความ" * 80 for i in range(100))
+SPEAKERS = {'speaking_time': {"คนพูด 1": 60.0, "คนพูด 2": 30.0}, 'word_count': {"คนพูด 1": 100, "คนพูด 2": 50}}
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"choices": [{"message": {"content": self.content}}]}
+
+
+def test_classification_sample_is_small():
+    sample = summarizer.classification_sample(TRANSCRIPT)
+    lines = sample.splitlines()
+    assert len(lines) == 2 * summarizer.CLASSIFY_SAMPLE_TURNS + 1
+    assert lines[0].startswith("[คนพูด 1]: วาระที่ 0 ") and "วาระที่ 50 " in lines[summarizer.CLASSIFY_SAMPLE_TURNS + 1]
+    assert max(len(line) for line in lines) <= summarizer.CLASSIFY_MAX_TURN_CHARS
+
+
+def test_auto_detect_classifies_then_uses_focused_prompt(tmp_path, monkeypatch):
+    requests_sent = []
+
+    def fake_post(url, headers, json, timeout):
+        requests_sent.append(json)
+        return FakeResponse("3" if json["max_tokens"] == summarizer.CLASSIFY_MAX_TOKENS else "สรุปการประชุม")
+
+    monkeypatch.setattr(summarizer, "NTC_API_KEY", "test-key")
+    monkeypatch.setattr(summarizer.requests, "post", fake_post)
+    cache = SummaryCache(str(tmp_path), ttl=3600)
+
+    summary, info = summarizer.summarize_meeting(TRANSCRIPT, SPEAKERS, meeting_type_id=0, cache=cache)
+    classify, main = requests_sent
+    assert summary == "สรุปการประชุม"
+    assert info['meeting_type_id'] == 3 and info['classification']['meeting_type_id'] == 3
+    assert classify["model"] == summarizer.CLASSIFY_MODEL
+    assert len(classify["messages"][1]["content"]) < len(TRANSCRIPT) // 10
+    system_prompt = main["messages"][0]["content"]
+    assert MEETING_TYPES[3]['name'] in system_prompt and "| ประเภท | โครงสร้าง |" not in system_prompt
+
+    # Cache hit: neither call is repeated and the detected type is remembered
+    summary, info = summarizer.summarize_meeting(TRANSCRIPT, SPEAKERS, meeting_type_id=0, cache=cache)
+    assert len(requests_sent) == 2 and info['cache_hit'] and info['meeting_type_id'] == 3
+
+    # A different classifier may pick a different type: not the same cache entry
+    monkeypatch.setattr(summarizer, "CLASSIFY_MODEL", "other-classifier")
+    summary, info = summarizer.summarize_meeting(TRANSCRIPT, SPEAKERS, meeting_type_id=0, cache=cache)
+    assert len(requests_sent) == 4 and not info['cache_hit']
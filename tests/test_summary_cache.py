@@ -0,0 +1,75 @@
+"""
+Tests for the on-disk summary cache (keying, TTL, force refresh)
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import summarizer
+from app.services.summary_cache import SummaryCache, summary_cache_key
+
+SPEAKERS = {'speaking_time': {"คนพูด 1": 60.0}, 'word_count': {"คนพูด 1": 120}}
+
+
+def test_key_covers_prompt_inputs():
+    key = summary_cache_key("[คนพูด 1]: สวัสดี  ครับ", "- คนพูด 1", 0, "v1", "gpt-4.1", 0.4)
+    assert key == summary_cache_key("[คนพูด 1]: สวัสดี ครับ\n", "- คนพูด 1", 0, "v1", "gpt-4.1", 0.4)
+    assert key != summary_cache_key("[คนพูด 1]: สวัสดี ครับ", "- คนพูด 1", 0, "v2", "gpt-4.1", 0.4)
+    assert key != summary_cache_key("[คนพูด 1]: สวัสดี ครับ", "- คนพูด 1", 3, "v1", "gpt-4.1", 0.4)
+    assert key != summary_cache_key("[คนพูด 1]: สวัสดี ครับ", "- คนพูด 1", 0, "v1", "gpt-4.1-mini", 0.4)
+    assert key != summary_cache_key("[คนพูด 1]: สวัสดี ครับ", "- คนพูด 1", 0, "v1", "gpt-4.1", 0.4,
+                                    classify_model="gpt-4.1-mini")
+
+
+def test_summarize_meeting_uses_cache(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_summarize(transcript, speaker_summary, speaker_info, meeting_type_id, language, model):
+        calls.append(model)
+        return "Error: gateway down" if model == "broken" else f"สรุป {len(calls)}"
+
+    monkeypatch.setattr(summarizer, "_summarize", fake_summarize)
+    monkeypatch.setattr(summarizer, "CLASSIFY_MODEL", "")  # Single-pass auto-detect
+    cache = SummaryCache(str(tmp_path), ttl=3600)
+
+    first, info = summarizer.summarize_meeting("[คนพูด 1]: สวัสดี", SPEAKERS, cache=cache)
+    assert first == "สรุป 1" and not info['cache_hit']
+    again, info = summarizer.summarize_meeting("[คนพูด 1]: สวัสดี", SPEAKERS, cache=cache)
+    assert again == "สรุป 1" and info['cache_hit']
+
+    refreshed, info = summarizer.summarize_meeting("[คนพูด 1]: สวัสดี", SPEAKERS, force_refresh=True, cache=cache)
+    assert refreshed == "สรุป 2" and not info['cache_hit']
+    assert summarizer.summarize_meeting("[คนพูด 1]: สวัสดี", SPEAKERS, cache=cache)[0] == "สรุป 2"
+
+    for _ in range(2):
+        summarizer.summarize_meeting("[คนพูด 1]: สวัสดี", SPEAKERS, model="broken", cache=cache)
+    assert calls.count("broken") == 2  # Errors are never cached
+
+
+def test_entries_expire(tmp_path):
+    cache = SummaryCache(str(tmp_path), ttl=60)
+    cache.set("ab" * 32, "สรุป")
+    assert cache.get("ab" * 32)["summary"] == "สรุป"
+
+    path = os.path.join(str(tmp_path), "ab", "ab" * 32 + ".json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"created_at": time.time() - 120, "summary": "สรุป"}, f)
+    assert cache.get("ab" * 32) is None
+    assert not os.path.exists(path)
+    assert SummaryCache(str(tmp_path), ttl=0).get("ab" * 32) is None
+
+
+def test_write_failures_and_disabled_prune_are_harmless(tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    broken = SummaryCache(str(blocker), ttl=60)  # makedirs under a file raises OSError
+    broken.set("ab" * 32, "สรุป")
+    assert broken.get("ab" * 32) is None and broken.snapshot()["writes"] == 0
+
+    shared = SummaryCache(str(tmp_path / "shared"), ttl=60)
+    shared.set("cd" * 32, "สรุป")
+    assert SummaryCache(shared.root, ttl=0).prune() == 0
+    assert shared.get("cd" * 32)["summary"] == "สรุป"
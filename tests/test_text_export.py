@@ -0,0 +1,36 @@
+"""
+Tests for streaming text exports (SRT / WebVTT / JSON Lines)
+"""
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.export import iter_srt, iter_vtt, iter_jsonl
+
+SEGMENTS = [
+    {"start": 0.0, "end": 1.5, "text": " สวัสดีครับ ", "speaker": "SPEAKER_00"},
+    {"start": 3661.25, "end": 3662.0, "text": "a < b --> c", "speaker": "สมชาย"},
+]
+
+
+def test_srt_cues():
+    srt = ''.join(iter_srt(SEGMENTS))
+    assert srt.startswith("1\n00:00:00,000 --> 00:00:01,500\n[คนพูด 1]: สวัสดีครับ\n\n")
+    assert "2\n01:01:01,250 --> 01:01:02,000\n" in srt
+
+
+def test_vtt_escapes_cue_text():
+    vtt = ''.join(iter_vtt(SEGMENTS))
+    assert vtt.startswith("WEBVTT\n\n")
+    assert "<v สมชาย>a &lt; b -> c\n" in vtt
+
+    renamed = [{"start": 0.0, "end": 1.0, "text": "ครับ", "speaker": "A&B <ฝ่ายขาย>\nทีม"}]
+    assert "<v A&amp;B &lt;ฝ่ายขาย&gt; ทีม>ครับ\n" in ''.join(iter_vtt(renamed))
+
+
+def test_jsonl_is_consumed_lazily():
+    records = iter_jsonl(iter(SEGMENTS))
+    first = json.loads(next(records))
+    assert first == {"start": 0.0, "end": 1.5, "speaker": "คนพูด 1", "text": "สวัสดีครับ"}
@@ -0,0 +1,29 @@
+"""
+Tests for Thai word segmentation / counting
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.thai_words import build_trie, count_words, segment
+
+
+def test_segments_thai_without_spaces():
+    assert segment("สวัสดีครับวันนี้เราจะประชุมเรื่องงบประมาณ") == [
+        "สวัสดี", "ครับ", "วันนี้", "เรา", "จะ", "ประชุม", "เรื่อง", "งบประมาณ",
+    ]
+
+
+def test_mixed_script_and_unknown_words():
+    trie = build_trie(["ขอ", "อนุมัติ", "งบ", "ครับ", "คุณ"])
+    # Unknown span (a name) stays one token; Latin words and numbers count once each
+    assert segment("คุณสมชายขออนุมัติงบ Budget 2025 ครับ", trie) == [
+        "คุณ", "สมชาย", "ขอ", "อนุมัติ", "งบ", "Budget", "2025", "ครับ",
+    ]
+    assert count_words("") == 0
+
+
+def test_marks_never_start_a_word():
+    trie = build_trie(["ก", "า", "กา"])
+    assert segment("กา", trie) == ["กา"]
@@ -0,0 +1,92 @@
+"""
+Tests for processing tiers (config resolution, per-tier pooled models)
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import PROCESSING_TIERS, PipelineConfig
+from app.services.batching import SAMPLE_RATE
+from app.services.model_pool import ModelPool
+from app.services.pipeline import TranscribeSummaryPipeline
+
+
+def test_tier_settings_and_explicit_overrides(monkeypatch):
+    draft = PipelineConfig(profile="cpu-int8", tier="draft")
+    assert draft.MODEL_NAME == "medium" and draft.BEAM_SIZE == 1 and not draft.DIARIZE
+    assert draft.describe()["tier"] == "draft"
+    assert PipelineConfig(profile="cpu-int8").TIER == "accurate"
+
+    monkeypatch.setenv("PIPELINE_BEAM_SIZE", "3")
+    config = PipelineConfig(profile="cpu-int8", tier="draft", summary_model="local")
+    standard = config.for_tier("standard")
+    assert standard.MODEL_NAME == PROCESSING_TIERS["standard"]["MODEL_NAME"]
+    assert standard.BEAM_SIZE == 3 and standard.SUMMARY_MODEL == "local"
+    assert config.TIER == "draft" and config.MODEL_NAME == "medium"
+
+    with pytest.raises(ValueError):
+        PipelineConfig(profile="cpu-int8", tier="fastest")
+
+
+def test_pool_keeps_a_model_per_tier():
+    pool = ModelPool(PipelineConfig(profile="cpu-int8", asr_backend="fake"), tiers=["draft", "accurate"])
+    assert pool.get_asr("draft") is not pool.get_asr("accurate")
+    assert pool.get_asr("draft").config.MODEL_NAME == "medium"
+    assert pool.describe()["asr_loaded"] and pool.describe()["asr_tiers"] == ["accurate", "draft"]
+
+    pipeline = TranscribeSummaryPipeline(model_pool=pool, tier="draft")
+    assert pipeline.config.TIER == "draft"
+    assert pipeline.transcribe_window(np.zeros(3 * SAMPLE_RATE, dtype=np.float32)) == "ทดสอบ 3.0 วินาที"
+    assert pool.describe()["microbatch"]["draft"]["jobs"] == 1
+
+
+def test_pool_preloads_own_tier_and_resummarize_keeps_tier_model(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import api
+    from app.services.store import MeetingStore
+
+    monkeypatch.delenv("PRELOAD_TIERS", raising=False)
+    assert ModelPool(PipelineConfig(profile="cpu-int8", tier="draft", asr_backend="fake")).tiers == ["draft"]
+
+    calls = []
+
+    def fake_summarize(transcript, speaker_summary, **kwargs):
+        calls.append(kwargs)
+        return "สรุปใหม่", {'cache_hit': False, 'meeting_type_id': 1, 'classification': None, 'time': 0.0}
+
+    monkeypatch.setattr(api, "summarize_meeting", fake_summarize)
+    monkeypatch.setattr(api, "_meeting_store", MeetingStore(str(tmp_path / "meetings.db")))
+    monkeypatch.setitem(api.result_sessions, "draft-session", {
+        'audio_file': "m.wav", 'audio_length_seconds': 1.0, 'meeting_type_id': 1,
+        'segments': [{'start': 0.0, 'end': 1.0, 'speaker': 'คนพูด 1', 'text': 'สวัสดี'}],
+        'transcript_with_speakers': "[คนพูด 1]: สวัสดี",
+        'speaker_summary': {'speaking_time': {'คนพูด 1': 1.0}}, 'summary': "สรุป",
+        'summary_model': PROCESSING_TIERS["draft"]["SUMMARY_MODEL"],
+    })
+    response = TestClient(api.app).post("/api/session/draft-session/speakers", json={
+        "speaker_mapping": {"คนพูด 1": "สมชาย"}, "resummarize": True,
+    })
+    assert response.status_code == 200
+    assert calls[0]["model"] == PROCESSING_TIERS["draft"]["SUMMARY_MODEL"]
+
+
+def test_warmup_skips_unused_models_and_degrades_on_optional_failures(monkeypatch):
+    def broken(*args, **kwargs):
+        raise RuntimeError("no pyannote token")
+
+    draft = ModelPool(PipelineConfig(profile="cpu-int8", tier="draft", asr_backend="fake"))
+    monkeypatch.setattr(draft, "get_diarize", broken)
+    monkeypatch.setattr(draft, "get_align", broken)
+    draft.warmup()
+    assert draft.status == "ready" and not draft.warnings
+
+    accurate = ModelPool(PipelineConfig(profile="cpu-int8", tier="accurate", asr_backend="fake"))
+    monkeypatch.setattr(accurate, "get_diarize", broken)
+    monkeypatch.setattr(accurate, "get_align", broken)
+    accurate.warmup()
+    assert accurate.status == "degraded" and accurate.is_ready
+    assert sorted(accurate.describe()["warnings"]) == ["alignment", "diarization"]